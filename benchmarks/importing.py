@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+#
+# How long `import mpan` takes in a fresh interpreter, with and without the
+# reference data in `mpan.data`, which is now only loaded on first use.  Run
+# it from the root of the repo:
+#
+#   $ python benchmarks/importing.py [runs]
+#
+
+import statistics
+import subprocess
+import sys
+
+from pathlib import Path
+
+
+ROOT = Path(__file__).parent.parent
+
+SCRIPTS = {
+    "import mpan": "import mpan",
+    "import mpan + is_valid()": (
+        "import mpan; mpan.is_valid('2499999999991')"
+    ),
+    "import mpan + mpan.data": "import mpan, mpan.data",
+}
+
+TIMER = (
+    "import time; started = time.perf_counter(); {}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure(script: str, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            (sys.executable, "-c", TIMER.format(script)),
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+    return statistics.median(timings) * 1000
+
+
+def main(runs: int = 20) -> None:
+    print(f"{'':<26} {'median (ms)':>12}")
+    for name, script in SCRIPTS.items():
+        print(f"{name:<26} {measure(script, runs):>12.1f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+#
+# What `mpan.instrumentation` costs when it's switched off (and on), compared
+# with calling the parts of `MPAN` it wraps directly.  Run it from the root of
+# the repo:
+#
+#   $ python benchmarks/instrumentation.py
+#
+
+import sys
+import timeit
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan import instrumentation  # NOQA: E402
+from mpan.exceptions import InvalidMPANError  # NOQA: E402
+from mpan.mpan import MPAN  # NOQA: E402
+from mpan.parser import LONG_OFFSET, SHORT_OFFSET, parse  # NOQA: E402
+from mpan.reason import Reason  # NOQA: E402
+
+
+SAMPLE = "069238I51470116845051"
+
+
+class Bare(MPAN):
+    """
+    `MPAN` as it would be without any hooks at all.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, raw_string: str) -> None:
+        self._offset = SHORT_OFFSET
+        self._profile_class = None
+        self._meter_time_switch_code = None
+        self._distributor = None
+        self._is_valid = None
+        self._key = None
+        self._raw = str(raw_string)
+        if parse(self._raw) == LONG_OFFSET:
+            self._parse_long()
+        else:
+            self._parse_short()
+
+    @property
+    def is_valid(self) -> bool:
+        if self._is_valid is None:
+            self._is_valid = self._diagnose() == Reason.VALID
+        return self._is_valid
+
+    def check(self) -> None:
+        if not self.is_valid:
+            raise InvalidMPANError(f"MPAN failed validity check: {self}")
+
+
+def bare() -> None:
+    Bare(SAMPLE).check()
+
+
+def hooked() -> None:
+    MPAN(SAMPLE).check()
+
+
+def measure(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    baseline = measure(bare, number)
+
+    instrumentation.disable()
+    disabled = measure(hooked, number)
+
+    instrumentation.enable()
+    enabled = measure(hooked, number)
+    instrumentation.disable()
+
+    print(f"{'':<22} {'ns':>6} {'overhead':>9}")
+    print(f"{'no hooks':<22} {baseline:>6.0f}")
+    for name, result in (("disabled", disabled), ("enabled", enabled)):
+        overhead = result / baseline - 1
+        print(f"{name:<22} {result:>6.0f} {overhead:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
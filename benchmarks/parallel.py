@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+#
+# Shows how `mpan.parallel.validate_many()` scales with the number of worker
+# processes.  Run it from the root of the repo:
+#
+#   $ python benchmarks/parallel.py [rows]
+#
+
+import os
+import sys
+import time
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan.generation.helpers import generate  # NOQA: E402
+from mpan.parallel import validate_many  # NOQA: E402
+
+
+def main(rows: int = 1_000_000) -> None:
+    values = [generate() for _ in range(rows)]
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+
+    print(f"{rows} rows on {cores} cores")
+    print(f"{'workers':>8} {'seconds':>8} {'rows/s':>10} speed-up")
+
+    baseline = None
+    for workers in counts:
+        started = time.perf_counter()
+        for _ in validate_many(values, workers=workers):
+            pass
+        elapsed = time.perf_counter() - started
+
+        baseline = baseline or elapsed
+        speed_up = baseline / elapsed
+        rate = rows / elapsed
+        print(f"{workers:>8} {elapsed:>8.2f} {rate:>10.0f} {speed_up:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
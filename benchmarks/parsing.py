@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+#
+# Compares `mpan.parser.parse()` against the two regular expressions that
+# `MPAN` used to try in turn.  Run it from the root of the repo:
+#
+#   $ python benchmarks/parsing.py
+#
+
+import sys
+import timeit
+
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan.exceptions import InvalidMPANError  # NOQA: E402
+from mpan.mpan import MPAN  # NOQA: E402
+from mpan.parser import parse  # NOQA: E402
+
+
+SAMPLES = {
+    "long": "069238I51470116845051",
+    "short": "2499999999991",
+    "wrong length": "Not an MPAN",
+    "bad short": "24999999X9991",
+    "bad long": "069238I514701168450X1",
+}
+
+
+def regular_expressions(raw: str) -> None:
+    if MPAN.RE_SHORT.match(raw):
+        return
+    if MPAN.RE_LONG.match(raw):
+        return
+    raise InvalidMPANError(f"{raw} doesn't look like an MPAN")
+
+
+def measure(function, raw: str, number: int) -> float:
+    def run():
+        try:
+            function(raw)
+        except InvalidMPANError:
+            pass
+
+    return min(timeit.repeat(run, number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 200_000) -> None:
+    print(
+        f"{'input':<13} {'regex (ns)':>12} {'parser (ns)':>12} {'speed-up':>9}"
+    )
+    for name, raw in SAMPLES.items():
+        before = measure(regular_expressions, raw, number)
+        after = measure(parse, raw, number)
+        speed_up = before / after
+        print(f"{name:<13} {before:>12.0f} {after:>12.0f} {speed_up:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+#
+# Compares `mpan.scan.scan()` with looping over a file and calling `MPAN()`
+# on each line.  Run it from the root of the repo:
+#
+#   $ python benchmarks/scanning.py [rows]
+#
+
+import sys
+import time
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan.exceptions import InvalidMPANError  # NOQA: E402
+from mpan.generation.numpy import iter_generate_many  # NOQA: E402
+from mpan.mpan import MPAN  # NOQA: E402
+from mpan.scan import scan  # NOQA: E402
+
+
+def naive(path: Path) -> int:
+    invalid = 0
+    with path.open() as f:
+        for line in f:
+            try:
+                invalid += not MPAN(line.rstrip("\n")).is_valid
+            except InvalidMPANError:
+                invalid += 1
+    return invalid
+
+
+def main(rows: int = 1_000_000) -> None:
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "mpans.txt"
+        with path.open("w") as f:
+            for chunk in iter_generate_many(rows, seed=1):
+                f.write("\n".join(chunk.tolist()) + "\n")
+
+        size = path.stat().st_size / 2**20
+        print(f"{rows} rows, {size:.1f}MB")
+
+        started = time.perf_counter()
+        naive(path)
+        before = time.perf_counter() - started
+        print(f"naive loop: {before:.2f}s ({rows / before:.0f} rows/s)")
+
+        started = time.perf_counter()
+        scan(path)
+        after = time.perf_counter() - started
+        print(f"scan():     {after:.2f}s ({rows / after:.0f} rows/s)")
+
+        print(f"speed-up:   {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
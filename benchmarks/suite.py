@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+#
+# Times the things an ingestion pipeline does most, over fixed datasets built
+# from a seed, so that results from one release can be compared with the
+# next.  Run it from the root of the repo:
+#
+#   $ python benchmarks/suite.py run [--sizes 1k 100k 1m] [--label 2.1.0]
+#   $ python benchmarks/suite.py compare results/2.0.0.json results/2.1.0.json
+#
+# Results are written to benchmarks/results/<label>.json, where the label
+# defaults to the installed version of mpan.
+#
+
+import json
+import platform
+import random
+import sys
+import time
+
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan.distributor import Distributor  # NOQA: E402
+from mpan.generation.helpers import generate  # NOQA: E402
+from mpan.helpers import is_valid  # NOQA: E402
+from mpan.meter_time_switch_code import MeterTimeSwitchCode  # NOQA: E402
+from mpan.mpan import MPAN  # NOQA: E402
+
+
+RESULTS = Path(__file__).parent / "results"
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+SEED = 0
+
+
+class Benchmark(NamedTuple):
+    # Turns the dataset into whatever `run` needs, outside of the timing
+    prepare: Callable[[Dict[str, List]], List]
+    run: Callable[[List], None]
+
+
+def construct(values: List[str]) -> None:
+    for value in values:
+        MPAN(value)
+
+
+def validate(mpans: List[MPAN]) -> None:
+    for mpan in mpans:
+        mpan.is_valid
+
+
+def validate_strings(values: List[str]) -> None:
+    for value in values:
+        is_valid(value)
+
+
+def get_gsp_group_ids(distributors: List[Distributor]) -> None:
+    for distributor in distributors:
+        distributor.gsp_group_ids
+
+
+def describe(codes: List[str]) -> None:
+    for code in codes:
+        MeterTimeSwitchCode(code).description
+
+
+def generate_all(values: List[str]) -> None:
+    for _ in values:
+        generate()
+
+
+BENCHMARKS = {
+    "MPAN() long": Benchmark(lambda data: data["long"], construct),
+    "MPAN() short": Benchmark(lambda data: data["short"], construct),
+    # `.is_valid` is remembered, so each repeat needs fresh objects
+    "MPAN.is_valid": Benchmark(
+        lambda data: [MPAN(value) for value in data["long"]], validate
+    ),
+    "helpers.is_valid() unparseable": Benchmark(
+        lambda data: data["unparseable"], validate_strings
+    ),
+    "Distributor.gsp_group_ids": Benchmark(
+        lambda data: [Distributor(d) for d in data["distributors"]],
+        get_gsp_group_ids,
+    ),
+    "MeterTimeSwitchCode.description": Benchmark(
+        lambda data: data["mtcs"], describe
+    ),
+    "generation.helpers.generate()": Benchmark(
+        lambda data: data["long"], generate_all
+    ),
+}
+
+
+def get_dataset(size: int, seed: int = SEED) -> Dict[str, List]:
+    """
+    Everything the benchmarks need, which is always the same for the same
+    size and seed.
+    """
+
+    random.seed(seed)
+
+    long = [generate() for _ in range(size)]
+
+    # Each of these has a letter dropped into its core somewhere, which
+    # `parse()` only finds once it's looked at most of the string.
+    unparseable = []
+    for value in long:
+        position = random.randrange(8, len(value))
+        unparseable.append(f"{value[:position]}X{value[position:][1:]}")
+
+    dataset = {
+        "long": long,
+        "short": [value[8:] for value in long],
+        "unparseable": unparseable,
+        "distributors": [value[8:10] for value in long],
+        "mtcs": [f"{random.randrange(1000):03}" for _ in range(size)],
+    }
+
+    # Leave the global generator as we found it, more or less
+    random.seed()
+
+    return dataset
+
+
+def measure(benchmark: Benchmark, dataset: Dict, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        prepared = benchmark.prepare(dataset)
+        started = time.perf_counter()
+        benchmark.run(prepared)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def get_version() -> str:
+    try:
+        return version("mpan")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def run(sizes: List[str], repeat: int, label: str) -> Path:
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    print(f"{'benchmark':<34} {'size':>5} {'total (s)':>10} {'ns/item':>9}")
+    for size in sizes:
+        n = SIZES[size]
+        dataset = get_dataset(n)
+        for name, benchmark in BENCHMARKS.items():
+            seconds = measure(benchmark, dataset, repeat)
+            per_item = seconds / n * 1e9
+            results.setdefault(name, {})[size] = {
+                "seconds": seconds,
+                "ns_per_item": per_item,
+            }
+            print(f"{name:<34} {size:>5} {seconds:>10.3f} {per_item:>9.0f}")
+
+    path = RESULTS / f"{label}.json"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                "label": label,
+                "version": get_version(),
+                "created": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "seed": SEED,
+                "repeat": repeat,
+                "results": results,
+            },
+            indent=2,
+        )
+        + "\n"
+    )
+    print(f"Saved to {path}")
+
+    return path
+
+
+def compare(before: Path, after: Path) -> None:
+    """
+    Print the change between two saved runs, for every benchmark and size
+    they have in common.  A ratio above 1 means `after` is slower.
+    """
+
+    old = json.loads(before.read_text())
+    new = json.loads(after.read_text())
+
+    print(
+        f"{'benchmark':<34} {'size':>5} {old['label']:>10} "
+        f"{new['label']:>10} {'ratio':>7}"
+    )
+    for name, sizes in new["results"].items():
+        for size, result in sizes.items():
+            try:
+                previous = old["results"][name][size]["ns_per_item"]
+            except KeyError:
+                continue
+            current = result["ns_per_item"]
+            print(
+                f"{name:<34} {size:>5} {previous:>10.0f} {current:>10.0f} "
+                f"{current / previous:>6.2f}x"
+            )
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Benchmark the mpan library.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    runner = subparsers.add_parser("run", help="Run and save the benchmarks.")
+    runner.add_argument(
+        "--sizes", nargs="+", choices=tuple(SIZES), default=list(SIZES)
+    )
+    runner.add_argument("--repeat", type=int, default=3)
+    runner.add_argument("--label", default=get_version())
+
+    comparer = subparsers.add_parser("compare", help="Compare two saved runs.")
+    comparer.add_argument("before", type=Path)
+    comparer.add_argument("after", type=Path)
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args.sizes, args.repeat, args.label)
+    else:
+        compare(args.before, args.after)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+import csv
+import json
+import sys
+import time
+
+from argparse import ArgumentParser, ArgumentTypeError
+from contextlib import ExitStack
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, TextIO
+
+from .exceptions import InvalidMPANError
+from .mpan import MPAN
+from .reason import Reason
+
+
+class Command:
+    """
+    A command line interface for the library, so that checking a file full of
+    MPANs doesn't require writing your own loop:
+
+        $ python -m mpan validate registrations.csv --column mpan
+
+    Input is read and written a chunk of rows at a time, so memory use stays
+    flat no matter how large the file is.
+    """
+
+    FIELDS = ("mpan", "valid", "reason", "distributor", "profile_class")
+
+    def __init__(self, argv: Optional[List[str]] = None) -> None:
+        self.parser = ArgumentParser(
+            prog="python -m mpan",
+            description="Tools for working with MPANs in bulk.",
+        )
+        subparsers = self.parser.add_subparsers(dest="command", required=True)
+
+        validate = subparsers.add_parser(
+            "validate",
+            help="Validate a column of MPANs from a CSV file.",
+            description=(
+                "Validate every MPAN in one column of a CSV file (or a plain "
+                "file with one MPAN per line), writing a result per row."
+            ),
+        )
+        validate.add_argument(
+            "source",
+            nargs="?",
+            default="-",
+            help="The file to read, or - for stdin (the default).",
+        )
+        validate.add_argument(
+            "--column",
+            default="0",
+            help=(
+                "The column holding the MPANs, either by name (as it appears "
+                "in the header) or by zero-based position.  Defaults to 0."
+            ),
+        )
+        validate.add_argument(
+            "--no-header",
+            dest="header",
+            action="store_false",
+            help="The first row is data rather than a header.",
+        )
+        validate.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            default="csv",
+            help="How to write the results.  Defaults to csv.",
+        )
+        validate.add_argument(
+            "--output",
+            default="-",
+            help="Where to write the results, or - for stdout (the default).",
+        )
+        validate.add_argument(
+            "--chunk-size",
+            type=self._ensure_is_positive,
+            default=10_000,
+            help="How many rows to process at a time.",
+        )
+
+        self.args = self.parser.parse_args(argv)
+
+    def __call__(self, *args, **kwargs) -> int:
+        with ExitStack() as stack:
+            source = self._open(stack, self.args.source, "r", sys.stdin)
+            output = self._open(stack, self.args.output, "w", sys.stdout)
+            return self.validate(source, output)
+
+    def validate(self, source: TextIO, output: TextIO) -> int:
+        reader = csv.reader(source)
+
+        try:
+            column = self._get_column(reader)
+        except ValueError as e:
+            self.parser.error(str(e))
+
+        write = self._get_writer(output)
+
+        rows = invalid = 0
+        started = time.perf_counter()
+
+        while chunk := list(islice(reader, self.args.chunk_size)):
+            for row in chunk:
+                result = self._check(row[column] if column < len(row) else "")
+                invalid += not result["valid"]
+                write(result)
+            output.flush()
+            rows += len(chunk)
+
+        elapsed = time.perf_counter() - started
+        rate = rows / elapsed if elapsed else 0
+        print(
+            f"Checked {rows} rows in {elapsed:.2f}s ({rate:.0f} rows/s): "
+            f"{rows - invalid} valid, {invalid} invalid",
+            file=sys.stderr,
+        )
+
+        return 0
+
+    def _get_column(self, reader: Iterator[List[str]]) -> int:
+        column = self.args.column
+        header = next(reader, []) if self.args.header else []
+
+        if column.isdigit():
+            return int(column)
+
+        try:
+            return header.index(column)
+        except ValueError:
+            raise ValueError(f"There's no column called {column!r}")
+
+    def _get_writer(self, output: TextIO):
+        if self.args.format == "jsonl":
+            return lambda result: output.write(json.dumps(result) + "\n")
+
+        writer = csv.DictWriter(output, self.FIELDS)
+        writer.writeheader()
+        return writer.writerow
+
+    @staticmethod
+    def _check(raw: str) -> Dict:
+        result = {
+            "mpan": raw,
+            "valid": False,
+            "reason": None,
+            "distributor": None,
+            "profile_class": None,
+        }
+
+        try:
+            mpan = MPAN(raw)
+        except InvalidMPANError:
+            result["reason"] = Reason.BAD_FORMAT.description
+            return result
+
+        result["distributor"] = mpan.distributor.identifier
+        if mpan.is_long:
+            result["profile_class"] = mpan.profile_class.identifier
+
+        reason = mpan.reason
+        if reason == Reason.VALID:
+            result["valid"] = True
+        else:
+            result["reason"] = reason.description
+
+        return result
+
+    @staticmethod
+    def _ensure_is_positive(value: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+
+        if number < 1:
+            raise ArgumentTypeError(f"{value} isn't a positive whole number.")
+
+        return number
+
+    @staticmethod
+    def _open(stack: ExitStack, path: str, mode: str, default: TextIO):
+        if path == "-":
+            return default
+        return stack.enter_context(open(path, mode, newline=""))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    return Command(argv)()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#
+# Validation for asyncio services, so that a burst of MPANs from a queue or
+# an async stream doesn't block the event loop:
+#
+#   from mpan.aio import validate_stream
+#
+#   async for raw, valid in validate_stream(consumer):
+#       ...
+#
+
+import asyncio
+
+from collections import deque
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .parallel import validate_chunk
+
+
+# Marks the end of the values coming from the producer
+_DONE = object()
+
+
+async def validate_stream(
+    values: Union[AsyncIterable, Iterable],
+    executor: Optional[Executor] = None,
+    batch_size: int = 1_000,
+    max_wait: float = 0.1,
+    max_in_flight: int = 4,
+    inline_below: int = 100,
+) -> AsyncIterator[Tuple[str, bool]]:
+    """
+    Validate values from an async (or plain) iterable, yielding a
+    `(value, valid)` pair for each of them, in order, with the same answers
+    as `mpan.helpers.is_valid()`.
+
+    Values are grouped into batches of up to `batch_size`, or whatever has
+    arrived within `max_wait` seconds of the first value in a batch, so a
+    slow trickle isn't held up waiting for a full batch.  Batches of at least
+    `inline_below` values are validated in `executor` (by default, the event
+    loop's default thread pool; pass a `ProcessPoolExecutor` to use more than
+    one core), and smaller ones right here, where that's quicker than handing
+    them off.
+
+    At most `max_in_flight` batches are being validated at once, and values
+    are only read ahead by one batch, so a slow consumer slows down reading
+    from `values` rather than letting things pile up in memory.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    pending: Deque[Tuple[List[str], "asyncio.Future[bytes]"]] = deque()
+    batches = _get_batches(values, batch_size, max_wait)
+    next_batch: Optional[asyncio.Future] = asyncio.ensure_future(
+        batches.__anext__()
+    )
+
+    try:
+        while next_batch or pending:
+            # Wait for whichever comes first out of the next batch of values
+            # and the results for the oldest batch, unless there's already
+            # enough in flight, in which case we just wait for the results.
+            waiting = set()
+            if next_batch and len(pending) < max_in_flight:
+                waiting.add(next_batch)
+            if pending:
+                waiting.add(pending[0][1])
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            while pending and pending[0][1].done():
+                batch, future = pending.popleft()
+                for raw, valid in zip(batch, future.result()):
+                    yield raw, bool(valid)
+
+            if next_batch and next_batch.done():
+                try:
+                    batch = next_batch.result()
+                except StopAsyncIteration:
+                    next_batch = None
+                    continue
+                next_batch = asyncio.ensure_future(batches.__anext__())
+
+                if len(batch) < inline_below:
+                    future = loop.create_future()
+                    future.set_result(validate_chunk(batch))
+                else:
+                    future = loop.run_in_executor(
+                        executor, validate_chunk, batch
+                    )
+                pending.append((batch, future))
+    finally:
+        # If we've been abandoned part way through, there's no point in
+        # finishing work nobody is going to look at.
+        for _, future in pending:
+            future.cancel()
+        if next_batch:
+            # The batch we're waiting for is still running inside `batches`,
+            # which can't be closed until it's finished being cancelled.
+            next_batch.cancel()
+            await asyncio.wait({next_batch})
+        await batches.aclose()
+
+
+async def _get_batches(
+    values: Union[AsyncIterable, Iterable], size: int, max_wait: float
+) -> AsyncIterator[List[str]]:
+    """
+    Group `values` into lists of strings, of up to `size` values or however
+    many arrive within `max_wait` seconds of the first, whichever comes
+    first.  Values are read by a separate task, so that we can stop waiting
+    for them without cancelling the iterator itself.
+    """
+
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=size)
+    producer = asyncio.ensure_future(_produce(values, queue))
+
+    try:
+        finished = False
+        while not finished:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            _raise_if_error(item)
+
+            batch = [str(item)]
+            deadline = loop.time() + max_wait
+            while len(batch) < size:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    # Only wait (which is much slower) when we have to
+                    try:
+                        item = await asyncio.wait_for(
+                            queue.get(), deadline - loop.time()
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                if item is _DONE:
+                    finished = True
+                    break
+                _raise_if_error(item)
+                batch.append(str(item))
+
+            yield batch
+    finally:
+        producer.cancel()
+
+
+class _Error:
+    def __init__(self, exception: BaseException) -> None:
+        self.exception = exception
+
+
+def _raise_if_error(item: Any) -> None:
+    if isinstance(item, _Error):
+        raise item.exception
+
+
+async def _produce(values: Union[AsyncIterable, Iterable], queue) -> None:
+    try:
+        if isinstance(values, AsyncIterable):
+            async for value in values:
+                await queue.put(value)
+        else:
+            for value in values:
+                await queue.put(value)
+    except Exception as e:
+        await queue.put(_Error(e))
+    else:
+        await queue.put(_DONE)
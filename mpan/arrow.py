@@ -0,0 +1,26 @@
+#
+# Decoding straight into Arrow, for writing parsed MPANs to Parquet and
+# friends.  This requires pyarrow, available via the optional extra `arrow`.
+#
+
+import pyarrow as pa
+
+from .bulk import FIELDS, Values, decode
+
+
+def decode_record_batch(values: Values) -> pa.RecordBatch:
+    """
+    The same as `mpan.bulk.decode()`, but as a `pyarrow.RecordBatch`, where
+    fields that aren't present are null rather than empty.
+    """
+
+    decoded = decode(values)
+
+    columns = [
+        pa.array(decoded[name], type=pa.string(), mask=decoded[name] == "")
+        for name in FIELDS
+    ]
+    columns.append(pa.array(decoded["is_long"]))
+    columns.append(pa.array(decoded["is_valid"]))
+
+    return pa.RecordBatch.from_arrays(columns, names=list(decoded.dtype.names))
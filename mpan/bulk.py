@@ -0,0 +1,597 @@
+#
+# Whole-array versions of the checks in `mpan.mpan`, for when you have far
+# too many MPANs to build an object for each of them.  Everything here
+# requires NumPy, available via the optional extra `numpy`.
+#
+
+from datetime import date
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .checksum import calculate_many
+from .distributor import Distributor
+from .exceptions import InvalidMPANError
+from .helpers import diagnose as _diagnose, is_valid as _is_valid
+from .line_loss_factor_class import get_classes
+from .meter_time_switch_code import MeterTimeSwitchCode
+from .mpan import MPAN
+from .parser import (
+    LONG_LENGTH,
+    LONG_OFFSET as CORE_OFFSET,
+    SHORT_LENGTH,
+    parse,
+)
+from .profile_class import ProfileClass
+from .reason import Reason
+
+
+Values = Union[np.ndarray, Iterable]
+
+# Where each field lives in a row of `Batch.codes`
+FIELDS = {
+    "top_line": (0, CORE_OFFSET),
+    "profile_class": (0, 2),
+    "mtc": (2, 5),
+    "llfc": (5, CORE_OFFSET),
+    "core": (CORE_OFFSET, LONG_LENGTH),
+    "distributor": (CORE_OFFSET, CORE_OFFSET + 2),
+    "identifier": (CORE_OFFSET + 2, CORE_OFFSET + 10),
+    "checksum": (LONG_LENGTH - 1, LONG_LENGTH),
+}
+
+DECODED = np.dtype(
+    [(name, f"U{stop - start}") for name, (start, stop) in FIELDS.items()]
+    + [("is_long", bool), ("is_valid", bool)]
+)
+
+# What `describe_mtcs()` gives for each code, with a `register_count` of -1
+# and `None` for the rest where there's nothing in the MTC extract.
+MTC_DESCRIBED = np.dtype(
+    [
+        ("is_valid", bool),
+        ("description", object),
+        ("register_count", np.int16),
+        ("settlement_type", object),
+    ]
+)
+
+# What `pack_many()` gives for each MPAN, which is the same as `MPAN.pack()`
+# when viewed as bytes: the core and then the top line, as in `MPAN.key`.
+PACKED_DTYPE = np.dtype([("core", ">u8"), ("top_line", ">u8")])
+
+# The character for each base 36 digit
+_BASE_36_CODES = np.frombuffer(
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", np.uint8
+)
+
+# Rather than re-implementing the rules for each subsection, we ask the
+# scalar classes about every possible value once, and look the answers up.
+_PROFILE_CLASS_VALID = np.array(
+    [ProfileClass(f"{i:02}").is_valid for i in range(100)]
+)
+_MTC_VALID = np.array(
+    [MeterTimeSwitchCode(f"{i:03}").is_valid for i in range(1000)]
+)
+_DISTRIBUTOR_VALID = np.array(
+    [Distributor(f"{i:02}").is_valid for i in range(100)]
+)
+
+
+class Batch:
+    """
+    A batch of raw values, decoded into a matrix of character codes with one
+    row per value.  Short MPANs are aligned with the core of long ones, so
+    every row has the same layout as a long MPAN.
+    """
+
+    def __init__(self, values: Values) -> None:
+        strings = _as_strings(values)
+        self._decode(strings, *_as_codes(strings))
+
+    @classmethod
+    def from_codes(
+        cls, codes: np.ndarray, lengths: np.ndarray, strings: Sequence
+    ) -> "Batch":
+        """
+        Build a batch from a matrix of bytes that's already been assembled,
+        at least `LONG_LENGTH + 1` columns wide and padded with zeros, along
+        with the length of each row.  Rows with anything outside ASCII are
+        looked up in `strings` and left to `MPAN`.
+        """
+        batch = cls.__new__(cls)
+        batch._decode(strings, codes, lengths, (codes > 127).any(axis=1))
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _decode(
+        self,
+        strings: Sequence,
+        codes: np.ndarray,
+        lengths: np.ndarray,
+        fallback: np.ndarray,
+    ) -> None:
+        self.strings = strings
+        self.fallback = fallback
+
+        # The regular expressions in `MPAN` use `$`, which happily matches
+        # just before a trailing newline, so we have to as well.
+        last = np.maximum(lengths - 1, 0)
+        self.has_newline = (lengths > 0) & (
+            codes[np.arange(len(codes)), last] == 10
+        )
+        lengths = lengths - self.has_newline
+
+        self.is_long = lengths == LONG_LENGTH
+        self.is_short = lengths == SHORT_LENGTH
+
+        # Short MPANs are shifted right so that the core always lives in the
+        # same columns, regardless of whether there was a top line.
+        self.codes = np.where(
+            self.is_short[:, None],
+            np.pad(codes[:, :SHORT_LENGTH], ((0, 0), (CORE_OFFSET, 0))),
+            codes[:, :LONG_LENGTH],
+        )
+
+        self.digits = self.codes.astype(np.int16) - ord("0")
+        is_digit = (self.digits >= 0) & (self.digits <= 9)
+        is_upper = (self.codes >= ord("A")) & (self.codes <= ord("Z"))
+
+        core_ok = is_digit[:, CORE_OFFSET:].all(axis=1)
+        top_ok = is_digit[:, :5].all(axis=1) & (
+            is_digit[:, 5:CORE_OFFSET] | is_upper[:, 5:CORE_OFFSET]
+        ).all(axis=1)
+
+        # Rows we couldn't decode are parsed the slow way instead
+        self.is_parseable = (
+            (self.is_short | (self.is_long & top_ok))
+            & core_ok
+            & ~self.fallback
+        )
+        for i in np.flatnonzero(self.fallback):
+            try:
+                parse(str(self.strings[i]))
+            except InvalidMPANError:
+                continue
+            self.is_parseable[i] = True
+
+    def field(self, start: int, stop: int) -> np.ndarray:
+        """
+        Columns `start` to `stop` of every row as an array of strings.  These
+        are empty wherever there's no such field: for rows that don't parse,
+        and in the top line of short MPANs.
+        """
+
+        present = self.is_parseable & (self.is_long | (start >= CORE_OFFSET))
+
+        width = stop - start
+        codes = self.codes[:, start:stop] * (present & ~self.fallback)[:, None]
+        result = (
+            np.ascontiguousarray(codes)
+            .view(f"S{width}")
+            .ravel()
+            .astype(f"U{width}")
+        )
+
+        for i in np.flatnonzero(present & self.fallback):
+            shift = 0 if self.is_long[i] else CORE_OFFSET
+            first, last = start - shift, stop - shift
+            result[i] = self.strings[i][first:last]
+
+        return result
+
+    def number(self, start: int, stop: int) -> np.ndarray:
+        """
+        The digits in columns `start` to `stop` as a single integer per row.
+        Only meaningful where those columns are all digits.
+        """
+        result = np.zeros(len(self), dtype=np.int64)
+        for column in range(start, stop):
+            result = result * 10 + self.digits[:, column]
+        return result
+
+    def base_36(self, start: int, stop: int) -> np.ndarray:
+        """
+        The characters in columns `start` to `stop` as a single base 36
+        integer per row, as for line loss factor classes in `MPAN.key`.
+        Only meaningful where those columns are all digits or capitals.
+        """
+
+        codes = self.codes[:, start:stop].astype(np.int64)
+        digits = np.where(codes >= ord("A"), codes - ord("A") + 10, codes - 48)
+
+        result = np.zeros(len(self), dtype=np.int64)
+        for column in range(stop - start):
+            result = result * 36 + np.clip(digits[:, column], 0, 35)
+        return result
+
+    @property
+    def is_valid(self) -> np.ndarray:
+        checks = self._check()
+
+        result = (
+            self.is_parseable
+            & (self.is_short | (checks["profile_class"] & checks["mtc"]))
+            & checks["distributor"]
+            & checks["checksum"]
+        )
+
+        for i in np.flatnonzero(self.fallback):
+            result[i] = _is_valid(self.strings[i])
+
+        return result
+
+    @property
+    def reasons(self) -> np.ndarray:
+        """
+        A `Reason` for every row, as a `uint8` array.
+        """
+
+        checks = self._check()
+
+        # The first of these that's true for a row is its reason
+        conditions = (
+            ~self.is_parseable,
+            self.is_long & ~checks["profile_class"],
+            self.is_long & ~checks["mtc"],
+            ~checks["distributor"],
+            ~checks["checksum"],
+        )
+        choices = (
+            Reason.BAD_FORMAT,
+            Reason.INVALID_PROFILE_CLASS,
+            Reason.INVALID_MTC,
+            Reason.UNKNOWN_DISTRIBUTOR,
+            Reason.CHECKSUM_MISMATCH,
+        )
+        result = np.select(conditions, choices, Reason.VALID).astype(np.uint8)
+
+        for i in np.flatnonzero(self.fallback):
+            result[i] = _diagnose(self.strings[i])
+
+        return result
+
+    def _check(self) -> Dict[str, np.ndarray]:
+        """
+        The result of each of the checks in `MPAN.is_valid`, for every row.
+        These are meaningless for rows that don't parse or that need the
+        fallback, and the top line checks for short rows.
+        """
+
+        # Any rows that don't parse are masked out by the caller, so it's
+        # safe to clamp their junk values into the lookup tables' ranges.
+        core = np.clip(self.digits[:, CORE_OFFSET:], 0, 9)
+        distributor = self.number(CORE_OFFSET, CORE_OFFSET + 2)
+        profile_class = self.number(0, 2)
+        mtc = self.number(2, 5)
+
+        return {
+            "profile_class": _PROFILE_CLASS_VALID[
+                np.clip(profile_class, 0, 99)
+            ],
+            "mtc": _MTC_VALID[np.clip(mtc, 0, 999)],
+            "distributor": _DISTRIBUTOR_VALID[np.clip(distributor, 0, 99)],
+            "checksum": calculate_many(core) == core[:, -1],
+        }
+
+
+def is_valid(values: Values, chunksize: int = 1_000_000) -> np.ndarray:
+    """
+    The vectorised equivalent of `mpan.helpers.is_valid()`: a boolean array
+    with one entry per value, `True` wherever `MPAN(value).is_valid` would be.
+    Byte strings are treated as ASCII.
+
+    Values are checked `chunksize` at a time to cap the size of the
+    intermediate arrays.
+    """
+
+    strings = _as_strings(values)
+
+    result = np.zeros(len(strings), dtype=bool)
+    for start in range(0, len(strings), chunksize):
+        stop = start + chunksize
+        result[start:stop] = Batch(strings[start:stop]).is_valid
+
+    return result
+
+
+def diagnose_many(values: Values, chunksize: int = 1_000_000) -> np.ndarray:
+    """
+    Why each value isn't a valid MPAN, as a `uint8` array of `Reason`s with
+    one entry per value, the same as `mpan.helpers.diagnose()` would give.
+    Nothing is raised, however malformed the values are.
+    """
+
+    strings = _as_strings(values)
+
+    result = np.zeros(len(strings), dtype=np.uint8)
+    for start in range(0, len(strings), chunksize):
+        stop = start + chunksize
+        result[start:stop] = Batch(strings[start:stop]).reasons
+
+    return result
+
+
+def decode(values: Values) -> np.ndarray:
+    """
+    Break every value down into its fields in one go, returning a structured
+    array with the dtype `DECODED`: a fixed-width string column for each of
+    `FIELDS`, plus `is_long` and `is_valid`.
+
+    Fields that aren't present, either because the value isn't an MPAN at all
+    or because it's a short one with no top line, are empty strings.
+    """
+
+    batch = Batch(values)
+
+    result = np.empty(len(batch), dtype=DECODED)
+    for name, (start, stop) in FIELDS.items():
+        result[name] = batch.field(start, stop)
+    result["is_long"] = batch.is_long & batch.is_parseable
+    result["is_valid"] = batch.is_valid
+
+    return result
+
+
+def describe_mtcs(codes: Values, as_of: Optional[date] = None) -> np.ndarray:
+    """
+    What `MeterTimeSwitchCode` knows about each of `codes` on `as_of` (which
+    defaults to today), as a structured array with the dtype `MTC_DESCRIBED`.
+    Codes can be integers or strings, and anything that isn't a code at all
+    is just invalid, with no description.
+    """
+
+    if not isinstance(codes, np.ndarray):
+        codes = list(codes)
+    array = np.asarray(codes).ravel()
+
+    if array.dtype.kind in "iu":
+        numbers = array.astype(np.int64)
+    else:
+        # There are only so many distinct codes, so we work each of them out
+        # once rather than once per row.
+        strings, inverse = np.unique(_as_strings(array), return_inverse=True)
+        numbers = np.array(
+            [_get_mtc_number(string) for string in strings.tolist()],
+            dtype=np.int64,
+        )[inverse.ravel()]
+
+    table = _get_mtc_table(as_of or date.today())
+
+    # The last row of the table is for anything out of range
+    numbers[(numbers < 0) | (numbers > 999)] = 1000
+    return table[numbers]
+
+
+def pack_many(values: Values) -> np.ndarray:
+    """
+    `MPAN.pack()` for every value, as a structured array with the dtype
+    `PACKED_DTYPE`, whose `.tobytes()` is the packed MPANs one after the
+    other.  Raises a `ValueError` if any of them isn't an MPAN in its
+    canonical form.
+    """
+
+    strings = _as_strings(values)
+    batch = Batch(strings)
+
+    canonical = batch.is_parseable & ~batch.fallback & ~batch.has_newline
+    bad = np.flatnonzero(~canonical)
+    if len(bad):
+        raise ValueError(
+            f"{str(strings[bad[0]])!r} isn't an MPAN in its canonical form"
+        )
+
+    profile_class = batch.number(*FIELDS["profile_class"])
+    mtc = batch.number(*FIELDS["mtc"])
+    llfc = batch.base_36(*FIELDS["llfc"])
+    top_line = (profile_class * 1000 + mtc) * 36**3 + llfc + 1
+
+    result = np.empty(len(batch), dtype=PACKED_DTYPE)
+    result["core"] = batch.number(*FIELDS["core"])
+    result["top_line"] = np.where(batch.is_long, top_line, 0)
+
+    return result
+
+
+def unpack_many(packed: Union[np.ndarray, bytes]) -> np.ndarray:
+    """
+    The MPANs that `pack_many()` gave `packed`, which can also be the bytes
+    of lots of `MPAN.pack()`s one after the other, as an array of strings.
+    Raises a `ValueError` for anything `pack_many()` couldn't have given.
+    """
+
+    if not isinstance(packed, np.ndarray):
+        packed = np.frombuffer(packed, dtype=PACKED_DTYPE)
+
+    bad = np.flatnonzero(
+        (packed["core"] >= 10**13) | (packed["top_line"] > MPAN.MAX_TOP_LINE)
+    )
+    if len(bad):
+        raise ValueError(f"{packed[bad[0]].tobytes()!r} isn't a packed MPAN")
+
+    core = packed["core"].astype(np.int64)
+    top_line = packed["top_line"].astype(np.int64)
+    is_long = top_line > 0
+
+    codes = np.zeros((len(packed), LONG_LENGTH), dtype=np.uint8)
+    for column in reversed(range(*FIELDS["core"])):
+        core, codes[:, column] = np.divmod(core, 10)
+
+    # The profile class and meter time switch code are one decimal number,
+    # and the line loss factor class a base 36 one.
+    rest, llfc = np.divmod(np.maximum(top_line - 1, 0), 36**3)
+    for column in reversed(range(*FIELDS["llfc"])):
+        llfc, codes[:, column] = np.divmod(llfc, 36)
+    for column in reversed(range(FIELDS["mtc"][1])):
+        rest, codes[:, column] = np.divmod(rest, 10)
+
+    codes = _BASE_36_CODES[codes]
+
+    # Short MPANs are just the core, moved to the start
+    codes[~is_long, :SHORT_LENGTH] = codes[~is_long, CORE_OFFSET:]
+    codes[~is_long, SHORT_LENGTH:] = 0
+
+    return codes.view(f"S{LONG_LENGTH}").ravel().astype(f"U{LONG_LENGTH}")
+
+
+def is_llfc_valid(values: Values, as_of: Optional[date] = None) -> np.ndarray:
+    """
+    Whether the line loss factor class of each value was valid for its
+    distributor on `as_of` (which defaults to today), the same as
+    `LineLossFactorClass.is_valid_for()`, as a boolean array.  Short MPANs
+    don't have one, so they're always `True`, and anything that isn't an
+    MPAN at all is always `False`.
+    """
+
+    batch = Batch(values)
+
+    llfc = batch.base_36(*FIELDS["llfc"])
+    distributor = np.clip(batch.number(CORE_OFFSET, CORE_OFFSET + 2), 0, 99)
+
+    table = _get_llfc_table(as_of or date.today())
+    result = batch.is_parseable & (batch.is_short | table[distributor, llfc])
+
+    for i in np.flatnonzero(batch.fallback & batch.is_parseable):
+        mpan = MPAN(batch.strings[i])
+        if mpan.is_long:
+            result[i] = mpan.line_loss_factor_class_info.is_valid_for(
+                mpan.distributor, as_of
+            )
+
+    return result
+
+
+@lru_cache(maxsize=4)
+def _get_llfc_table(as_of: date) -> np.ndarray:
+    """
+    Whether each class (as a base 36 number) was valid for each distributor
+    (as a number) on `as_of`, as a 100 by 46,656 boolean matrix.
+    """
+
+    # Distributors the extract says nothing about get the benefit of the
+    # doubt, as with `LineLossFactorClass.is_valid_for()`.
+    classes = get_classes(as_of)
+    table = np.ones((100, 36**3), dtype=bool)
+
+    for distributor, llfcs in classes.items():
+        row = table[int(distributor)]
+        row[:] = False
+        row[[int(llfc, 36) for llfc in llfcs]] = True
+
+    return table
+
+
+def _get_mtc_number(string: str) -> int:
+    try:
+        return int(string)
+    except ValueError:
+        return -1
+
+
+@lru_cache(maxsize=16)
+def _get_mtc_table(as_of: date) -> np.ndarray:
+    """
+    `describe_mtcs()` for every code from 0 to 999 on `as_of`, followed by a
+    row for anything else.
+    """
+
+    table = np.zeros(1001, dtype=MTC_DESCRIBED)
+    table["description"] = None
+    table["register_count"] = -1
+    table["settlement_type"] = None
+
+    for value in range(1000):
+        code = MeterTimeSwitchCode(f"{value:03}")
+        record = code.get_record(as_of)
+        table[value]["is_valid"] = code.is_valid
+        table[value]["description"] = code.get_description(as_of)
+        if record is not None:
+            table[value]["register_count"] = record.register_count
+            table[value]["settlement_type"] = record.settlement_type
+
+    return table
+
+
+def _as_strings(values: Values) -> np.ndarray:
+    """
+    Coerce whatever we've been given into a flat array of `str` or `bytes`,
+    casting anything else to `str` as `MPAN` does.
+
+    NumPy quietly drops trailing NULs from strings, which could turn
+    something that isn't an MPAN into one that is.  If it's done that to any
+    of the values, they're all kept as they were in an object array instead,
+    for `_as_codes()` to hand the ones it changed to `MPAN`.
+    """
+
+    if not isinstance(values, np.ndarray):
+        values = list(values)
+
+    array = np.asarray(values).ravel()
+
+    if array.dtype.kind not in "SU":
+        values = [
+            value if isinstance(value, (str, bytes)) else str(value)
+            for value in array.tolist()
+        ]
+        array = np.array(values) if values else np.array([], dtype=str)
+
+    if isinstance(values, list) and len(values) == len(array):
+        if (np.char.str_len(array) != _get_lengths(values)).any():
+            return np.array(values, dtype=object)
+
+    return array
+
+
+def _get_lengths(values: Sequence) -> np.ndarray:
+    try:
+        return np.fromiter(map(len, values), np.int64, len(values))
+    except TypeError:
+        # NumPy casts anything that isn't a string to one, as `MPAN` does
+        return np.array(
+            [
+                len(value if isinstance(value, (str, bytes)) else str(value))
+                for value in values
+            ],
+            dtype=np.int64,
+        )
+
+
+def _as_codes(
+    strings: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    View an array of strings as a matrix of ASCII codes, padded so that
+    there's always room for a long MPAN and a trailing newline.
+
+    `\\d` matches any Unicode decimal digit, which we can't sensibly do here,
+    so anything outside ASCII is flattened to 255 and its row flagged for
+    `MPAN` to deal with instead.
+    """
+
+    # These are what `_as_strings()` gives back when NumPy would lose some
+    # trailing NULs, and it's the rows that lose them that need flagging.
+    if strings.dtype.kind == "O":
+        converted = np.array(strings.tolist())
+        codes, lengths, fallback = _as_codes(converted)
+        return codes, lengths, fallback | (lengths != _get_lengths(strings))
+
+    n = len(strings)
+    contiguous = np.ascontiguousarray(strings)
+
+    if strings.dtype.kind == "U":
+        size = strings.dtype.itemsize // 4
+        wide = contiguous.view(np.uint32).reshape(n, size)
+        fallback = (wide > 127).any(axis=1)
+        narrow = np.minimum(wide, 255).astype(np.uint8)
+    else:
+        size = strings.dtype.itemsize
+        narrow = contiguous.view(np.uint8).reshape(n, size)
+        fallback = np.zeros(n, dtype=bool)
+
+    codes = np.zeros((n, max(size, LONG_LENGTH + 1)), dtype=np.uint8)
+    codes[:, :size] = narrow
+
+    return codes, np.char.str_len(strings).astype(np.int64), fallback
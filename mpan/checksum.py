@@ -0,0 +1,104 @@
+#
+# The check digit at the end of an MPAN's core.  Each of the first 12 digits
+# is multiplied by the prime for its position, and the check digit is the
+# sum, modulo 11, modulo 10.
+#
+# Since there are only ten possible digits in each of twelve positions, we
+# work out `prime * digit % 11` for all of them up front and just look them
+# up.  The sum of those still gives the same answer modulo 11.
+#
+
+from typing import TYPE_CHECKING, Union
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+
+# 11 is deliberately missing as-per the rules for the validation algorithm.
+PRIMES = (3, 5, 7, 13, 17, 19, 23, 29, 31, 37, 41, 43)
+
+# TABLE[position][digit]
+TABLE = tuple(
+    tuple(prime * digit % 11 for digit in range(10)) for prime in PRIMES
+)
+
+# The same, but indexed by ASCII code, for when we're working with bytes
+_BY_CODE = tuple(bytes(48) + bytes(row) + bytes(198) for row in TABLE)
+
+# ...and by powers of ten, for when we're working with an integer
+_POWERS = tuple(10**power for power in range(len(PRIMES) - 1, -1, -1))
+
+
+def calculate(digits: Union[str, bytes]) -> int:
+    """
+    The check digit for the first 12 digits of a core, which can be either a
+    string or ASCII bytes.
+    """
+
+    if isinstance(digits, str):
+        if not digits.isascii():
+            # Any Unicode decimal digit will do, as with the rest of MPAN
+            pairs = zip(TABLE, digits[:12])
+            return sum(row[int(digit)] for row, digit in pairs) % 11 % 10
+        digits = digits.encode()
+
+    digits = digits[:12]
+    if len(digits) != 12 or not digits.isdigit():
+        raise ValueError(f"{digits!r} isn't 12 digits")
+
+    return sum(map(bytes.__getitem__, _BY_CODE, digits)) % 11 % 10
+
+
+def verify(core: Union[str, bytes]) -> bool:
+    """
+    Whether the 13th digit of `core` is the right check digit for the rest,
+    which it can't be if there isn't one.
+    """
+
+    if len(core) < 13:
+        return False
+    if isinstance(core, bytes):
+        return calculate(core) == core[12] - 48
+    return calculate(core) == int(core[12])
+
+
+def calculate_int(digits: int) -> int:
+    """
+    The check digit for the first 12 digits of a core, held as an integer.
+    Leading zeros are implied, so 123 means 000000000123.
+    """
+
+    if not 0 <= digits < 10**12:
+        raise ValueError(f"{digits} isn't 12 digits")
+
+    return (
+        sum(row[digits // power % 10] for row, power in zip(TABLE, _POWERS))
+        % 11
+        % 10
+    )
+
+
+def verify_int(core: int) -> bool:
+    """
+    `verify()` for a whole 13-digit core held as an integer.
+    """
+
+    if not 0 <= core < 10**13:
+        return False
+    return calculate_int(core // 10) == core % 10
+
+
+def calculate_many(digits: "np.ndarray") -> "np.ndarray":
+    """
+    Check digits for a whole batch at once, from a NumPy matrix of digit
+    values (not ASCII codes) with a row per core and at least 12 columns.
+    This requires NumPy, available via the optional extra `numpy`.
+    """
+
+    import numpy as np
+
+    table = np.array(TABLE, dtype=np.int32)
+    positions = np.arange(len(PRIMES))
+
+    return table[positions, digits[:, : len(PRIMES)]].sum(axis=1) % 11 % 10
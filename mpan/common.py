@@ -1,11 +1,45 @@
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Sequence
+
+
 class Subsection:
     """
     A string-like object that includes additional information we know based on
     the identifier.
+
+    Instances are immutable and interned, so `Distributor("12")` always gives
+    you the same object, and anything that depends only on the identifier is
+    worked out once, in `_precompute()`.
     """
 
-    def __init__(self, identifier: str) -> None:
-        self.identifier = identifier
+    __slots__ = ("identifier",)
+
+    # There are only so many identifiers that can come out of a valid MPAN,
+    # but nothing stops people making up their own, so we stop interning new
+    # ones past this point.
+    INTERN_LIMIT = 4096
+
+    _instances: Dict[Any, "Subsection"] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._instances = {}
+
+    def __new__(cls, identifier: str) -> "Subsection":
+        try:
+            return cls._instances[identifier]
+        except KeyError:
+            pass
+
+        instance = super().__new__(cls)
+        instance._set("identifier", identifier)
+        instance._precompute()
+
+        if len(cls._instances) < cls.INTERN_LIMIT:
+            instance = cls._instances.setdefault(identifier, instance)
+
+        return instance
 
     def __str__(self) -> str:
         return self.identifier
@@ -16,6 +50,53 @@ class Subsection:
     def __bool__(self) -> bool:
         return self.is_valid
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self):
+        return self.__class__, (self.identifier,)
+
     @property
     def is_valid(self) -> bool:
         raise NotImplementedError()
+
+    def _precompute(self) -> None:
+        """
+        Work out anything that depends only on the identifier and store it
+        with `_set()`.
+        """
+
+    def _set(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+
+
+def get_effective(
+    starts: Sequence[int], records: Sequence[Any], as_of: Optional[date]
+) -> Any:
+    """
+    The record in effect on `as_of` (which defaults to today) out of
+    `records`, which have `effective_from` and `effective_to` dates and don't
+    overlap, given the ordinals of their `effective_from` dates in order.
+    Both ends count as being in effect.
+    """
+
+    if not records:
+        return None
+
+    if as_of is None:
+        as_of = date.today()
+    elif isinstance(as_of, datetime):
+        as_of = as_of.date()
+
+    position = bisect_right(starts, as_of.toordinal()) - 1
+    if position < 0:
+        return None
+
+    record = records[position]
+    if record.effective_to is not None and record.effective_to < as_of:
+        return None
+
+    return record
@@ -0,0 +1,120 @@
+#
+# Suggestions for what a mistyped MPAN should have been.  Rather than trying
+# every possible edit and validating each one, we use the structure of the
+# checksum to work out which edits would pass it:
+#
+#   * The check digit itself can only be one thing.
+#   * Changing the digit at one position changes the sum by a known amount
+#     modulo 11, and since none of the primes are 11, there's at most one
+#     digit per target that gets the sum back to what the check digit says.
+#   * Swapping two neighbouring digits changes the sum by an amount we can
+#     work out from the table without touching the rest of the core.
+#
+# So every suggestion costs a handful of additions, whatever the input.
+#
+
+from typing import Iterable, Iterator, List
+
+from .checksum import TABLE
+from .distributor import Distributor
+from .exceptions import InvalidMPANError
+from .mpan import MPAN
+from .reason import Reason
+
+
+# _SOLVE[position][remainder] is the digit that contributes `remainder` to the
+# sum at `position`, if there is one.
+_SOLVE = tuple(
+    {remainder: digit for digit, remainder in enumerate(row)} for row in TABLE
+)
+
+# The sums, modulo 11, that give each check digit.  Since the check digit is
+# the sum modulo 11 *then* modulo 10, both 0 and 10 give a check digit of 0.
+_TARGETS = ((0, 10),) + tuple((digit,) for digit in range(1, 10))
+
+
+def suggest_corrections(raw_string: str) -> List[str]:
+    """
+    The valid MPANs that `raw_string` would be with one digit of its core
+    changed, two neighbouring digits of its core swapped, or a different
+    check digit, in order.  Long MPANs keep their top line, so if that's
+    invalid, or `raw_string` can't be parsed at all, there aren't any.
+    """
+
+    try:
+        mpan = MPAN(raw_string)
+    except InvalidMPANError:
+        return []
+
+    if mpan.reason in (Reason.INVALID_PROFILE_CLASS, Reason.INVALID_MTC):
+        return []
+
+    top_line = mpan.top_line or ""
+
+    # In case any of them are non-ASCII digits
+    core = "".join(str(int(digit)) for digit in mpan.core)
+
+    return [
+        f"{top_line}{candidate}"
+        for candidate in sorted(set(_get_cores(core)))
+        if Distributor(candidate[:2]).is_valid
+    ]
+
+
+def suggest_corrections_many(values: Iterable) -> Iterator[List[str]]:
+    """
+    `suggest_corrections()` for each of `values`, in order, such as the lines
+    of a file of rejected MPANs.  Values that turn up more than once are only
+    worked out once.
+    """
+
+    seen = {}
+    for value in values:
+        raw = str(value)
+        if raw not in seen:
+            seen[raw] = suggest_corrections(raw)
+        yield list(seen[raw])
+
+
+def _get_cores(core: str) -> Iterator[str]:
+    """
+    Every core one edit away from `core` (13 ASCII digits) that passes the
+    checksum.
+    """
+
+    digits = [int(digit) for digit in core]
+    check = digits[12]
+    total = sum(row[digit] for row, digit in zip(TABLE, digits))
+
+    # A different check digit
+    expected = total % 11 % 10
+    if expected != check:
+        yield f"{core[:12]}{expected}"
+
+    # A different digit anywhere else
+    for position, (row, digit) in enumerate(zip(TABLE, digits)):
+        rest = total - row[digit]
+        for target in _TARGETS[check]:
+            replacement = _SOLVE[position].get((target - rest) % 11)
+            if replacement is not None and replacement != digit:
+                yield f"{core[:position]}{replacement}{core[position + 1:]}"
+
+    # Two neighbours swapped, including the last digit and the check digit
+    for position in range(len(TABLE)):
+        left, right = digits[position], digits[position + 1]
+        if left == right:
+            continue
+
+        swapped = total - TABLE[position][left] + TABLE[position][right]
+        if position + 1 < len(TABLE):
+            swapped += TABLE[position + 1][left] - TABLE[position + 1][right]
+            check_digit = check
+        else:
+            # `left` is the check digit now
+            check_digit = left
+
+        if swapped % 11 % 10 == check_digit:
+            yield (
+                f"{core[:position]}{core[position + 1]}{core[position]}"
+                f"{core[position + 2:]}"
+            )
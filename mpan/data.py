@@ -291,3 +291,7 @@ GSP_IDS = {
     ],
     "SPOW": [("_N", (datetime.date(1996, 4, 1), None))],
 }
+
+MTCS = {}
+
+LLFCS = {}
@@ -1,44 +1,91 @@
 from datetime import date
-from typing import List
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from .common import Subsection
-from .data import GSP_IDS, ID_LOOKUP
+from .gsp_group import get_index, get_participant_index
 
 
 class Distributor(Subsection):
+    __slots__ = ("_is_dno", "_is_idno", "_record")
+
     @property
     def is_dno(self) -> bool:
-        try:
-            return 0 < int(self.identifier) < 24
-        except ValueError:
-            return False
+        return self._is_dno
 
     @property
     def is_idno(self) -> bool:
-        try:
-            return 23 < int(self.identifier) < 39
-        except ValueError:
-            return False
+        return self._is_idno
 
     @property
     def name(self) -> str:
-        return ID_LOOKUP[self.identifier]["name"]
+        return self._get_record()["name"]
 
     @property
     def participant_id(self) -> str:
-        return ID_LOOKUP[self.identifier]["id"]
+        return self._get_record()["participant_id"]
 
     @property
     def gsp_group_ids(self) -> List[str]:
-        now = date.today()
+        return self.get_gsp_group_ids()
+
+    def get_gsp_group_ids(self, as_of: Optional[date] = None) -> List[str]:
+        """
+        The GSP groups this distributor was active in on `as_of`, which
+        defaults to today.
+        """
+
+        if as_of is None:
+            return list(get_index().today(self.participant_id))
+        return list(get_index().lookup(self.participant_id, as_of))
+
+    @classmethod
+    def get_gsp_group_ids_many(
+        cls,
+        pairs: Iterable[Tuple[Union[str, "Distributor"], Optional[date]]],
+    ) -> List[List[str]]:
+        """
+        `get_gsp_group_ids()` for lots of `(distributor, as_of)` pairs at
+        once, where each distributor can be an instance or an identifier, and
+        `as_of` defaults to today if it's `None`.
+        """
+
+        today = date.today()
+        participant_ids = (
+            (
+                cls(str(distributor)).participant_id,
+                today if as_of is None else as_of,
+            )
+            for distributor, as_of in pairs
+        )
+        return [list(r) for r in get_index().lookup_many(participant_ids)]
+
+    @classmethod
+    def from_participant_id(cls, participant_id: str) -> "Distributor":
+        """
+        The distributor with the given market participant id, like "EELC".
+        Raises a `KeyError` for participants that aren't distributors.
+        """
+        return _get_participants()[participant_id]
+
+    @classmethod
+    def for_gsp_group(
+        cls, gsp_id: str, as_of: Optional[date] = None
+    ) -> List["Distributor"]:
+        """
+        The distributors active in the GSP group `gsp_id` (like "_C") on
+        `as_of`, which defaults to today, in order of participant id.  Raises
+        a `KeyError` for GSP groups we know nothing about.
+        """
 
-        r = []
-        for gsp_id, (started, stopped) in GSP_IDS[self.participant_id]:
-            if now > started:
-                if not stopped or stopped > now:
-                    r.append(gsp_id)
+        index = get_participant_index()
+        if as_of is None:
+            participant_ids = index.today(gsp_id)
+        else:
+            participant_ids = index.lookup(gsp_id, as_of)
 
-        return r
+        participants = _get_participants()
+        return [participants[p] for p in participant_ids]
 
     # Convenience properties
 
@@ -50,4 +97,43 @@ class Distributor(Subsection):
 
     @property
     def is_valid(self) -> bool:
-        return self.is_dno or self.is_idno
+        return self._is_dno or self._is_idno
+
+    def _precompute(self) -> None:
+        try:
+            value = int(self.identifier)
+        except ValueError:
+            value = 0
+
+        self._set("_is_dno", 0 < value < 24)
+        self._set("_is_idno", 23 < value < 39)
+        self._set("_record", None)
+
+    def _get_record(self) -> Dict[str, str]:
+        """
+        Our entry in the reference data, which is only loaded the first time
+        anyone asks for it, so that `import mpan` (and validation, which
+        doesn't need it) stays quick.
+        """
+
+        if self._record is None:
+            from .reference import load
+
+            record = load()["distributors"].get(self.identifier, {})
+            self._set("_record", record)
+
+        if not self._record:
+            raise KeyError(self.identifier)
+        return self._record
+
+
+@lru_cache(maxsize=None)
+def _get_participants() -> Dict[str, Distributor]:
+    from .reference import load
+
+    # Each participant is only ever one distributor, but the reference data
+    # allows for more, in which case we take the first.
+    return {
+        participant_id: Distributor(identifiers[0])
+        for participant_id, identifiers in load()["participant_ids"].items()
+    }
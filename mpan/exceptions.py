@@ -1,2 +1,6 @@
+from typing import Optional
+
+
 class InvalidMPANError(Exception):
-    pass
+    # Where in the input things went wrong, if we know
+    position: Optional[int] = None
@@ -1,23 +1,116 @@
+import math
 import random
-import string
 
-from ..data import ID_LOOKUP
+from functools import lru_cache
+from typing import Tuple, Union
+
+from ..checksum import calculate
+from ..exceptions import InvalidMPANError
+from ..helpers import is_valid
 from ..mpan import MPAN
+from ..parser import LLFC_ALPHABET
 from ..profile_class import ProfileClass
+from ..reference import load
+
+
+PROFILE_CLASSES = tuple(ProfileClass.DESCRIPTIONS.keys())
+DISTRIBUTORS = tuple(load()["distributors"].keys())
 
 
 def generate() -> str:
-    profile_class = random.choice(tuple(ProfileClass.DESCRIPTIONS.keys()))
+    profile_class = random.choice(PROFILE_CLASSES)
 
     mtc = random.randint(100, 999)
 
-    llfc_options = string.ascii_uppercase + string.digits
-    llfc = "".join([random.choice(llfc_options) for _ in range(3)])
+    llfc = "".join(random.choices(LLFC_ALPHABET, k=3))
 
-    distributor = random.choice(tuple(ID_LOOKUP.keys()))
+    distributor = random.choice(DISTRIBUTORS)
     identifier = random.randint(1000000000, 9999999999)
 
-    pairs = zip(MPAN.PRIMES, f"{distributor}{identifier}")
-    checksum = sum(prime * int(digit) for prime, digit in pairs) % 11 % 10
+    checksum = calculate(f"{distributor}{identifier}")
 
     return f"{profile_class}{mtc}{llfc}{distributor}{identifier}{checksum}"
+
+
+# The number of cores `from_index()` can give you: every identifier (with
+# leading zeros) for each of `DISTRIBUTORS`.
+INDEX_SIZE = len(DISTRIBUTORS) * 10**10
+
+
+def from_index(index: int, seed: int = 0, short: bool = False) -> str:
+    """
+    The valid MPAN at `index` in a shuffled list of all `INDEX_SIZE` of the
+    cores we can generate, where `seed` decides the shuffle.  Different
+    indexes always give you different cores, so parallel workers can each
+    take their own range of indexes and never generate the same MPAN twice,
+    without keeping track of what they've generated so far.
+
+    The top line is worked out from the core, so if `short` is set, you get
+    just the core.
+    """
+
+    if not 0 <= index < INDEX_SIZE:
+        raise ValueError(
+            f"{index} isn't between 0 and {INDEX_SIZE - 1} inclusive"
+        )
+
+    multiplier, increment, _ = _get_permutation(seed)
+    value = (multiplier * index + increment) % INDEX_SIZE
+
+    distributor, identifier = divmod(value, 10**10)
+    core = f"{DISTRIBUTORS[distributor]}{identifier:010}"
+    core += str(calculate(core))
+
+    if short:
+        return core
+
+    value, profile_class = divmod(value, len(PROFILE_CLASSES))
+    value, mtc = divmod(value, 900)
+    llfc = ""
+    for _ in range(3):
+        value, character = divmod(value, len(LLFC_ALPHABET))
+        llfc += LLFC_ALPHABET[character]
+
+    return f"{PROFILE_CLASSES[profile_class]}{mtc + 100}{llfc}{core}"
+
+
+def to_index(mpan: Union[str, MPAN], seed: int = 0) -> int:
+    """
+    The index `from_index()` gives you `mpan` for with the same `seed`,
+    whatever its top line.  Raises a `ValueError` if it's not an MPAN that
+    `from_index()` could give you.
+    """
+
+    try:
+        core = MPAN(str(mpan)).core
+    except InvalidMPANError:
+        core = None
+
+    if (
+        core is None
+        or not core.isascii()
+        or core[:2] not in DISTRIBUTORS
+        or not is_valid(core)
+    ):
+        raise ValueError(f"{str(mpan)!r} can't be generated from an index")
+
+    _, increment, inverse = _get_permutation(seed)
+    value = DISTRIBUTORS.index(core[:2]) * 10**10 + int(core[2:12])
+
+    return inverse * (value - increment) % INDEX_SIZE
+
+
+@lru_cache(maxsize=None)
+def _get_permutation(seed: int) -> Tuple[int, int, int]:
+    """
+    The multiplier, increment and inverse of the multiplier (modulo
+    `INDEX_SIZE`) of the affine map that `seed` shuffles indexes with, which
+    is a permutation because the multiplier and `INDEX_SIZE` are coprime.
+    """
+
+    generator = random.Random(seed)
+    increment = generator.randrange(INDEX_SIZE)
+    while True:
+        multiplier = generator.randrange(1, INDEX_SIZE)
+        if math.gcd(multiplier, INDEX_SIZE) == 1:
+            return multiplier, increment, pow(multiplier, -1, INDEX_SIZE)
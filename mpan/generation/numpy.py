@@ -0,0 +1,187 @@
+from typing import Iterable, Iterator, Optional, Union
+
+import numpy as np
+
+from ..bulk import FIELDS, Batch
+from ..checksum import calculate_many
+from ..parser import LLFC_ALPHABET
+from .helpers import (
+    DISTRIBUTORS,
+    INDEX_SIZE,
+    PROFILE_CLASSES,
+    _get_permutation,
+)
+
+
+_PROFILE_CLASSES = np.array(PROFILE_CLASSES, dtype="S2").view(np.uint8)
+_DISTRIBUTORS = np.array(DISTRIBUTORS, dtype="S2").view(np.uint8)
+_LLFC_ALPHABET = np.frombuffer(LLFC_ALPHABET.encode(), dtype=np.uint8)
+
+# Where each distributor ID is in `DISTRIBUTORS`, or -1
+_DISTRIBUTOR_INDEXES = np.full(100, -1, dtype=np.int64)
+_DISTRIBUTOR_INDEXES[[int(d) for d in DISTRIBUTORS]] = np.arange(
+    len(DISTRIBUTORS)
+)
+
+
+def generate_many(
+    n: int, seed: Optional[int] = None, short: bool = False
+) -> np.ndarray:
+    """
+    Generate `n` valid MPANs at once, as a NumPy array of strings.  The values
+    are drawn the same way as `mpan.generation.helpers.generate()`, from a
+    NumPy random generator seeded with `seed`, so passing the same seed gets
+    you the same MPANs.
+
+    If `short` is set, you get just the cores, which are the same as the
+    bottom line of what you'd get with the same seed otherwise.
+    """
+    return _generate_chunk(np.random.default_rng(seed), n, short)
+
+
+def iter_generate_many(
+    n: int,
+    seed: Optional[int] = None,
+    short: bool = False,
+    chunksize: int = 1_000_000,
+) -> Iterator[np.ndarray]:
+    """
+    Like `generate_many()`, but yields the MPANs in arrays of up to
+    `chunksize` at a time, so you can generate far more of them than would
+    fit in memory.  The output is reproducible for a given `seed` and
+    `chunksize`, and the first chunk is the same as `generate_many()` would
+    give you for the same seed.
+    """
+
+    generator = np.random.default_rng(seed)
+
+    for start in range(0, n, chunksize):
+        yield _generate_chunk(generator, min(chunksize, n - start), short)
+
+
+def from_index_many(
+    indexes: Union[np.ndarray, Iterable[int]],
+    seed: int = 0,
+    short: bool = False,
+) -> np.ndarray:
+    """
+    `mpan.generation.helpers.from_index()` for each of `indexes` at once, as
+    a NumPy array of strings, so a worker can generate its share of a run as
+    `from_index_many(np.arange(start, stop), seed)`.
+    """
+
+    indexes = np.asarray(indexes, dtype=np.int64).ravel()
+
+    bad = np.flatnonzero((indexes < 0) | (indexes >= INDEX_SIZE))
+    if len(bad):
+        raise ValueError(
+            f"{indexes[bad[0]]} isn't between 0 and {INDEX_SIZE - 1} "
+            f"inclusive"
+        )
+
+    multiplier, increment, _ = _get_permutation(seed)
+    values = (_multiply(indexes, multiplier) + increment) % INDEX_SIZE
+
+    codes = np.empty((len(values), 21), dtype=np.uint8)
+
+    distributors = _DISTRIBUTORS.reshape(-1, 2)
+    codes[:, 8:10] = distributors[values // 10**10]
+    codes[:, 10:20] = _digits(values % 10**10, 10)
+    codes[:, 20] = calculate_many(codes[:, 8:20] - ord("0")) + ord("0")
+
+    # The top line, from the same value as `from_index()` works it out from
+    values, profile_classes = np.divmod(values, len(PROFILE_CLASSES))
+    values, mtcs = np.divmod(values, 900)
+    codes[:, 0:2] = _PROFILE_CLASSES.reshape(-1, 2)[profile_classes]
+    codes[:, 2:5] = _digits(mtcs + 100, 3)
+    for column in range(5, 8):
+        values, characters = np.divmod(values, len(LLFC_ALPHABET))
+        codes[:, column] = _LLFC_ALPHABET[characters]
+
+    if short:
+        codes = np.ascontiguousarray(codes[:, 8:])
+
+    return codes.view(f"S{codes.shape[1]}").ravel().astype(str)
+
+
+def to_index_many(
+    values: Union[np.ndarray, Iterable], seed: int = 0
+) -> np.ndarray:
+    """
+    `mpan.generation.helpers.to_index()` for each of `values` at once, as a
+    NumPy array of integers.  Raises a `ValueError` if any of them isn't an
+    MPAN that `from_index()` could give you.
+    """
+
+    batch = Batch(values)
+
+    digits = batch.digits[:, slice(*FIELDS["core"])]
+    distributors = _DISTRIBUTOR_INDEXES[
+        batch.number(*FIELDS["distributor"]).clip(0, 99)
+    ]
+    ok = (
+        batch.is_parseable
+        & ~batch.fallback
+        & (distributors >= 0)
+        & (calculate_many(digits.clip(0, 9)) == digits[:, -1])
+    )
+
+    bad = np.flatnonzero(~ok)
+    if len(bad):
+        raise ValueError(
+            f"{str(batch.strings[bad[0]])!r} can't be generated from an index"
+        )
+
+    _, increment, inverse = _get_permutation(seed)
+    # All ten digits between the distributor and the check digit
+    identifiers = batch.number(FIELDS["distributor"][1], FIELDS["checksum"][0])
+
+    return _multiply(
+        (distributors * 10**10 + identifiers - increment) % INDEX_SIZE,
+        inverse,
+    )
+
+
+def _generate_chunk(
+    generator: np.random.Generator, size: int, short: bool
+) -> np.ndarray:
+    codes = np.empty((size, 21), dtype=np.uint8)
+
+    profile_classes = _PROFILE_CLASSES.reshape(-1, 2)
+    codes[:, 0:2] = profile_classes[generator.integers(0, 9, size)]
+    codes[:, 2:5] = _digits(generator.integers(100, 1000, size), 3)
+    codes[:, 5:8] = _LLFC_ALPHABET[generator.integers(0, 36, (size, 3))]
+
+    distributors = _DISTRIBUTORS.reshape(-1, 2)
+    codes[:, 8:10] = distributors[
+        generator.integers(0, len(distributors), size)
+    ]
+    codes[:, 10:20] = _digits(generator.integers(10**9, 10**10, size), 10)
+
+    codes[:, 20] = calculate_many(codes[:, 8:20] - ord("0")) + ord("0")
+
+    if short:
+        codes = np.ascontiguousarray(codes[:, 8:])
+
+    return codes.view(f"S{codes.shape[1]}").ravel().astype(str)
+
+
+def _digits(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    The ASCII codes for the digits of each of `values`, as a matrix with
+    `width` columns.
+    """
+    powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+    return (values[:, None] // powers % 10 + ord("0")).astype(np.uint8)
+
+
+def _multiply(values: np.ndarray, multiplier: int) -> np.ndarray:
+    """
+    `values * multiplier % INDEX_SIZE`, for values from 0 to `INDEX_SIZE`,
+    without overflowing 64 bits.  Splitting `multiplier` in two keeps every
+    product below 2**60, as `INDEX_SIZE` is below 2**40.
+    """
+
+    high, low = divmod(multiplier, 1 << 20)
+    result = values * high % INDEX_SIZE
+    return ((result << 20) + values * low) % INDEX_SIZE
@@ -0,0 +1,158 @@
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+Period = Tuple[date, Optional[date]]
+
+# The dates (as ordinals) on which a participant's GSP groups change, and the
+# groups that apply before the first of them and from each of them on.
+Intervals = Tuple[List[int], List[Tuple[str, ...]]]
+
+
+class GSPGroupIndex:
+    """
+    An interval index over the GSP groups each participant has operated in,
+    so that finding the groups for a participant on a given date is a binary
+    search rather than a scan over their whole history.
+
+    For each participant, we keep the sorted dates on which their set of GSP
+    groups changes, and the set that applies from each of those dates on.
+    Dates are kept as ordinals, so that the index can be stored as JSON and
+    loaded again without parsing any dates.
+
+    Nothing here depends on which way round the keys and groups are, so the
+    same class also indexes the participants active in each GSP group.
+    """
+
+    def __init__(self, gsp_ids: Dict[str, List[Tuple[str, Period]]]) -> None:
+        self._boundaries: Dict[str, List[int]] = {}
+        self._groups: Dict[str, List[Tuple[str, ...]]] = {}
+
+        for participant_id, periods in gsp_ids.items():
+            self._add(participant_id, periods)
+
+        # The answers for today, which are reused until the date changes
+        self._today: Tuple[Optional[date], Dict[str, Tuple[str, ...]]] = (
+            None,
+            {},
+        )
+
+    @classmethod
+    def from_intervals(
+        cls, intervals: Dict[str, Intervals]
+    ) -> "GSPGroupIndex":
+        """
+        An index built straight from what `.intervals` gave, without working
+        any of it out again.
+        """
+
+        index = cls({})
+        for participant_id, (boundaries, groups) in intervals.items():
+            index._boundaries[participant_id] = list(boundaries)
+            index._groups[participant_id] = [tuple(g) for g in groups]
+
+        return index
+
+    @property
+    def intervals(self) -> Dict[str, Intervals]:
+        return {
+            participant_id: (boundaries, self._groups[participant_id])
+            for participant_id, boundaries in self._boundaries.items()
+        }
+
+    def lookup(self, participant_id: str, as_of: date) -> Tuple[str, ...]:
+        """
+        The GSP groups `participant_id` was active in on `as_of`.  Raises a
+        `KeyError` for participants we know nothing about.
+        """
+
+        if isinstance(as_of, datetime):
+            as_of = as_of.date()
+
+        boundaries = self._boundaries[participant_id]
+        position = bisect_right(boundaries, as_of.toordinal())
+        return self._groups[participant_id][position]
+
+    def lookup_many(
+        self, pairs: Iterable[Tuple[str, date]]
+    ) -> List[Tuple[str, ...]]:
+        """
+        `lookup()` for lots of `(participant_id, as_of)` pairs at once.
+        """
+
+        cache: Dict[Tuple[str, date], Tuple[str, ...]] = {}
+
+        result = []
+        for pair in pairs:
+            try:
+                result.append(cache[pair])
+            except KeyError:
+                result.append(cache.setdefault(pair, self.lookup(*pair)))
+
+        return result
+
+    def today(self, participant_id: str) -> Tuple[str, ...]:
+        today = date.today()
+
+        day, cache = self._today
+        if day != today:
+            cache = {}
+            self._today = (today, cache)
+
+        try:
+            return cache[participant_id]
+        except KeyError:
+            return cache.setdefault(
+                participant_id, self.lookup(participant_id, today)
+            )
+
+    def _add(self, participant_id: str, periods: List[Tuple[str, Period]]):
+        # A group counts as active strictly after it started and strictly
+        # before it stopped, so we turn that into the half-open interval
+        # [started + 1 day, stopped).
+        intervals = []
+        for gsp_id, (started, stopped) in periods:
+            start = started + timedelta(days=1)
+            if stopped is None or start < stopped:
+                intervals.append((gsp_id, start, stopped))
+
+        boundaries = sorted(
+            {start for _, start, _ in intervals}
+            | {stop for _, _, stop in intervals if stop is not None}
+        )
+
+        # Before the first boundary, nothing is active
+        groups = [()]
+        for boundary in boundaries:
+            groups.append(
+                tuple(
+                    gsp_id
+                    for gsp_id, start, stop in intervals
+                    if start <= boundary and (stop is None or boundary < stop)
+                )
+            )
+
+        self._boundaries[participant_id] = [b.toordinal() for b in boundaries]
+        self._groups[participant_id] = groups
+
+
+@lru_cache(maxsize=None)
+def get_index() -> GSPGroupIndex:
+    # Imported here so that the reference data is only loaded when it's needed
+    from .reference import load
+
+    return GSPGroupIndex.from_intervals(load()["intervals"])
+
+
+@lru_cache(maxsize=None)
+def get_participant_index() -> GSPGroupIndex:
+    """
+    The participants active in each GSP group, rather than the other way
+    round.
+    """
+
+    from .reference import load
+
+    return GSPGroupIndex.from_intervals(load()["gsp_group_intervals"])
@@ -1,5 +1,6 @@
 from .exceptions import InvalidMPANError
 from .mpan import MPAN
+from .reason import Reason
 
 
 def is_valid(raw_string: str) -> bool:
@@ -7,3 +8,14 @@ def is_valid(raw_string: str) -> bool:
         return MPAN(raw_string).is_valid
     except InvalidMPANError:
         return False
+
+
+def diagnose(raw_string: str) -> Reason:
+    """
+    Why `raw_string` isn't a valid MPAN (or `Reason.VALID` if it is), without
+    raising anything.
+    """
+    try:
+        return MPAN(raw_string).reason
+    except InvalidMPANError:
+        return Reason.BAD_FORMAT
@@ -0,0 +1,174 @@
+#
+# Counters and timings for the stages every `MPAN` goes through, so that you
+# can see where MPANs are failing in production and how long it takes.  It's
+# all switched off by default, in which case the only cost is checking
+# `enabled` once per stage:
+#
+#   from mpan import instrumentation
+#
+#   instrumentation.enable()
+#   instrumentation.add_callback(
+#       lambda stage, outcome, seconds: statsd.timing(
+#           f"mpan.{stage}.{outcome}", seconds * 1000
+#       )
+#   )
+#
+#   ...
+#
+#   instrumentation.get_stats()["validate"].outcomes  # {"valid": 9, ...}
+#
+
+import time
+
+from bisect import bisect_left
+from collections import Counter
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import InvalidMPANError
+
+
+# Whether anything is being recorded at all.  Use `enable()` and `disable()`
+# rather than setting this directly.
+enabled = False
+
+# The stages we record, which are:
+#
+#   parse:    `MPAN()`, with an outcome of "ok" or "invalid" if it raised an
+#             `InvalidMPANError`.
+#   validate: Working out `MPAN.is_valid`, which only happens once per MPAN,
+#             with an outcome of "valid" or the first check that failed, as
+#             the name of a `Reason` in lower case.
+#   check:    `MPAN.check()`, with an outcome of "ok" or "invalid".
+STAGES = ("parse", "validate", "check")
+
+# The upper bounds, in seconds, of the buckets in each stage's histogram.
+# Anything slower than the last one goes in an extra bucket at the end.
+BUCKETS = (
+    0.000_000_5,
+    0.000_001,
+    0.000_002_5,
+    0.000_005,
+    0.000_01,
+    0.000_025,
+    0.000_05,
+    0.000_1,
+    0.001,
+)
+
+Callback = Callable[[str, str, float], Any]
+
+
+class StageStats:
+    """
+    What's been recorded for one stage: a count per outcome, a count per
+    bucket in `BUCKETS`, and the total time taken.  This is a plain class
+    rather than a dataclass to keep `dataclasses` out of `import mpan`, as
+    with `MeterTimeSwitchCode.MTCRange`.
+    """
+
+    __slots__ = ("outcomes", "histogram", "seconds")
+
+    def __init__(
+        self,
+        outcomes: Optional[Dict[str, int]] = None,
+        histogram: Optional[List[int]] = None,
+        seconds: float = 0.0,
+    ) -> None:
+        self.outcomes = Counter(outcomes or {})
+        self.histogram = list(histogram or [0] * (len(BUCKETS) + 1))
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"StageStats(outcomes={dict(self.outcomes)}, "
+            f"histogram={self.histogram}, seconds={self.seconds})"
+        )
+
+    @property
+    def count(self) -> int:
+        return sum(self.outcomes.values())
+
+
+_stats: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+_callbacks: List[Callback] = []
+_lock = Lock()
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    """
+    Forget everything recorded so far.
+    """
+    with _lock:
+        for stage in STAGES:
+            _stats[stage] = StageStats()
+
+
+def get_stats() -> Dict[str, StageStats]:
+    """
+    A copy of what's been recorded so far, by stage.
+    """
+    with _lock:
+        return {
+            stage: StageStats(stats.outcomes, stats.histogram, stats.seconds)
+            for stage, stats in _stats.items()
+        }
+
+
+def add_callback(callback: Callback) -> None:
+    """
+    Call `callback(stage, outcome, seconds)` every time something is
+    recorded, from whichever thread did the recording.  Anything it raises is
+    raised from the code being measured, so it should take care of its own
+    errors.
+    """
+    _callbacks.append(callback)
+
+
+def remove_callback(callback: Callback) -> None:
+    _callbacks.remove(callback)
+
+
+def record(stage: str, outcome: str, seconds: float) -> None:
+    with _lock:
+        stats = _stats[stage]
+        stats.outcomes[outcome] += 1
+        stats.histogram[bisect_left(BUCKETS, seconds)] += 1
+        stats.seconds += seconds
+
+    for callback in _callbacks:
+        callback(stage, outcome, seconds)
+
+
+def measure(stage: str, function: Callable, *args) -> Any:
+    """
+    Call `function(*args)` and record how long it took.  The outcome is the
+    name of the `Reason` it returns in lower case (or "ok" if it returns
+    `None`), or "invalid" if it raises an `InvalidMPANError`, which is then
+    raised again.
+    """
+
+    started = time.perf_counter()
+    try:
+        result = function(*args)
+    except InvalidMPANError:
+        record(stage, "invalid", time.perf_counter() - started)
+        raise
+
+    record(
+        stage,
+        "ok" if result is None else result.name.lower(),
+        time.perf_counter() - started,
+    )
+
+    return result
@@ -0,0 +1,136 @@
+from datetime import date
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
+
+from .common import Subsection, get_effective
+from .distributor import Distributor
+from .parser import LLFC_CHARACTERS
+
+
+class LineLossFactorClass(Subsection):
+    """
+    What a line loss factor class means depends on the distributor, so
+    everything beyond its format is looked up for a particular distributor
+    in the industry LLFC extract, if the reference data was generated with
+    one (see `--llfcs` in `scripts/generate-databases.py`).
+    """
+
+    __slots__ = ("_is_valid",)
+
+    # What the LLFC extract says about a class for one distributor for a
+    # period, which includes both `effective_from` and `effective_to`.
+    class Record(NamedTuple):
+        effective_from: date
+        effective_to: Optional[date]
+        description: str
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        Whether this looks like a line loss factor class at all.
+        """
+        return self._is_valid
+
+    def get_records(
+        self, distributor: Union[str, Distributor]
+    ) -> List[Record]:
+        """
+        Everything the LLFC extract says about this class for `distributor`,
+        oldest first.
+        """
+        return list(self._get_records(distributor)[1])
+
+    def get_record(
+        self,
+        distributor: Union[str, Distributor],
+        as_of: Optional[date] = None,
+    ) -> Optional[Record]:
+        """
+        The entry in the LLFC extract for this class and `distributor` that
+        was in effect on `as_of`, which defaults to today, if there was one.
+        """
+        return get_effective(*self._get_records(distributor), as_of)
+
+    def get_description(
+        self,
+        distributor: Union[str, Distributor],
+        as_of: Optional[date] = None,
+    ) -> Optional[str]:
+        record = self.get_record(distributor, as_of)
+        return None if record is None else record.description
+
+    def is_valid_for(
+        self,
+        distributor: Union[str, Distributor],
+        as_of: Optional[date] = None,
+    ) -> bool:
+        """
+        Whether `distributor` had this class on `as_of`, which defaults to
+        today.  Distributors the LLFC extract says nothing about at all get
+        the benefit of the doubt, so without an extract, this is the same as
+        `.is_valid`.
+        """
+
+        if not self.is_valid:
+            return False
+
+        _, distributors = _get_extract()
+        if str(distributor) not in distributors:
+            return True
+
+        return self.get_record(distributor, as_of) is not None
+
+    def _precompute(self) -> None:
+        self._set(
+            "_is_valid",
+            len(self.identifier) == 3
+            and LLFC_CHARACTERS.issuperset(self.identifier),
+        )
+
+    def _get_records(
+        self, distributor: Union[str, Distributor]
+    ) -> Tuple[List[int], Tuple[Record, ...]]:
+        index, _ = _get_extract()
+        return index.get((str(distributor), self.identifier), ([], ()))
+
+
+Record = LineLossFactorClass.Record
+
+Index = Dict[Tuple[str, str], Tuple[List[int], Tuple[Record, ...]]]
+
+
+def get_classes(as_of: Optional[date] = None) -> Dict[str, List[str]]:
+    """
+    The classes each distributor in the LLFC extract had on `as_of`, which
+    defaults to today.
+    """
+
+    index, distributors = _get_extract()
+
+    result: Dict[str, List[str]] = {d: [] for d in sorted(distributors)}
+    for (distributor, llfc), records in sorted(index.items()):
+        if get_effective(*records, as_of) is not None:
+            result[distributor].append(llfc)
+
+    return result
+
+
+@lru_cache(maxsize=None)
+def _get_extract() -> Tuple[Index, FrozenSet[str]]:
+    """
+    The LLFC extract, indexed by distributor and class, with the ordinals of
+    the dates each record came into effect, along with the distributors it
+    covers.  It's only loaded the first time anyone asks for it.
+    """
+
+    from .reference import get_llfcs, load
+
+    index = {}
+    llfcs = get_llfcs(load())
+    for distributor, classes in llfcs.items():
+        for llfc, rows in classes.items():
+            records = tuple(Record(*row) for row in rows)
+            starts = [record.effective_from.toordinal() for record in records]
+            index[(distributor, llfc)] = (starts, records)
+
+    return index, frozenset(llfcs)
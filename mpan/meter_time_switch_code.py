@@ -1,16 +1,29 @@
-from dataclasses import dataclass
-from typing import Optional
+from datetime import date
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
-from .common import Subsection
+from .common import Subsection, get_effective
 
 
 class MeterTimeSwitchCode(Subsection):
-    @dataclass
-    class MTCRange:
+    __slots__ = ("_is_valid", "_description", "_records")
+
+    # A `NamedTuple` rather than a dataclass, as importing `dataclasses` would
+    # more than double the time `import mpan` takes.
+    class MTCRange(NamedTuple):
         upper: int
         lower: int
         description: str
 
+    # What the industry MTC extract says about a code for a period, which
+    # includes both `effective_from` and `effective_to`.
+    class Record(NamedTuple):
+        effective_from: date
+        effective_to: Optional[date]
+        description: str
+        register_count: int
+        settlement_type: str
+
     MTC_RANGES = (
         MTCRange(1, 399, "DNO specific"),
         MTCRange(400, 499, "Reserved"),
@@ -27,23 +40,108 @@ class MeterTimeSwitchCode(Subsection):
 
     @property
     def is_valid(self) -> bool:
-        try:
-            return 0 < int(self.identifier) < 1000
-        except ValueError:
-            return False
+        return self._is_valid
 
     @property
     def description(self) -> Optional[str]:
-        if not self.identifier:
-            return None
+        return self.get_description()
+
+    @property
+    def register_count(self) -> Optional[int]:
+        record = self.get_record()
+        return None if record is None else record.register_count
+
+    @property
+    def settlement_type(self) -> Optional[str]:
+        record = self.get_record()
+        return None if record is None else record.settlement_type
+
+    @property
+    def records(self) -> List[Record]:
+        """
+        Everything the industry MTC extract says about this code, oldest
+        first, or nothing if the reference data was generated without one.
+        """
+        return list(self._get_records()[1])
+
+    def get_description(self, as_of: Optional[date] = None) -> Optional[str]:
+        """
+        The description of this code in the MTC extract on `as_of`, which
+        defaults to today, or failing that, of the range it's in.
+        """
+
+        if self._get_records()[1]:
+            record = self.get_record(as_of)
+            if record is not None:
+                return record.description
+
+        return self._description
+
+    def get_record(self, as_of: Optional[date] = None) -> Optional[Record]:
+        """
+        The entry in the MTC extract for this code that was in effect on
+        `as_of`, which defaults to today, if there was one.
+        """
 
+        return get_effective(*self._get_records(), as_of)
+
+    def _precompute(self) -> None:
         try:
             value = int(self.identifier)
         except ValueError:
-            return None
+            value = None
+
+        self._set("_is_valid", value is not None and 0 < value < 1000)
+        self._set("_description", None)
+        self._set("_records", None)
+
+        if value is not None and 0 <= value < 1000:
+            self._set("_description", _get_descriptions()[value])
+
+    def _get_records(self) -> Tuple[List[int], Tuple[Record, ...]]:
+        """
+        Our entries in the MTC extract, with the ordinals of the dates they
+        came into effect, which are only loaded the first time anyone asks
+        for them.
+        """
+
+        if self._records is None:
+            records = ([], ())
+            if self.is_valid:
+                key = f"{int(self.identifier):03}"
+                records = _get_extract().get(key, records)
+            self._set("_records", records)
+
+        return self._records
+
+
+Record = MeterTimeSwitchCode.Record
+
+
+@lru_cache(maxsize=None)
+def _get_descriptions() -> Tuple[Optional[str], ...]:
+    """
+    The description of the range each code from 0 to 999 is in, so that
+    working it out is a lookup rather than a search through the ranges.
+    """
+
+    descriptions: List[Optional[str]] = [None] * 1000
+    for range_ in MeterTimeSwitchCode.MTC_RANGES:
+        for value in range(range_.upper, range_.lower + 1):
+            descriptions[value] = range_.description
+
+    return tuple(descriptions)
+
+
+@lru_cache(maxsize=None)
+def _get_extract() -> Dict[str, Tuple[List[int], Tuple[Record, ...]]]:
+    # Imported here so that the reference data is only loaded when it's needed
+    from .reference import get_mtcs, load
 
-        for range_ in self.MTC_RANGES:
-            if range_.upper <= value <= range_.lower:
-                return range_.description
+    extract = {}
+    for code, rows in get_mtcs(load()).items():
+        records = tuple(Record(*row) for row in rows)
+        starts = [record.effective_from.toordinal() for record in records]
+        extract[code] = (starts, records)
 
-        return None
+    return extract
@@ -8,43 +8,76 @@ import re
 
 from typing import Optional
 
+from . import instrumentation
+from .checksum import PRIMES, verify as verify_checksum
 from .distributor import Distributor
 from .exceptions import InvalidMPANError
+from .line_loss_factor_class import LineLossFactorClass
 from .meter_time_switch_code import MeterTimeSwitchCode
+from .parser import LONG_OFFSET, SHORT_OFFSET, parse
 from .profile_class import ProfileClass
+from .reason import Reason
+
+
+# The digits of the line loss factor class, when it's treated as a number
+_BASE_36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
 class MPAN:
+    # These are no longer used for parsing (see `mpan.parser`), but remain for
+    # anyone relying on them.
     RE_SHORT = re.compile(r"^((\d\d)(\d{8})\d\d(\d))$")
     RE_LONG = re.compile(
         r"^((\d\d)(\d\d\d)([A-Z0-9]{3}))((\d\d)(\d{8})\d\d(\d))$"
     )
 
-    # 11 is deliberately missing as-per the rules for the validation algorithm.
-    PRIMES = [3, 5, 7, 13, 17, 19, 23, 29, 31, 37, 41, 43]
+    # The weights for the checksum, which now lives in `mpan.checksum`
+    PRIMES = list(PRIMES)
+
+    # How many bits of `.key` hold the top line: enough for every profile
+    # class, meter time switch code and (base 36) line loss factor class.
+    TOP_LINE_BITS = 33
+
+    # The last possible top line in `.key`, which is "99999ZZZ"
+    MAX_TOP_LINE = 100_000 * 36**3
+
+    # The size of `.pack()`: a big-endian 64-bit word each for the core and
+    # the top line, as they are in `.key`.
+    PACKED_SIZE = 16
+
+    __slots__ = (
+        "_raw",
+        "_offset",
+        "_profile_class",
+        "_meter_time_switch_code",
+        "_distributor",
+        "_is_valid",
+        "_key",
+    )
 
     def __init__(self, raw_string: str) -> None:
-        self.top_line = None
-        self.profile_class = None
-        self.meter_time_switch_code = None
-        self.line_loss_factor_class = None
-        self.core = None
-        self.distributor = None
-        self.identifier = None
-        self.checksum = None
+        if instrumentation.enabled:
+            instrumentation.measure("parse", self._initialise, raw_string)
+        else:
+            self._initialise(raw_string)
+
+    def _initialise(self, raw_string: str) -> None:
+        # The subsections are built on demand, and `_offset` is where the core
+        # starts in `_raw`: everything else is sliced out relative to that.
+        self._offset = SHORT_OFFSET
+        self._profile_class = None
+        self._meter_time_switch_code = None
+        self._distributor = None
+        self._is_valid = None
+        self._key = None
 
         # To allow for objects that can be cast as strings
         self._raw = str(raw_string)
 
-        if m := self.RE_SHORT.match(self._raw):
-            self._parse_short(m)
-            return
-
-        if m := self.RE_LONG.match(self._raw):
-            self._parse_long(m)
-            return
-
-        raise InvalidMPANError(f"{self._raw} doesn't look like an MPAN")
+        if parse(self._raw) == LONG_OFFSET:
+            self._parse_long()
+        else:
+            self._parse_short()
 
     def __str__(self) -> str:
         return self._raw
@@ -57,9 +90,149 @@ class MPAN:
             return False
         return str(self) == str(other)
 
+    def __hash__(self) -> int:
+        # MPANs are equal to their strings, so they have to hash like them too
+        return hash(self._raw)
+
+    def __lt__(self, other):
+        if not isinstance(other, MPAN):
+            return NotImplemented
+        return self.key < other.key
+
+    @property
+    def key(self) -> int:
+        """
+        A canonical integer for this MPAN, with the core in the high bits and
+        the top line (or zero, if there isn't one) in the low `TOP_LINE_BITS`
+        bits, so that sorting by key sorts by core first.
+        """
+
+        # Sorting compares two keys at a time, so it's worth not working them
+        # out again for every comparison.
+        if self._key is None:
+            top_line = 0
+            if self.is_long:
+                profile_class = int(self._raw[:2])
+                mtc = int(self._raw[2:5])
+                llfc = int(self._raw[5:8], 36)
+                top_line = (profile_class * 1000 + mtc) * 36**3 + llfc + 1
+            self._key = int(self.core) << self.TOP_LINE_BITS | top_line
+
+        return self._key
+
+    @classmethod
+    def from_key(cls, key: int) -> "MPAN":
+        """
+        The MPAN with the given `.key`.
+        """
+
+        core, top_line = divmod(key, 1 << cls.TOP_LINE_BITS)
+        if not top_line:
+            return cls(f"{core:013}")
+
+        top_line, llfc = divmod(top_line - 1, 36**3)
+        profile_class, mtc = divmod(top_line, 1000)
+
+        llfc = "".join(_BASE_36[llfc // 36**i % 36] for i in (2, 1, 0))
+
+        return cls(f"{profile_class:02}{mtc:03}{llfc}{core:013}")
+
+    def pack(self) -> bytes:
+        """
+        This MPAN as `PACKED_SIZE` bytes, which `MPAN.unpack()` turns back
+        into an MPAN with the same string.  Packed MPANs sort the same way as
+        the MPANs themselves when compared as bytes.  Short MPANs are the
+        same size, with a top line of zero, so they grow a little.
+
+        Only MPANs in their canonical form can be packed, so there's no
+        room for ones with a trailing newline or non-ASCII digits, which
+        raise a `ValueError`.
+        """
+
+        if not self._raw.isascii() or self._raw.endswith("\n"):
+            raise ValueError(f"{self._raw!r} isn't in its canonical form")
+
+        core, top_line = divmod(self.key, 1 << self.TOP_LINE_BITS)
+        return (core << 64 | top_line).to_bytes(self.PACKED_SIZE, "big")
+
+    @classmethod
+    def unpack(cls, packed: bytes) -> "MPAN":
+        """
+        The MPAN that `.pack()` gave `packed`.  Raises a `ValueError` for
+        anything `.pack()` couldn't have given.
+        """
+
+        if len(packed) != cls.PACKED_SIZE:
+            raise ValueError(
+                f"Packed MPANs are {cls.PACKED_SIZE} bytes, not {len(packed)}"
+            )
+
+        core, top_line = divmod(int.from_bytes(packed, "big"), 1 << 64)
+        if core >= 10**13 or top_line > cls.MAX_TOP_LINE:
+            raise ValueError(f"{packed!r} isn't a packed MPAN")
+
+        return cls.from_key(core << cls.TOP_LINE_BITS | top_line)
+
+    @property
+    def top_line(self) -> Optional[str]:
+        if self.is_short:
+            return None
+        return self._raw[0:8]
+
+    @property
+    def profile_class(self) -> Optional[ProfileClass]:
+        if self.is_short:
+            return None
+        if self._profile_class is None:
+            self._profile_class = ProfileClass(self._raw[0:2])
+        return self._profile_class
+
+    @property
+    def meter_time_switch_code(self) -> Optional[MeterTimeSwitchCode]:
+        if self.is_short:
+            return None
+        if self._meter_time_switch_code is None:
+            self._meter_time_switch_code = MeterTimeSwitchCode(self._raw[2:5])
+        return self._meter_time_switch_code
+
+    @property
+    def line_loss_factor_class(self) -> Optional[str]:
+        if self.is_short:
+            return None
+        return self._raw[5:8]
+
+    @property
+    def line_loss_factor_class_info(self) -> Optional[LineLossFactorClass]:
+        """
+        The line loss factor class as a `LineLossFactorClass`, for looking
+        it up in the LLFC extract.  `.line_loss_factor_class` is still just
+        the string.
+        """
+        if self.is_short:
+            return None
+        return LineLossFactorClass(self._raw[5:8])
+
+    @property
+    def core(self) -> str:
+        return self._core_slice(0, 13)
+
+    @property
+    def distributor(self) -> Distributor:
+        if self._distributor is None:
+            self._distributor = Distributor(self._core_slice(0, 2))
+        return self._distributor
+
+    @property
+    def identifier(self) -> str:
+        return self._core_slice(2, 10)
+
+    @property
+    def checksum(self) -> str:
+        return self._core_slice(12, 13)
+
     @property
     def is_short(self) -> bool:
-        return self.profile_class is None
+        return self._offset == 0
 
     @property
     def is_long(self) -> bool:
@@ -89,38 +262,56 @@ class MPAN:
         If that all looks good, perform the checksum for the bottom line.
         """
 
+        if self._is_valid is None:
+            if instrumentation.enabled:
+                problem = instrumentation.measure("validate", self._diagnose)
+            else:
+                problem = self._diagnose()
+            self._is_valid = problem == Reason.VALID
+        return self._is_valid
+
+    @property
+    def reason(self) -> Reason:
+        """
+        Why this MPAN isn't valid, or `Reason.VALID` if it is.
+        """
+        if self.is_valid:
+            return Reason.VALID
+        return self._diagnose()
+
+    def check(self) -> None:
+        if instrumentation.enabled:
+            instrumentation.measure("check", self._check)
+        else:
+            self._check()
+
+    def _check(self) -> None:
+        if not self.is_valid:
+            raise InvalidMPANError(f"MPAN failed validity check: {self}")
+
+    def _diagnose(self) -> Reason:
         if self.profile_class is not None:
             if not self.profile_class.is_valid:
-                return False
+                return Reason.INVALID_PROFILE_CLASS
 
         if self.meter_time_switch_code is not None:
             if not self.meter_time_switch_code.is_valid:
-                return False
+                return Reason.INVALID_MTC
 
         if not self.distributor.is_valid:
-            return False
+            return Reason.UNKNOWN_DISTRIBUTOR
 
-        pairs = zip(self.PRIMES, self.core[:-1])
-        result = sum(prime * int(digit) for prime, digit in pairs) % 11 % 10
-        return result == int(self.checksum)
+        if not verify_checksum(self.core):
+            return Reason.CHECKSUM_MISMATCH
 
-    def check(self) -> None:
-        if not self.is_valid:
-            raise InvalidMPANError(f"MPAN failed validity check: {self}")
+        return Reason.VALID
+
+    def _core_slice(self, start: int, stop: int) -> str:
+        start, stop = self._offset + start, self._offset + stop
+        return self._raw[start:stop]
+
+    def _parse_short(self) -> None:
+        self._offset = SHORT_OFFSET
 
-    def _parse_short(self, m: re.Match) -> None:
-        self.core = m.group(1)
-        self.distributor = Distributor(m.group(2))
-        self.identifier = m.group(3)
-        self.checksum = m.group(4)
-
-    def _parse_long(self, m: re.Match) -> None:
-        self.top_line = m.group(1)
-        self.profile_class = ProfileClass(m.group(2))
-        self.meter_time_switch_code = MeterTimeSwitchCode(m.group(3))
-        self.line_loss_factor_class = m.group(4)
-
-        self.core = m.group(5)
-        self.distributor = Distributor(m.group(6))
-        self.identifier = m.group(7)
-        self.checksum = m.group(8)
+    def _parse_long(self) -> None:
+        self._offset = LONG_OFFSET
@@ -0,0 +1,167 @@
+#
+# A set of MPANs for reconciling large portfolios, held as a sorted array of
+# cores so that unions, intersections and differences are single NumPy
+# operations.  This requires NumPy, available via the optional extra `numpy`.
+#
+
+from typing import Iterator, Union
+
+import numpy as np
+
+from .bulk import FIELDS, Batch, Values
+from .exceptions import InvalidMPANError
+from .mpan import MPAN
+
+
+class MPANSet:
+    """
+    A set of MPANs, backed by a sorted `int64` array of their cores.  The
+    core is what identifies a meter point, so two MPANs with the same core
+    count as the same member, whatever their top lines say, and iterating
+    over the set gives you the cores as 13 character strings.
+    """
+
+    __slots__ = ("cores",)
+
+    def __init__(self, values: Values = ()) -> None:
+        self.cores = np.unique(_get_cores(values))
+
+    @classmethod
+    def from_cores(cls, cores: Union[np.ndarray, Values]) -> "MPANSet":
+        """
+        A set built straight from cores that are already integers.
+        """
+        result = cls.__new__(cls)
+        result.cores = np.unique(np.asarray(cores, dtype=np.int64))
+        return result
+
+    def __len__(self) -> int:
+        return len(self.cores)
+
+    def __iter__(self) -> Iterator[str]:
+        for core in self.cores.tolist():
+            yield f"{core:013}"
+
+    def __contains__(self, value) -> bool:
+        try:
+            core = int(MPAN(value).core)
+        except InvalidMPANError:
+            return False
+
+        position = np.searchsorted(self.cores, core)
+        return position < len(self.cores) and self.cores[position] == core
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MPANSet):
+            return NotImplemented
+        return np.array_equal(self.cores, other.cores)
+
+    def __repr__(self) -> str:
+        return f"MPANSet({len(self)} MPANs)"
+
+    def __or__(self, other: "MPANSet") -> "MPANSet":
+        return self.union(other)
+
+    def __and__(self, other: "MPANSet") -> "MPANSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "MPANSet") -> "MPANSet":
+        return self.difference(other)
+
+    def __xor__(self, other: "MPANSet") -> "MPANSet":
+        return self.symmetric_difference(other)
+
+    # Both arrays are already sorted and unique, so rather than NumPy's
+    # generic set routines (which concatenate both sides and sort them from
+    # scratch), we find which members of each side are in the other with a
+    # binary search.  Unions still have to merge two sorted arrays, which
+    # `_merge()` does in linear time.
+
+    def union(self, other: "MPANSet") -> "MPANSet":
+        extra = other.cores[~_find(other.cores, self.cores)]
+        return self._wrap(_merge(self.cores, extra))
+
+    def intersection(self, other: "MPANSet") -> "MPANSet":
+        return self._wrap(self.cores[_find(self.cores, other.cores)])
+
+    def difference(self, other: "MPANSet") -> "MPANSet":
+        return self._wrap(self.cores[~_find(self.cores, other.cores)])
+
+    def symmetric_difference(self, other: "MPANSet") -> "MPANSet":
+        return self._wrap(
+            _merge(
+                self.cores[~_find(self.cores, other.cores)],
+                other.cores[~_find(other.cores, self.cores)],
+            )
+        )
+
+    def isin(self, values: Values) -> np.ndarray:
+        """
+        Whether each of `values` is in the set, as a boolean array.  Values
+        that aren't MPANs at all just aren't in it.
+        """
+
+        batch = Batch(values)
+        return batch.is_parseable & _find(_get_batch_cores(batch), self.cores)
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        The cores as an array of 13 character strings.
+        """
+        return np.char.zfill(self.cores.astype(str), 13)
+
+    @classmethod
+    def _wrap(cls, cores: np.ndarray) -> "MPANSet":
+        # For results that are already sorted and unique
+        result = cls.__new__(cls)
+        result.cores = cores
+        return result
+
+
+def _get_cores(values: Values) -> np.ndarray:
+    batch = Batch(values)
+
+    unparseable = np.flatnonzero(~batch.is_parseable)
+    if len(unparseable):
+        raise InvalidMPANError(
+            f"{batch.strings[unparseable[0]]!r} isn't an MPAN"
+        )
+
+    return _get_batch_cores(batch)
+
+
+def _get_batch_cores(batch: Batch) -> np.ndarray:
+    """
+    The core of each row as an integer, or -1 where there isn't one.
+    """
+
+    cores = batch.number(*FIELDS["core"])
+
+    # Rows with anything outside ASCII in them aren't in `digits`
+    for i in np.flatnonzero(batch.fallback & batch.is_parseable):
+        cores[i] = int(MPAN(batch.strings[i]).core)
+
+    return np.where(batch.is_parseable, cores, -1)
+
+
+def _find(needles: np.ndarray, haystack: np.ndarray) -> np.ndarray:
+    """
+    Whether each of `needles` is in the sorted array `haystack`.
+    """
+
+    if not len(haystack):
+        return np.zeros(len(needles), dtype=bool)
+
+    positions = np.searchsorted(haystack, needles)
+    return haystack[np.minimum(positions, len(haystack) - 1)] == needles
+
+
+def _merge(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Two sorted arrays with nothing in common, merged into one.  This looks
+    like sorting everything, but NumPy's stable sort for integers is a
+    Timsort, which finds the two sorted runs and merges them in one linear
+    pass.  That's quicker than placing `right` with `np.searchsorted()`,
+    whose random access into `left` is slow for big arrays.
+    """
+    return np.sort(np.concatenate((left, right)), kind="stable")
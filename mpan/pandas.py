@@ -0,0 +1,126 @@
+#
+# A `.mpan` accessor for pandas Series, so that a whole column of MPANs can be
+# parsed and enriched without building an `MPAN` for each row.  Importing this
+# module is what registers the accessor:
+#
+#   import mpan.pandas
+#
+#   df["valid"] = df["mpan"].mpan.is_valid
+#
+
+from datetime import date
+from typing import Any, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .bulk import FIELDS, Batch
+from .distributor import Distributor
+
+
+@pd.api.extensions.register_series_accessor("mpan")
+class MPANAccessor:
+    def __init__(self, series: pd.Series) -> None:
+        self._series = series
+        self._batch: Optional[Batch] = None
+
+    @property
+    def is_valid(self) -> pd.Series:
+        return self._wrap(self._get_batch().is_valid)
+
+    @property
+    def top_line(self) -> pd.Series:
+        return self._field("top_line")
+
+    @property
+    def profile_class(self) -> pd.Series:
+        return self._field("profile_class")
+
+    @property
+    def mtc(self) -> pd.Series:
+        return self._field("mtc")
+
+    @property
+    def llfc(self) -> pd.Series:
+        return self._field("llfc")
+
+    @property
+    def core(self) -> pd.Series:
+        return self._field("core")
+
+    @property
+    def distributor(self) -> pd.Series:
+        return self._field("distributor")
+
+    @property
+    def identifier(self) -> pd.Series:
+        return self._field("identifier")
+
+    @property
+    def checksum(self) -> pd.Series:
+        return self._field("checksum")
+
+    # Distributor properties
+
+    @property
+    def distributor_name(self) -> pd.Series:
+        return self._map_distributor(lambda d: d.name)
+
+    @property
+    def participant_id(self) -> pd.Series:
+        return self._map_distributor(lambda d: d.participant_id)
+
+    @property
+    def type(self) -> pd.Series:
+        return self._map_distributor(lambda d: d.type)
+
+    @property
+    def gsp_group_ids(self) -> pd.Series:
+        return self.get_gsp_group_ids()
+
+    def get_gsp_group_ids(self, as_of: Optional[date] = None) -> pd.Series:
+        """
+        The GSP groups of each row's distributor on `as_of` (which defaults to
+        today), as a tuple that's shared between rows with the same
+        distributor.
+        """
+        return self._map_distributor(
+            lambda d: tuple(d.get_gsp_group_ids(as_of))
+        )
+
+    def _get_batch(self) -> Batch:
+        if self._batch is None:
+            self._batch = Batch(self._series.to_numpy())
+        return self._batch
+
+    def _wrap(self, values: np.ndarray) -> pd.Series:
+        return pd.Series(
+            values, index=self._series.index, name=self._series.name
+        )
+
+    def _field(self, name: str) -> pd.Series:
+        """
+        Slice a field out of every row, with `None` where it's not present.
+        """
+        values = self._get_batch().field(*FIELDS[name])
+        return self._wrap(np.where(values == "", None, values.astype(object)))
+
+    def _map_distributor(self, function: Callable[[Distributor], Any]):
+        """
+        Apply `function` to the `Distributor` for each unique distributor in
+        the column, and spread the answers back out over the rows.  Rows with
+        no distributor, or one the function can't cope with, get `None`.
+        """
+
+        identifiers = self._get_batch().field(*FIELDS["distributor"])
+        unique, inverse = np.unique(identifiers, return_inverse=True)
+
+        answers = np.empty(len(unique), dtype=object)
+        for i, identifier in enumerate(unique.tolist()):
+            if identifier:
+                try:
+                    answers[i] = function(Distributor(identifier))
+                except KeyError:
+                    pass
+
+        return self._wrap(answers[inverse.ravel()])
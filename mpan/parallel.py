@@ -0,0 +1,77 @@
+import os
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from .helpers import is_valid
+
+
+def validate_many(
+    values: Iterable,
+    workers: Optional[int] = None,
+    chunksize: int = 10_000,
+) -> Iterator[bool]:
+    """
+    Validate a (potentially huge) iterable of MPANs across a pool of
+    `workers` processes, which defaults to one per core.  Yields one boolean
+    per value, in the same order as the input, with the same answers as
+    `mpan.helpers.is_valid()`.
+
+    Values are sent to the workers as lists of `chunksize` plain strings, and
+    come back as one byte per value.  Only a couple of chunks per worker are
+    in flight at any one time, so the input is consumed lazily and memory use
+    doesn't grow with its length.
+    """
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"workers should be at least 1, not {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize should be at least 1, not {chunksize}")
+
+    # Everything else is in a generator of its own, so that bad arguments
+    # are complained about straight away rather than on the first `next()`.
+    return _validate_many(_get_chunks(values, chunksize), workers)
+
+
+def _validate_many(
+    chunks: Iterator[List[str]], workers: int
+) -> Iterator[bool]:
+    if workers == 1:
+        for chunk in chunks:
+            yield from map(bool, validate_chunk(chunk))
+        return
+
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(validate_chunk, chunk))
+                if len(pending) >= workers * 2:
+                    yield from map(bool, pending.popleft().result())
+            while pending:
+                yield from map(bool, pending.popleft().result())
+        finally:
+            # If we've been abandoned part way through, there's no point in
+            # finishing work nobody is going to look at.
+            for future in pending:
+                future.cancel()
+
+
+def _get_chunks(values: Iterable, chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(values)
+    while chunk := [str(value) for value in islice(iterator, chunksize)]:
+        yield chunk
+
+
+def validate_chunk(chunk: List[str]) -> bytes:
+    """
+    Validate a list of strings, with one byte per value (1 if it's valid and
+    0 if it isn't) rather than a list of booleans, which is much quicker to
+    send back from another process.  This is what `validate_many()` and
+    `mpan.aio.validate_stream()` run in their workers.
+    """
+    return bytes(is_valid(raw) for raw in chunk)
@@ -0,0 +1,71 @@
+#
+# A hand-rolled replacement for matching against `MPAN.RE_SHORT` and then
+# `MPAN.RE_LONG`.  We know which of the two we're looking at from the length
+# alone, so there's no need to pay for a failed match first.
+#
+
+import re
+import string
+
+from .exceptions import InvalidMPANError
+
+
+SHORT_LENGTH = 13
+LONG_LENGTH = 21
+
+# Where the core starts in each kind of MPAN
+SHORT_OFFSET = 0
+LONG_OFFSET = LONG_LENGTH - SHORT_LENGTH
+
+# What a line loss factor class can be made of, in the order that
+# `mpan.generation` counts through them, and as a set for checking against
+LLFC_ALPHABET = string.ascii_uppercase + string.digits
+LLFC_CHARACTERS = frozenset(LLFC_ALPHABET)
+
+# These always match, as far as the characters are in the right places, so
+# the end of the match is where the first bad character is (or the end of the
+# MPAN, if there isn't one).  The alternatives for long MPANs go from the
+# longest match to the shortest, as the first one that matches wins.
+_SHORT_PREFIX = re.compile(r"\d{0,13}")
+_LONG_PREFIX = re.compile(
+    rf"\d{{5}}[{LLFC_ALPHABET}]{{3}}\d{{0,13}}|\d{{5}}[{LLFC_ALPHABET}]{{0,2}}"
+    r"|\d{0,5}"
+)
+
+
+def parse(raw: str) -> int:
+    """
+    Check that `raw` is shaped like an MPAN and return the position of the
+    core within it: `SHORT_OFFSET` or `LONG_OFFSET`.  Otherwise, raise an
+    `InvalidMPANError` pointing at the first character that's out of place.
+
+    Like `\\d` in the regular expressions we're replacing, digits can be any
+    Unicode decimal digit, and a single trailing newline is ignored.
+    """
+
+    length = len(raw)
+    if raw[-1:] == "\n":
+        length -= 1
+
+    if length == SHORT_LENGTH:
+        # Checking the whole thing at once is much quicker than matching, so
+        # we only look for the bad character if there is one.
+        if raw[:SHORT_LENGTH].isdecimal():
+            return SHORT_OFFSET
+        position = _SHORT_PREFIX.match(raw, 0, length).end()
+    elif length == LONG_LENGTH:
+        position = _LONG_PREFIX.match(raw, 0, length).end()
+        if position == length:
+            return LONG_OFFSET
+    else:
+        raise InvalidMPANError(
+            f"{raw} doesn't look like an MPAN: it should be "
+            f"{SHORT_LENGTH} or {LONG_LENGTH} characters long, not {length}"
+        )
+
+    error = InvalidMPANError(
+        f"{raw} doesn't look like an MPAN: unexpected character "
+        f"{raw[position]!r} at position {position}"
+    )
+    error.position = position
+    raise error
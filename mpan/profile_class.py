@@ -4,6 +4,8 @@ from .common import Subsection
 
 
 class ProfileClass(Subsection):
+    __slots__ = ("_is_valid", "_description")
+
     DESCRIPTIONS = {
         "00": "Half-hourly supply (import and export)",
         "01": "Domestic unrestricted",
@@ -30,11 +32,12 @@ class ProfileClass(Subsection):
 
     @property
     def is_valid(self) -> bool:
-        return self.identifier in self.DESCRIPTIONS
+        return self._is_valid
 
     @property
     def description(self) -> Optional[str]:
-        try:
-            return self.DESCRIPTIONS[self.identifier]
-        except KeyError:
-            return None
+        return self._description
+
+    def _precompute(self) -> None:
+        self._set("_is_valid", self.identifier in self.DESCRIPTIONS)
+        self._set("_description", self.DESCRIPTIONS.get(self.identifier))
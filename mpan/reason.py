@@ -0,0 +1,31 @@
+from enum import IntEnum
+
+
+class Reason(IntEnum):
+    """
+    Why an MPAN isn't valid, or `VALID` if it is.  When more than one thing
+    is wrong, the reason is the first check to fail, in this order.  These
+    are small integers so that a whole batch of them fits in a `uint8` array
+    (see `mpan.bulk.diagnose_many()`).
+    """
+
+    VALID = 0
+    BAD_FORMAT = 1
+    INVALID_PROFILE_CLASS = 2
+    INVALID_MTC = 3
+    UNKNOWN_DISTRIBUTOR = 4
+    CHECKSUM_MISMATCH = 5
+
+    @property
+    def description(self) -> str:
+        return DESCRIPTIONS[self]
+
+
+DESCRIPTIONS = {
+    Reason.VALID: "valid",
+    Reason.BAD_FORMAT: "unparseable",
+    Reason.INVALID_PROFILE_CLASS: "invalid profile class",
+    Reason.INVALID_MTC: "invalid meter time switch code",
+    Reason.UNKNOWN_DISTRIBUTOR: "invalid distributor",
+    Reason.CHECKSUM_MISMATCH: "bad checksum",
+}
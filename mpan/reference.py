@@ -0,0 +1,165 @@
+#
+# The reference data the library reads at runtime.  It's generated along with
+# `mpan.data` by `scripts/generate-databases.py`, but stored as compact JSON
+# in the shape the library actually needs, so that loading it is just a
+# `json.load()` with no dates to parse and no indexes to build:
+#
+#   version:          The format of the file, which is `VERSION`.
+#   distributors:     {identifier: {participant_id, name, type}}, where type
+#                     is "DNO" or "IDNO".
+#   participant_ids:  {participant_id: [distributor identifiers]}
+#   intervals:        {participant_id: [boundaries, groups]}, which is
+#                     `GSPGroupIndex.intervals`.
+#   gsp_group_intervals:
+#                     {gsp_group_id: [boundaries, participant ids]}, the same
+#                     index the other way round, for finding who was active
+#                     in a GSP group on a given date.
+#   mtcs:             {mtc: [[effective_from, effective_to, description,
+#                     register_count, settlement_type]]}, from the optional
+#                     industry MTC extract, oldest first, with ISO dates.
+#   llfcs:            {distributor: {llfc: [[effective_from, effective_to,
+#                     description]]}}, from the optional industry LLFC
+#                     extract, in the same way.
+#
+
+import json
+
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .distributor import Distributor
+from .gsp_group import GSPGroupIndex, Period
+
+
+VERSION = 5
+
+PATH = Path(__file__).parent / "reference.json"
+
+
+@lru_cache(maxsize=None)
+def load(path: Path = PATH) -> Dict[str, Any]:
+    """
+    The reference data in `path`, which is only read once.
+    """
+
+    with open(path) as f:
+        data = json.load(f)
+
+    if data.get("version") != VERSION:
+        raise ValueError(
+            f"{path} is version {data.get('version')} of the reference data, "
+            f"but this version of mpan only understands version {VERSION}"
+        )
+
+    return data
+
+
+def save(data: Dict[str, Any], path: Path = PATH) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, separators=(",", ":"), sort_keys=True)
+        f.write("\n")
+
+
+# What `MTCS` in `mpan.data` has for each period of a code: when it started
+# and stopped, its description, register count and settlement type.
+MTCRow = Tuple[date, Optional[date], str, int, str]
+
+# ...and what `LLFCS` has for each period of a distributor's line loss factor
+# class: when it started and stopped, and its description.
+LLFCRow = Tuple[date, Optional[date], str]
+
+
+def build(
+    id_lookup: Dict[str, Dict[str, str]],
+    gsp_ids: Dict[str, List[Tuple[str, Period]]],
+    mtcs: Optional[Dict[str, List[MTCRow]]] = None,
+    llfcs: Optional[Dict[str, Dict[str, List[LLFCRow]]]] = None,
+) -> Dict[str, Any]:
+    """
+    The reference data for an `ID_LOOKUP`, `GSP_IDS`, `MTCS` and `LLFCS` as
+    they appear in `mpan.data`.
+    """
+
+    distributors = {}
+    participant_ids: Dict[str, List[str]] = {}
+    for identifier, record in sorted(id_lookup.items()):
+        distributors[identifier] = {
+            "participant_id": record["id"],
+            "name": record["name"],
+            "type": Distributor(identifier).type,
+        }
+        participant_ids.setdefault(record["id"], []).append(identifier)
+
+    participants: Dict[str, List[Tuple[str, Period]]] = {}
+    for participant_id, rows in sorted(gsp_ids.items()):
+        for gsp_id, period in rows:
+            participants.setdefault(gsp_id, []).append(
+                (participant_id, period)
+            )
+
+    return {
+        "version": VERSION,
+        "distributors": distributors,
+        "participant_ids": participant_ids,
+        "intervals": GSPGroupIndex(gsp_ids).intervals,
+        "gsp_group_intervals": GSPGroupIndex(
+            {gsp_id: participants[gsp_id] for gsp_id in sorted(participants)}
+        ).intervals,
+        "mtcs": {
+            code: _get_rows(rows)
+            for code, rows in sorted((mtcs or {}).items())
+        },
+        "llfcs": {
+            distributor: {
+                llfc: _get_rows(rows) for llfc, rows in sorted(classes.items())
+            }
+            for distributor, classes in sorted((llfcs or {}).items())
+        },
+    }
+
+
+def get_mtcs(data: Dict[str, Any]) -> Dict[str, List[MTCRow]]:
+    """
+    The MTC extract in the reference data, in the same shape as `MTCS`.
+    """
+    return {code: _parse_rows(rows) for code, rows in data["mtcs"].items()}
+
+
+def get_llfcs(data: Dict[str, Any]) -> Dict[str, Dict[str, List[LLFCRow]]]:
+    """
+    The LLFC extract in the reference data, in the same shape as `LLFCS`.
+    """
+    return {
+        distributor: {
+            llfc: _parse_rows(rows) for llfc, rows in classes.items()
+        }
+        for distributor, classes in data["llfcs"].items()
+    }
+
+
+def _get_rows(rows: List[Tuple]) -> List[List]:
+    """
+    Rows from an extract, which start with the dates they're effective from
+    and to, sorted and ready for JSON.
+    """
+    return [
+        [started.isoformat(), _isoformat(stopped), *rest]
+        for started, stopped, *rest in sorted(rows)
+    ]
+
+
+def _parse_rows(rows: List[List]) -> List[Tuple]:
+    return [
+        (date.fromisoformat(started), _fromisoformat(stopped), *rest)
+        for started, stopped, *rest in rows
+    ]
+
+
+def _isoformat(value: Optional[date]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _fromisoformat(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
@@ -0,0 +1,172 @@
+#
+# Validating files with one MPAN per line, straight from a memory-mapped
+# buffer, so that there's no `str` per line and no `MPAN` per record.  This
+# requires NumPy, available via the optional extra `numpy`.
+#
+
+from collections import Counter
+from dataclasses import dataclass, field
+from os import PathLike
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from .bulk import FIELDS, Batch
+from .parser import LONG_LENGTH
+
+
+def _no_lines() -> np.ndarray:
+    return np.array([], dtype=np.int64)
+
+
+@dataclass
+class ScanResult:
+    """
+    What we found in a file.  Line numbers count from 1, and offsets are the
+    position in bytes of the start of the line.
+    """
+
+    lines: int = 0
+
+    # Every line that isn't a valid MPAN, including those that would raise an
+    # `InvalidMPANError`.
+    invalid_lines: np.ndarray = field(default_factory=_no_lines)
+    invalid_offsets: np.ndarray = field(default_factory=_no_lines)
+
+    # Just the lines that would raise an `InvalidMPANError`
+    unparseable_lines: np.ndarray = field(default_factory=_no_lines)
+
+    # How many valid MPANs there were for each distributor
+    distributors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def valid(self) -> int:
+        return self.lines - len(self.invalid_lines)
+
+
+def scan(path: Union[str, PathLike], window: int = 16 * 2**20) -> ScanResult:
+    """
+    Validate a file with one MPAN per line, reading it `window` bytes at a
+    time from a memory map.  Lines can end with either `\\n` or `\\r\\n`, and
+    each one gets the same answer as `MPAN(line).is_valid` would give.
+    """
+
+    result = ScanResult()
+    if not Path(path).stat().st_size:
+        return result
+
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+
+    invalid_lines: List[np.ndarray] = []
+    invalid_offsets: List[np.ndarray] = []
+    unparseable_lines: List[np.ndarray] = []
+    distributors: Counter = Counter()
+
+    start = 0
+    while start < len(buffer):
+        stop = _find_window_end(buffer, start, window)
+
+        chunk = buffer[start:stop]
+        starts, ends = _find_lines(chunk)
+        codes = _gather(chunk, starts, ends)
+
+        # Anything longer than we gathered is too long to be an MPAN, and
+        # saying it's one byte longer is enough for `Batch` to see that.
+        lengths = np.minimum(ends - starts, codes.shape[1])
+
+        batch = Batch.from_codes(codes, lengths, _Lines(chunk, starts, ends))
+
+        is_valid = batch.is_valid
+        numbers = result.lines + 1 + np.arange(len(batch))
+
+        invalid_lines.append(numbers[~is_valid])
+        invalid_offsets.append(start + starts[~is_valid])
+        unparseable_lines.append(numbers[~batch.is_parseable])
+
+        identifiers, counts = np.unique(
+            batch.field(*FIELDS["distributor"])[is_valid], return_counts=True
+        )
+        distributors.update(dict(zip(identifiers.tolist(), counts.tolist())))
+
+        result.lines += len(batch)
+        start = stop
+
+    result.invalid_lines = np.concatenate(invalid_lines)
+    result.invalid_offsets = np.concatenate(invalid_offsets)
+    result.unparseable_lines = np.concatenate(unparseable_lines)
+    result.distributors = dict(sorted(distributors.items()))
+
+    return result
+
+
+class _Lines:
+    """
+    The lines of a buffer, decoded on demand, for the few rows `Batch` can't
+    deal with itself.
+    """
+
+    def __init__(self, buffer: np.ndarray, starts: np.ndarray, ends):
+        self.buffer = buffer
+        self.starts = starts
+        self.ends = ends
+
+    def __getitem__(self, i: int) -> str:
+        start, end = self.starts[i], self.ends[i]
+        return self.buffer[start:end].tobytes().decode("utf-8", "replace")
+
+
+def _find_window_end(buffer: np.ndarray, start: int, window: int) -> int:
+    """
+    Where the window starting at `start` should end: just after the last
+    newline in it, so that no line is split across two windows.  If there's
+    no newline in there at all, we keep looking until there is.
+    """
+
+    stop = min(start + window, len(buffer))
+    while stop < len(buffer):
+        newlines = np.flatnonzero(buffer[start:stop] == 10)
+        if len(newlines):
+            return start + newlines[-1] + 1
+        stop = min(stop + window, len(buffer))
+
+    return stop
+
+
+def _find_lines(chunk: np.ndarray):
+    """
+    The start and end of every line in `chunk`, with the end excluding the
+    line break.
+    """
+
+    newlines = np.flatnonzero(chunk == 10)
+
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(chunk)]))
+
+    # A line break at the very end doesn't start another line
+    if starts[-1] == len(chunk):
+        starts, ends = starts[:-1], ends[:-1]
+
+    # Nor is a carriage return before it part of the line
+    carriage_return = (ends > starts) & (chunk[np.maximum(ends - 1, 0)] == 13)
+    ends = ends - carriage_return
+
+    return starts, ends
+
+
+def _gather(chunk: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """
+    Copy the first few bytes of each line into a matrix with a row per line,
+    one column at a time to keep the intermediate arrays small.
+    """
+
+    width = LONG_LENGTH + 1
+    lengths = ends - starts
+
+    codes = np.zeros((len(starts), width), dtype=np.uint8)
+    for column in range(width):
+        present = lengths > column
+        codes[present, column] = chunk[starts[present] + column]
+
+    return codes
@@ -10,10 +10,22 @@ from pathlib import Path
 from subprocess import run
 
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mpan import data, reference  # NOQA: E402
+
+
 class Command:
     """
     To make updating the internal database easier and less error-prone, we use
-    this script to generate `mpan/data.py` based on an industry CSV.
+    this script to generate `mpan/data.py` based on an industry CSV, along
+    with `mpan/reference.json`, which is what the library actually reads.
+
+    Extracts of the industry's meter time switch codes and line loss factor
+    classes can be included with `--mtcs` and `--llfcs`, otherwise we keep
+    whatever we had before.
+
+    Before writing anything, we print what's changed since the last time.
     """
 
     TARGET = (Path(__file__).parent / ".." / "mpan" / "data.py").absolute()
@@ -73,6 +85,29 @@ class Command:
                 "GSP_Group_Distributor_nnn.csv file."
             ),
         )
+        self.parser.add_argument(
+            "--mtcs",
+            type=self._ensure_is_file,
+            help=(
+                "The path to a CSV extract of meter time switch codes, with "
+                "a header and the columns: code, effective from, effective "
+                "to, description, register count and settlement type."
+            ),
+        )
+        self.parser.add_argument(
+            "--llfcs",
+            type=self._ensure_is_file,
+            help=(
+                "The path to a CSV extract of line loss factor classes, with "
+                "a header and the columns: distributor, class, effective "
+                "from, effective to and description."
+            ),
+        )
+        self.parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Just report what's changed, without writing anything.",
+        )
         self.args = self.parser.parse_args()
 
     def __call__(self, *args, **kwargs) -> int:
@@ -90,15 +125,121 @@ class Command:
 
                 db[row[1]].append((gsp_id, (started, stopped)))
 
+        # What we had before comes from `mpan/data.py` rather than
+        # `mpan/reference.json`, which `reference.load()` refuses to read
+        # once `reference.VERSION` has been bumped, and that's exactly when
+        # it needs regenerating.
+        mtcs = data.MTCS
+        if self.args.mtcs:
+            mtcs = self.read_mtcs(self.args.mtcs)
+
+        llfcs = data.LLFCS
+        if self.args.llfcs:
+            llfcs = self.read_llfcs(self.args.llfcs)
+
+        self.report(data.GSP_IDS, db)
+        print(f"{sum(map(len, mtcs.values()))} MTC record(s)")
+        print(
+            f"{sum(len(rows) for c in llfcs.values() for rows in c.values())} "
+            f"LLFC record(s)"
+        )
+        if self.args.dry_run:
+            return 0
+
+        reference.save(reference.build(self.ID_LOOKUP, db, mtcs, llfcs))
+
         with self.TARGET.open("w") as f:
             f.write("import datetime\n\n\n")
             f.write("ID_LOOKUP = " + repr(self.ID_LOOKUP) + "\n\n")
-            f.write("GSP_IDS = " + repr(dict(db)))
+            f.write("GSP_IDS = " + repr(dict(db)) + "\n\n")
+            f.write("MTCS = " + repr(mtcs) + "\n\n")
+            f.write("LLFCS = " + repr(llfcs))
 
         run(("black", "--quiet", self.TARGET))
 
         return 0
 
+    @staticmethod
+    def read_mtcs(path: Path):
+        mtcs = defaultdict(list)
+        with path.open() as f:
+            reader = csv.reader(f)
+            next(reader)  # Skip the header
+
+            for row in reader:
+                code, started, stopped, description, registers, kind = row
+                mtcs[f"{int(code):03}"].append(
+                    (
+                        datetime.strptime(started, "%d/%m/%Y").date(),
+                        datetime.strptime(stopped, "%d/%m/%Y").date()
+                        if stopped
+                        else None,
+                        description,
+                        int(registers),
+                        kind,
+                    )
+                )
+
+        return {code: sorted(rows) for code, rows in sorted(mtcs.items())}
+
+    @staticmethod
+    def read_llfcs(path: Path):
+        llfcs = defaultdict(lambda: defaultdict(list))
+        with path.open() as f:
+            reader = csv.reader(f)
+            next(reader)  # Skip the header
+
+            for row in reader:
+                distributor, llfc, started, stopped, description = row
+                llfcs[f"{int(distributor):02}"][llfc.upper()].append(
+                    (
+                        datetime.strptime(started, "%d/%m/%Y").date(),
+                        datetime.strptime(stopped, "%d/%m/%Y").date()
+                        if stopped
+                        else None,
+                        description,
+                    )
+                )
+
+        return {
+            distributor: {
+                llfc: sorted(rows) for llfc, rows in sorted(classes.items())
+            }
+            for distributor, classes in sorted(llfcs.items())
+        }
+
+    @staticmethod
+    def report(old, new) -> None:
+        """
+        Print the rows that have been added, removed, or had their stop date
+        changed between two versions of `GSP_IDS`.
+        """
+
+        def get_rows(db):
+            return {
+                (participant_id, gsp_id, started): stopped
+                for participant_id, periods in db.items()
+                for gsp_id, (started, stopped) in periods
+            }
+
+        before, after = get_rows(old), get_rows(new)
+
+        changes = 0
+        for key in sorted(before.keys() | after.keys()):
+            participant_id, gsp_id, started = key
+            row = f"{participant_id} {gsp_id} from {started}"
+            if key not in before:
+                print(f"+ {row} until {after[key]}")
+            elif key not in after:
+                print(f"- {row} until {before[key]}")
+            elif before[key] != after[key]:
+                print(f"~ {row} until {before[key]} -> {after[key]}")
+            else:
+                continue
+            changes += 1
+
+        print(f"{changes} change(s)")
+
     @staticmethod
     def _ensure_is_file(path: str) -> Path:
         path = Path(path)
@@ -1,3 +1,12 @@
+import datetime
+
+from contextlib import contextmanager
+from unittest import mock
+
+from mpan import line_loss_factor_class, meter_time_switch_code
+from mpan.reference import build
+
+
 # These can't be handled at all by the library
 UNPARSEABLE = (
     "Not an MPAN",
@@ -27,3 +36,69 @@ VALID = (
     "01947QUY1525379938096",
     "04962VE42544886475542",
 )
+
+# A bit of everything, including things that aren't strings, along with
+# whether each of them is valid.
+MIXED = VALID + INVALID + UNPARSEABLE + (2499999999991, None)
+MIXED_VALIDITY = (
+    (True,) * len(VALID)
+    + (False,) * (len(INVALID) + len(UNPARSEABLE))
+    + (True, False)
+)
+
+
+# A made up extract of meter time switch codes, as `MTCS` would be in
+# `mpan.data` if it had been generated with one.
+MTCS = {
+    "001": [
+        (
+            datetime.date(1996, 4, 1),
+            datetime.date(2010, 3, 31),
+            "Old single rate",
+            1,
+            "NHH",
+        ),
+        (datetime.date(2010, 4, 1), None, "Single rate", 1, "NHH"),
+    ],
+    "845": [(datetime.date(2000, 4, 1), None, "Half hourly", 0, "HH")],
+}
+
+# ...and of line loss factor classes, for `LLFCS`
+LLFCS = {
+    "10": {
+        "A01": [(datetime.date(2010, 4, 1), None, "Domestic")],
+        "A02": [
+            (
+                datetime.date(2010, 4, 1),
+                datetime.date(2015, 3, 31),
+                "Domestic, two rate",
+            ),
+        ],
+    },
+    "24": {"001": [(datetime.date(2000, 1, 1), None, "Unmetered")]},
+}
+
+
+@contextmanager
+def extracts(mtcs=MTCS, llfcs=LLFCS):
+    """
+    Pretend the reference data was generated with these extracts.
+    """
+
+    caches = (
+        meter_time_switch_code._get_extract,
+        line_loss_factor_class._get_extract,
+    )
+
+    data = build({}, {}, mtcs, llfcs)
+    with mock.patch("mpan.reference.load", return_value=data):
+        with mock.patch.object(
+            meter_time_switch_code.MeterTimeSwitchCode, "_instances", {}
+        ):
+            for cache in caches:
+                cache.cache_clear()
+            try:
+                yield
+            finally:
+                for cache in caches:
+                    cache.cache_clear()
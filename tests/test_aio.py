@@ -0,0 +1,140 @@
+import asyncio
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event
+from unittest import IsolatedAsyncioTestCase
+
+from mpan.aio import validate_stream
+
+from .common import MIXED, MIXED_VALIDITY, VALID
+
+
+async def stream(values, delay=0):
+    for value in values:
+        if delay:
+            await asyncio.sleep(delay)
+        yield value
+
+
+class ValidateStreamTestCase(IsolatedAsyncioTestCase):
+    async def collect(self, *args, **kwargs):
+        return [result async for result in validate_stream(*args, **kwargs)]
+
+    async def test_validate_stream(self):
+        results = await self.collect(stream(MIXED), batch_size=3)
+        self.assertEqual(results, list(zip(map(str, MIXED), MIXED_VALIDITY)))
+
+    async def test_plain_iterable(self):
+        results = await self.collect(MIXED, batch_size=3)
+        self.assertEqual(tuple(valid for _, valid in results), MIXED_VALIDITY)
+
+    async def test_executor(self):
+        with ThreadPoolExecutor(2) as executor:
+            results = await self.collect(
+                stream(MIXED * 10),
+                executor=executor,
+                batch_size=4,
+                inline_below=0,
+                max_in_flight=2,
+            )
+        self.assertEqual(
+            tuple(valid for _, valid in results), MIXED_VALIDITY * 10
+        )
+
+    async def test_process_executor(self):
+        with ProcessPoolExecutor(2) as executor:
+            results = await self.collect(
+                MIXED * 10, executor=executor, batch_size=7, inline_below=5
+            )
+        self.assertEqual(
+            tuple(valid for _, valid in results), MIXED_VALIDITY * 10
+        )
+
+    async def test_slow_source(self):
+        with ThreadPoolExecutor(1) as executor:
+            results = await self.collect(
+                stream(VALID, delay=0.01),
+                executor=executor,
+                batch_size=1,
+                inline_below=0,
+            )
+        self.assertEqual(results, [(value, True) for value in VALID])
+
+    async def test_empty(self):
+        self.assertEqual(await self.collect(stream([])), [])
+
+    async def test_max_wait(self):
+        # The first value shouldn't have to wait for the second, which is a
+        # long time coming.
+        async def trickle():
+            yield VALID[0]
+            await asyncio.sleep(10)
+            yield VALID[1]
+
+        results = validate_stream(trickle(), max_wait=0.01, inline_below=0)
+        first = await asyncio.wait_for(results.__anext__(), 2)
+        self.assertEqual(first, (VALID[0], True))
+        await results.aclose()
+
+    async def test_backpressure(self):
+        read = []
+
+        async def source():
+            for value in VALID * 100:
+                read.append(value)
+                yield value
+
+        results = validate_stream(source(), batch_size=10, max_in_flight=2)
+        await results.__anext__()
+        await asyncio.sleep(0.05)
+
+        # At most the batches in flight, the one being gathered and a queue
+        # of one more batch's worth.
+        self.assertLessEqual(len(read), 10 * 5)
+        await results.aclose()
+
+    async def test_source_error(self):
+        async def broken():
+            yield VALID[0]
+            raise ValueError("Oops")
+
+        with self.assertRaisesRegex(ValueError, "Oops"):
+            await self.collect(broken())
+
+    async def test_abandoned(self):
+        with ThreadPoolExecutor(1) as executor:
+            results = validate_stream(
+                stream(VALID * 100),
+                executor=executor,
+                batch_size=1,
+                inline_below=0,
+            )
+            self.assertEqual(await results.__anext__(), (VALID[0], True))
+            await results.aclose()
+
+    async def test_cancelled(self):
+        # Hold up the executor so that batches pile up waiting for it
+        started = Event()
+        release = Event()
+
+        def block():
+            started.set()
+            release.wait()
+
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(block)
+            started.wait()
+
+            results = validate_stream(
+                stream(VALID * 10),
+                executor=executor,
+                batch_size=1,
+                inline_below=0,
+                max_in_flight=3,
+            )
+            task = asyncio.ensure_future(results.__anext__())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            release.set()
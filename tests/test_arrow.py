@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+import pyarrow as pa
+
+from mpan.arrow import decode_record_batch
+from mpan.bulk import decode
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class DecodeRecordBatchTestCase(TestCase):
+    def test_decode_record_batch(self):
+        values = VALID + INVALID + UNPARSEABLE
+        batch = decode_record_batch(values)
+        decoded = decode(values)
+
+        self.assertIsInstance(batch, pa.RecordBatch)
+        self.assertEqual(batch.schema.names, list(decoded.dtype.names))
+        self.assertEqual(batch.num_rows, len(values))
+
+        for name in batch.schema.names:
+            with self.subTest(name=name):
+                self.assertEqual(
+                    batch.column(name).to_pylist(),
+                    [value or None for value in decoded[name].tolist()]
+                    if decoded.dtype[name].kind == "U"
+                    else decoded[name].tolist(),
+                )
+
+    def test_types(self):
+        batch = decode_record_batch(VALID)
+        self.assertEqual(batch.schema.field("core").type, pa.string())
+        self.assertEqual(batch.schema.field("is_valid").type, pa.bool_())
@@ -0,0 +1,381 @@
+from datetime import date
+from unittest import TestCase
+
+import numpy as np
+
+from mpan.bulk import (
+    DECODED,
+    FIELDS,
+    MTC_DESCRIBED,
+    PACKED_DTYPE,
+    _get_llfc_table,
+    _get_mtc_table,
+    decode,
+    describe_mtcs,
+    diagnose_many,
+    is_llfc_valid,
+    is_valid,
+    pack_many,
+    unpack_many,
+)
+from mpan.exceptions import InvalidMPANError
+from mpan.helpers import diagnose, is_valid as scalar_is_valid
+from mpan.line_loss_factor_class import LineLossFactorClass
+from mpan.meter_time_switch_code import MeterTimeSwitchCode
+from mpan.mpan import MPAN
+from mpan.reason import Reason
+
+from .common import INVALID, UNPARSEABLE, VALID, extracts
+
+
+class IsValidTestCase(TestCase):
+    def assertMatchesScalar(self, values):
+        expected = [scalar_is_valid(value) for value in values]
+        self.assertEqual(is_valid(values).tolist(), expected)
+
+    def test_is_valid(self):
+        result = is_valid(VALID)
+        self.assertEqual(result.dtype, bool)
+        self.assertTrue(result.all())
+
+    def test_is_valid_fail(self):
+        self.assertFalse(is_valid(INVALID).any())
+        self.assertFalse(is_valid(UNPARSEABLE).any())
+
+    def test_short(self):
+        self.assertMatchesScalar([s[8:] for s in VALID + INVALID])
+
+    def test_mixed(self):
+        self.assertMatchesScalar(VALID + INVALID + UNPARSEABLE)
+
+    def test_bytes(self):
+        values = np.array([s.encode() for s in VALID + INVALID])
+        self.assertEqual(
+            is_valid(values).tolist(), [True] * len(VALID) + [False] * 4
+        )
+
+    def test_numpy_strings(self):
+        self.assertTrue(is_valid(np.array(VALID)).all())
+
+    def test_generator(self):
+        self.assertTrue(is_valid(s for s in VALID).all())
+
+    def test_foreign_objects(self):
+        self.assertMatchesScalar([None, 2499999999991, 42, MPAN(VALID[0])])
+        self.assertMatchesScalar(np.array([2499999999991, 2499999999990]))
+        self.assertMatchesScalar(["2499999999991\x00", 2499999999991])
+
+    def test_empty(self):
+        self.assertEqual(is_valid([]).tolist(), [])
+        self.assertEqual(is_valid(np.array([], dtype="S1")).tolist(), [])
+        self.assertMatchesScalar(["", "", ""])
+
+    def test_trailing_newline(self):
+        self.assertMatchesScalar(
+            [
+                "2499999999991\n",
+                "2499999999991\n\n",
+                "2499999999991\r\n",
+                "2499999999991\x00",
+                VALID[0] + "\n",
+                "\n",
+            ]
+        )
+
+    def test_lowercase_llfc(self):
+        self.assertMatchesScalar(["069238i51470116845051"])
+
+    def test_unicode_digits(self):
+        self.assertMatchesScalar(
+            [
+                "24٩٩٩٩٩٩٩٩٩٩1",
+                "24٩٩٩٩٩٩٩٩٩٩0",
+                "069238I51470116845051",
+                "²499999999991",
+            ]
+        )
+
+    def test_chunksize(self):
+        values = VALID + INVALID + UNPARSEABLE
+        self.assertEqual(
+            is_valid(values, chunksize=3).tolist(),
+            is_valid(values).tolist(),
+        )
+
+    def test_single_substitutions(self):
+        # Every possible character at every position of a valid long and a
+        # valid short MPAN.
+        for original in (VALID[0], VALID[0][8:]):
+            values = []
+            for i, _ in enumerate(original):
+                for c in "0123456789AZ a":
+                    values.append(original[:i] + c + original[i:][1:])
+            with self.subTest(original=original):
+                self.assertMatchesScalar(values)
+
+
+class DiagnoseManyTestCase(TestCase):
+    def assertMatchesScalar(self, values):
+        expected = [diagnose(value) for value in values]
+        self.assertEqual(diagnose_many(values).tolist(), expected)
+
+    def test_diagnose_many(self):
+        values = VALID + INVALID + UNPARSEABLE
+        result = diagnose_many(values)
+        self.assertEqual(result.dtype, np.uint8)
+        self.assertEqual(
+            result.tolist(),
+            [Reason.VALID] * len(VALID)
+            + [
+                Reason.CHECKSUM_MISMATCH,
+                Reason.UNKNOWN_DISTRIBUTOR,
+                Reason.INVALID_PROFILE_CLASS,
+                Reason.INVALID_MTC,
+            ]
+            + [Reason.BAD_FORMAT] * len(UNPARSEABLE),
+        )
+
+    def test_first_failure_wins(self):
+        # A bad profile class, MTC, distributor and checksum all at once
+        self.assertEqual(
+            diagnose_many(["990000008699999999990"]).tolist(),
+            [Reason.INVALID_PROFILE_CLASS],
+        )
+        self.assertEqual(
+            diagnose_many(["000000008699999999990"]).tolist(),
+            [Reason.INVALID_MTC],
+        )
+
+    def test_matches_is_valid(self):
+        values = VALID + INVALID + UNPARSEABLE
+        self.assertEqual(
+            (diagnose_many(values) == Reason.VALID).tolist(),
+            is_valid(values).tolist(),
+        )
+
+    def test_unicode_digits(self):
+        self.assertMatchesScalar(
+            ["24٩٩٩٩٩٩٩٩٩٩1", "24٩٩٩٩٩٩٩٩٩٩0", "²499999999991"]
+        )
+
+    def test_empty(self):
+        self.assertEqual(diagnose_many([]).shape, (0,))
+
+    def test_chunksize(self):
+        values = VALID + INVALID + UNPARSEABLE
+        self.assertEqual(
+            diagnose_many(values, chunksize=3).tolist(),
+            diagnose_many(values).tolist(),
+        )
+
+    def test_single_substitutions(self):
+        for original in (VALID[0], VALID[0][8:]):
+            values = []
+            for i, _ in enumerate(original):
+                for c in "0123456789AZ a":
+                    values.append(original[:i] + c + original[i:][1:])
+            with self.subTest(original=original):
+                self.assertMatchesScalar(values)
+
+
+class DecodeTestCase(TestCase):
+    def test_decode(self):
+        values = (
+            VALID
+            + INVALID
+            + UNPARSEABLE
+            + ("24٩٩٩٩٩٩٩٩٩٩1\n", "2499999999991\x00")
+        )
+        decoded = decode(values)
+
+        self.assertEqual(decoded.dtype, DECODED)
+        self.assertEqual(len(decoded), len(values))
+
+        for value, row in zip(values, decoded):
+            with self.subTest(value=value):
+                try:
+                    mpan = MPAN(value)
+                except InvalidMPANError:
+                    self.assertEqual(set(row.tolist()), {"", False})
+                    continue
+
+                for name in FIELDS:
+                    expected = getattr(mpan, name)
+                    self.assertEqual(
+                        row[name], "" if expected is None else str(expected)
+                    )
+                self.assertEqual(row["is_long"], mpan.is_long)
+                self.assertEqual(row["is_valid"], mpan.is_valid)
+
+    def test_empty(self):
+        self.assertEqual(decode([]).shape, (0,))
+
+
+class DescribeMTCsTestCase(TestCase):
+    def setUp(self):
+        _get_mtc_table.cache_clear()
+
+    def tearDown(self):
+        _get_mtc_table.cache_clear()
+
+    def test_describe_mtcs(self):
+        codes = ["001", "404", "000", "1000", "-1", "test", "", "٠٠١"]
+        result = describe_mtcs(codes)
+        self.assertEqual(result.dtype, MTC_DESCRIBED)
+        for code, row in zip(codes, result):
+            with self.subTest(code=code):
+                mtc = MeterTimeSwitchCode(code)
+                self.assertEqual(row["is_valid"], mtc.is_valid)
+                self.assertEqual(row["description"], mtc.description)
+                self.assertEqual(row["register_count"], -1)
+                self.assertIsNone(row["settlement_type"])
+
+    def test_integers(self):
+        result = describe_mtcs(np.array([1, 404, 0, 1000, -1]))
+        self.assertEqual(
+            result["is_valid"].tolist(), [True, True, False, False, False]
+        )
+        self.assertEqual(
+            result["description"].tolist(),
+            ["DNO specific", "Reserved", None, None, None],
+        )
+
+    def test_every_code(self):
+        codes = np.arange(1000)
+        self.assertEqual(
+            describe_mtcs(codes)["description"].tolist(),
+            [MeterTimeSwitchCode(f"{i:03}").description for i in codes],
+        )
+
+    def test_empty(self):
+        self.assertEqual(len(describe_mtcs([])), 0)
+
+    def test_extract(self):
+        with extracts():
+            result = describe_mtcs(
+                ["001", "845", "002"], as_of=date(2005, 1, 1)
+            )
+        self.assertEqual(
+            result.tolist(),
+            [
+                (True, "Old single rate", 1, "NHH"),
+                (True, "Half hourly", 0, "HH"),
+                (True, "DNO specific", -1, None),
+            ],
+        )
+
+
+class IsLLFCValidTestCase(TestCase):
+    VALUES = [
+        "01801A01109999999999",
+        "01801A011099999999992",
+        "01801A021099999999992",
+        "01801A012499999999991",
+        "018010012499999999991",
+        "01801A011199999999992",
+        "2499999999991",
+        "Not an MPAN",
+        "01801A01١٠99999999992",  # Handled by MPAN instead
+        "١٠99999999992",
+    ]
+
+    def setUp(self):
+        _get_llfc_table.cache_clear()
+
+    def tearDown(self):
+        _get_llfc_table.cache_clear()
+
+    def scalar(self, value, as_of):
+        try:
+            mpan = MPAN(value)
+        except InvalidMPANError:
+            return False
+        if mpan.is_short:
+            return True
+        return mpan.line_loss_factor_class_info.is_valid_for(
+            mpan.distributor, as_of
+        )
+
+    def test_no_extract(self):
+        self.assertEqual(
+            is_llfc_valid(self.VALUES).tolist(),
+            [False, True, True, True, True, True, True, False, True, True],
+        )
+
+    def test_extract(self):
+        for as_of in (date(2000, 1, 1), date(2012, 1, 1), date(2020, 1, 1)):
+            with self.subTest(as_of=as_of), extracts():
+                self.assertEqual(
+                    is_llfc_valid(self.VALUES, as_of).tolist(),
+                    [self.scalar(value, as_of) for value in self.VALUES],
+                )
+
+    def test_every_class(self):
+        llfcs = [f"{i:03}" for i in range(1000)] + ["A01", "A02", "ZZZ"]
+        values = [f"01801{llfc}1099999999992" for llfc in llfcs]
+        with extracts():
+            expected = [
+                LineLossFactorClass(llfc).is_valid_for("10", date(2012, 1, 1))
+                for llfc in llfcs
+            ]
+            result = is_llfc_valid(values, as_of=date(2012, 1, 1))
+        self.assertEqual(result.tolist(), expected)
+        self.assertEqual(sum(expected), 2)
+
+
+class PackTestCase(TestCase):
+    MPANS = (
+        VALID
+        + INVALID
+        + tuple(mpan[8:] for mpan in VALID)
+        + ("00000000" + "0000000000000", "99999ZZZ" + "9999999999999")
+    )
+
+    def test_pack_many(self):
+        packed = pack_many(self.MPANS)
+        self.assertEqual(packed.dtype, PACKED_DTYPE)
+        self.assertEqual(
+            packed.tobytes(), b"".join(MPAN(m).pack() for m in self.MPANS)
+        )
+
+    def test_bytes(self):
+        values = np.array([mpan.encode() for mpan in self.MPANS])
+        self.assertEqual(
+            pack_many(values).tobytes(), pack_many(self.MPANS).tobytes()
+        )
+
+    def test_non_canonical(self):
+        for value in ("2499999999991\n", "٢٤٩٩٩٩٩٩٩٩٩٩١", "Not an MPAN"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    pack_many([VALID[0], value])
+
+    def test_unpack_many(self):
+        packed = pack_many(self.MPANS)
+        self.assertEqual(unpack_many(packed).tolist(), list(self.MPANS))
+        self.assertEqual(
+            unpack_many(packed.tobytes()).tolist(), list(self.MPANS)
+        )
+
+    def test_unpack_invalid(self):
+        top_line = (MPAN.MAX_TOP_LINE + 1).to_bytes(8, "big")
+        for packed in (
+            bytes(17),
+            (10**13).to_bytes(8, "big") + bytes(8),
+            bytes(8) + top_line,
+        ):
+            with self.subTest(packed=packed):
+                with self.assertRaises(ValueError):
+                    unpack_many(packed)
+
+    def test_empty(self):
+        self.assertEqual(len(pack_many([])), 0)
+        self.assertEqual(unpack_many(b"").tolist(), [])
+
+    def test_sorting(self):
+        # Sorting packed MPANs sorts them by core, then top line
+        packed = np.sort(pack_many(self.MPANS))
+        self.assertEqual(
+            unpack_many(packed).tolist(),
+            [str(m) for m in sorted(MPAN(m) for m in self.MPANS)],
+        )
@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+import numpy as np
+
+from mpan.checksum import (
+    PRIMES,
+    TABLE,
+    calculate,
+    calculate_int,
+    calculate_many,
+    verify,
+    verify_int,
+)
+
+from .common import VALID
+
+
+CORES = tuple(mpan[8:] for mpan in VALID) + ("2499999999991",)
+
+
+def slow(digits):
+    """
+    The checksum as it's described, for comparison.
+    """
+    pairs = zip(PRIMES, digits)
+    return sum(prime * int(digit) for prime, digit in pairs) % 11 % 10
+
+
+class ChecksumTestCase(TestCase):
+    def test_table(self):
+        self.assertEqual(len(TABLE), 12)
+        for prime, row in zip(PRIMES, TABLE):
+            self.assertEqual(row, tuple(prime * d % 11 for d in range(10)))
+
+    def test_calculate(self):
+        for core in CORES:
+            with self.subTest(core=core):
+                self.assertEqual(calculate(core), int(core[-1]))
+                self.assertEqual(calculate(core[:12]), int(core[-1]))
+                self.assertEqual(calculate(core.encode()), int(core[-1]))
+
+    def test_calculate_everything(self):
+        for position in range(12):
+            for digit in range(10):
+                digits = "0" * position + str(digit) + "9" * (11 - position)
+                with self.subTest(digits=digits):
+                    self.assertEqual(calculate(digits), slow(digits))
+
+    def test_calculate_unicode_digits(self):
+        self.assertEqual(calculate("24٩٩٩٩٩٩٩٩٩٩"), 1)
+
+    def test_calculate_bad_input(self):
+        for digits in ("", "24999999999", "24999999999X", b"24999999999 "):
+            with self.subTest(digits=digits):
+                with self.assertRaises(ValueError):
+                    calculate(digits)
+
+    def test_verify(self):
+        for core in CORES:
+            with self.subTest(core=core):
+                self.assertTrue(verify(core))
+                self.assertTrue(verify(core.encode()))
+        self.assertFalse(verify("2499999999990"))
+        self.assertFalse(verify(b"2499999999990"))
+        self.assertFalse(verify("249999999999"))
+        self.assertFalse(verify(b"249999999999"))
+        self.assertFalse(verify(""))
+
+    def test_calculate_int(self):
+        for core in CORES:
+            with self.subTest(core=core):
+                self.assertEqual(calculate_int(int(core[:12])), int(core[-1]))
+        self.assertEqual(calculate_int(123), slow("000000000123"))
+        for digits in (-1, 10**12):
+            with self.subTest(digits=digits):
+                with self.assertRaises(ValueError):
+                    calculate_int(digits)
+
+    def test_verify_int(self):
+        for core in CORES:
+            with self.subTest(core=core):
+                self.assertTrue(verify_int(int(core)))
+        self.assertFalse(verify_int(2499999999990))
+        self.assertFalse(verify_int(-1))
+        self.assertFalse(verify_int(10**13))
+
+    def test_calculate_many(self):
+        digits = np.array([[int(d) for d in core] for core in CORES])
+        self.assertEqual(
+            calculate_many(digits).tolist(), [int(c[-1]) for c in CORES]
+        )
+        self.assertEqual(
+            calculate_many(digits[:, :12]).tolist(),
+            [int(c[-1]) for c in CORES],
+        )
+
+    def test_calculate_many_random(self):
+        digits = np.random.default_rng(0).integers(0, 10, (1000, 12))
+        expected = [slow(row) for row in digits.tolist()]
+        self.assertEqual(calculate_many(digits).tolist(), expected)
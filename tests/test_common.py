@@ -0,0 +1,52 @@
+import copy
+import pickle
+
+from unittest import TestCase, mock
+
+from mpan.distributor import Distributor
+from mpan.meter_time_switch_code import MeterTimeSwitchCode
+from mpan.profile_class import ProfileClass
+
+
+class SubsectionTestCase(TestCase):
+    CLASSES = (
+        (Distributor, "12"),
+        (MeterTimeSwitchCode, "801"),
+        (ProfileClass, "01"),
+    )
+
+    def test_interned(self):
+        for cls, identifier in self.CLASSES:
+            with self.subTest(cls=cls):
+                self.assertIs(cls(identifier), cls(identifier))
+                self.assertIs(cls(identifier), cls(identifier=identifier))
+
+    def test_interned_per_class(self):
+        self.assertIsInstance(Distributor("01"), Distributor)
+        self.assertIsInstance(ProfileClass("01"), ProfileClass)
+
+    def test_immutable(self):
+        for cls, identifier in self.CLASSES:
+            instance = cls(identifier)
+            with self.subTest(cls=cls):
+                with self.assertRaises(AttributeError):
+                    instance.identifier = "99"
+                with self.assertRaises(AttributeError):
+                    del instance.identifier
+                self.assertEqual(instance.identifier, identifier)
+
+    def test_pickle(self):
+        for cls, identifier in self.CLASSES:
+            with self.subTest(cls=cls):
+                instance = cls(identifier)
+                self.assertIs(pickle.loads(pickle.dumps(instance)), instance)
+                self.assertIs(copy.deepcopy(instance), instance)
+
+    def test_intern_limit(self):
+        with mock.patch.object(Distributor, "_instances", {}):
+            with mock.patch.object(Distributor, "INTERN_LIMIT", 1):
+                self.assertIs(Distributor("10"), Distributor("10"))
+                self.assertIsNot(Distributor("11"), Distributor("11"))
+                self.assertEqual(
+                    Distributor("11").name, "Western Power Distribution"
+                )
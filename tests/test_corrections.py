@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from mpan.corrections import suggest_corrections, suggest_corrections_many
+from mpan.helpers import is_valid
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+def get_edits(raw):
+    """
+    Every single substitution or neighbouring swap in the core of `raw`, the
+    slow way, for comparison.
+    """
+
+    top_line, core = raw[:-13], raw[-13:]
+
+    for position in range(13):
+        for digit in "0123456789":
+            if digit != core[position]:
+                yield (
+                    f"{top_line}{core[:position]}{digit}"
+                    f"{core[position + 1:]}"
+                )
+
+    for position in range(12):
+        left, right = core[position], core[position + 1]
+        if left != right:
+            yield (
+                f"{top_line}{core[:position]}{right}{left}"
+                f"{core[position + 2:]}"
+            )
+
+
+def slow(raw):
+    return sorted({edit for edit in get_edits(raw) if is_valid(edit)})
+
+
+class SuggestCorrectionsTestCase(TestCase):
+    def test_substitution(self):
+        for mpan in VALID[:3] + ("2499999999991",):
+            for edit in get_edits(mpan):
+                if is_valid(edit):
+                    continue
+                with self.subTest(edit=edit):
+                    suggestions = suggest_corrections(edit)
+                    self.assertIn(mpan, suggestions)
+                    self.assertEqual(suggestions, slow(edit))
+
+    def test_check_digit(self):
+        self.assertIn("2499999999991", suggest_corrections("2499999999990"))
+
+    def test_transposition(self):
+        # The last digit of the identifier swapped with the check digit
+        self.assertIn(
+            "01575R681049827101269",
+            suggest_corrections("01575R681049827101296"),
+        )
+
+    def test_valid(self):
+        # Any other valid MPANs that are one typo away
+        for mpan in VALID:
+            with self.subTest(mpan=mpan):
+                suggestions = suggest_corrections(mpan)
+                self.assertNotIn(mpan, suggestions)
+                self.assertEqual(suggestions, slow(mpan))
+
+    def test_distributor(self):
+        # 94 isn't a distributor, so the typo has to be in the first digit
+        self.assertEqual(
+            suggest_corrections("9499999999991"), ["2499999999991"]
+        )
+
+    def test_invalid_top_line(self):
+        self.assertEqual(suggest_corrections(INVALID[2]), [])
+        self.assertEqual(suggest_corrections(INVALID[3]), [])
+
+    def test_unparseable(self):
+        for raw in UNPARSEABLE:
+            with self.subTest(raw=raw):
+                self.assertEqual(suggest_corrections(raw), [])
+
+    def test_non_ascii(self):
+        # Suggestions come back with ASCII digits
+        self.assertIn("2499999999991", suggest_corrections("٢٤٩٩٩٩٩٩٩٩٩٩٠"))
+
+
+class SuggestCorrectionsManyTestCase(TestCase):
+    def test_suggest_corrections_many(self):
+        values = ["2499999999990", "Not an MPAN", 2499999999990, VALID[0]]
+        self.assertEqual(
+            list(suggest_corrections_many(values)),
+            [suggest_corrections(str(value)) for value in values],
+        )
+
+    def test_repeated(self):
+        first, second = suggest_corrections_many(["2499999999990"] * 2)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
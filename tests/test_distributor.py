@@ -1,3 +1,7 @@
+import subprocess
+import sys
+
+from datetime import date
 from unittest import TestCase
 
 from freezegun import freeze_time
@@ -47,10 +51,88 @@ class DistributorTestCase(TestCase):
         with freeze_time("2020-01-01"):
             self.assertEqual(distributor.gsp_group_ids, [])
 
+    def test_get_gsp_group_ids(self):
+        distributor = Distributor(identifier="28")
+
+        self.assertEqual(distributor.get_gsp_group_ids(date(2001, 1, 1)), [])
+        self.assertEqual(
+            distributor.get_gsp_group_ids(as_of=date(2010, 1, 1)), ["_C"]
+        )
+        self.assertEqual(distributor.get_gsp_group_ids(date(2020, 1, 1)), [])
+
+        with freeze_time("2010-01-01"):
+            self.assertEqual(distributor.get_gsp_group_ids(), ["_C"])
+
+    def test_get_gsp_group_ids_many(self):
+        self.assertEqual(
+            Distributor.get_gsp_group_ids_many(
+                [
+                    ("28", date(2010, 1, 1)),
+                    (Distributor("28"), date(2020, 1, 1)),
+                    ("10", date(2020, 1, 1)),
+                ]
+            ),
+            [["_C"], [], ["_A"]],
+        )
+
+        with freeze_time("2010-01-01"):
+            self.assertEqual(
+                Distributor.get_gsp_group_ids_many([("28", None)]), [["_C"]]
+            )
+
+    def test_from_participant_id(self):
+        self.assertIs(Distributor.from_participant_id("EELC"), self.dno)
+        self.assertIs(Distributor.from_participant_id("IPNL"), self.idno)
+        with self.assertRaises(KeyError):
+            Distributor.from_participant_id("ABCD")
+
+    def test_from_participant_id_round_trip(self):
+        for identifier in map(str, range(10, 39)):
+            distributor = Distributor(identifier)
+            with self.subTest(identifier=identifier):
+                self.assertIs(
+                    Distributor.from_participant_id(
+                        distributor.participant_id
+                    ),
+                    distributor,
+                )
+
+    def test_for_gsp_group(self):
+        self.assertEqual(
+            Distributor.for_gsp_group("_C", as_of=date(2001, 1, 1)),
+            [Distributor("12")],
+        )
+        self.assertIn(
+            Distributor("28"),
+            Distributor.for_gsp_group("_C", as_of=date(2010, 1, 1)),
+        )
+        self.assertNotIn(
+            Distributor("28"),
+            Distributor.for_gsp_group("_C", as_of=date(2020, 1, 1)),
+        )
+        self.assertEqual(
+            Distributor.for_gsp_group("_C", as_of=date(1990, 1, 1)), []
+        )
+        with self.assertRaises(KeyError):
+            Distributor.for_gsp_group("_Z")
+
+    def test_for_gsp_group_today(self):
+        with freeze_time("2010-01-01"):
+            self.assertEqual(
+                Distributor.for_gsp_group("_C"),
+                Distributor.for_gsp_group("_C", date(2010, 1, 1)),
+            )
+
     def test_name(self):
         self.assertEqual(self.dno.name, "UK Power Networks")
         self.assertEqual(self.idno.name, "Independent Power Networks Ltd.")
 
+    def test_unknown(self):
+        distributor = Distributor(identifier="01")
+        self.assertTrue(distributor.is_valid)
+        self.assertRaises(KeyError, lambda: distributor.name)
+        self.assertRaises(KeyError, lambda: distributor.participant_id)
+
     def test_type(self):
         self.assertEqual(self.dno.type, "DNO")
         self.assertEqual(self.idno.type, "IDNO")
@@ -62,3 +144,16 @@ class DistributorTestCase(TestCase):
     def test_is_idno(self):
         self.assertFalse(self.dno.is_idno)
         self.assertTrue(self.idno.is_idno)
+
+    def test_reference_data_is_lazy(self):
+        # This needs a fresh interpreter, as something else will have loaded
+        # the data already.
+        script = (
+            "import sys, mpan\n"
+            "assert mpan.is_valid('2499999999991')\n"
+            "assert 'mpan.reference' not in sys.modules\n"
+            "mpan.MPAN('2499999999991').distributor.name\n"
+            "assert 'mpan.reference' in sys.modules\n"
+            "assert 'mpan.data' not in sys.modules\n"
+        )
+        subprocess.run((sys.executable, "-c", script), check=True)
@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from mpan import MPAN, is_valid
+from mpan.checksum import calculate
+from mpan.generation.helpers import (
+    DISTRIBUTORS,
+    INDEX_SIZE,
+    from_index,
+    to_index,
+)
+
+from .common import INVALID, UNPARSEABLE
+
+
+class FromIndexTestCase(TestCase):
+    def test_from_index(self):
+        for index in (0, 1, 2, 1_000_000, INDEX_SIZE - 1):
+            with self.subTest(index=index):
+                mpan = from_index(index)
+                self.assertEqual(len(mpan), 21)
+                self.assertTrue(is_valid(mpan))
+                self.assertEqual(from_index(index, short=True), mpan[8:])
+
+    def test_unique(self):
+        cores = {
+            from_index(index, seed=3, short=True) for index in range(10_000)
+        }
+        self.assertEqual(len(cores), 10_000)
+
+    def test_seed(self):
+        self.assertEqual(from_index(12, seed=1), from_index(12, seed=1))
+        self.assertNotEqual(from_index(12, seed=1), from_index(12, seed=2))
+
+    def test_whole_space(self):
+        # The first and last identifiers of every distributor are in there
+        for distributor in DISTRIBUTORS:
+            for identifier in ("0000000000", "9999999999"):
+                core = f"{distributor}{identifier}"
+                core += str(calculate(core))
+                with self.subTest(core=core):
+                    index = to_index(core)
+                    self.assertEqual(from_index(index, short=True), core)
+
+    def test_out_of_range(self):
+        for index in (-1, INDEX_SIZE):
+            with self.subTest(index=index):
+                with self.assertRaises(ValueError):
+                    from_index(index)
+
+
+class ToIndexTestCase(TestCase):
+    def test_round_trip(self):
+        for seed in (0, 1, 12345):
+            for index in (0, 7, 123_456_789, INDEX_SIZE - 1):
+                with self.subTest(seed=seed, index=index):
+                    mpan = from_index(index, seed)
+                    self.assertEqual(to_index(mpan, seed), index)
+                    self.assertEqual(to_index(mpan[8:], seed), index)
+                    self.assertEqual(to_index(MPAN(mpan), seed), index)
+
+    def test_ignores_top_line(self):
+        mpan = from_index(42)
+        self.assertEqual(to_index(f"00111222{mpan[8:]}"), 42)
+
+    def test_invalid(self):
+        for value in (
+            INVALID[:2] + UNPARSEABLE + ("٢٤٩٩٩٩٩٩٩٩٩٩١", "9999999999990")
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    to_index(value)
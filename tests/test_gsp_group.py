@@ -0,0 +1,118 @@
+import json
+
+from datetime import date, datetime
+from unittest import TestCase, mock
+
+from freezegun import freeze_time
+
+from mpan.data import GSP_IDS
+from mpan.gsp_group import GSPGroupIndex, get_index, get_participant_index
+
+
+class GSPGroupIndexTestCase(TestCase):
+    def setUp(self):
+        self.index = GSPGroupIndex(
+            {
+                "ABCD": [
+                    ("_A", (date(2000, 1, 1), None)),
+                    ("_B", (date(2000, 1, 1), date(2010, 1, 1))),
+                    ("_C", (date(2005, 1, 1), date(2005, 1, 2))),
+                    ("_D", (date(2008, 1, 1), date(2012, 1, 1))),
+                ],
+                "EMPTY": [],
+            }
+        )
+
+    def test_lookup(self):
+        cases = (
+            (date(1999, 1, 1), ()),
+            (date(2000, 1, 1), ()),
+            (date(2000, 1, 2), ("_A", "_B")),
+            (date(2005, 1, 1), ("_A", "_B")),
+            (date(2008, 6, 1), ("_A", "_B", "_D")),
+            (date(2010, 1, 1), ("_A", "_D")),
+            (date(2012, 1, 1), ("_A",)),
+            (date(2099, 1, 1), ("_A",)),
+        )
+        for as_of, expected in cases:
+            with self.subTest(as_of=as_of):
+                self.assertEqual(self.index.lookup("ABCD", as_of), expected)
+
+    def test_lookup_datetime(self):
+        self.assertEqual(
+            self.index.lookup("ABCD", datetime(2000, 1, 2, 12)), ("_A", "_B")
+        )
+
+    def test_lookup_empty(self):
+        self.assertEqual(self.index.lookup("EMPTY", date(2000, 1, 2)), ())
+
+    def test_lookup_unknown(self):
+        self.assertRaises(KeyError, self.index.lookup, "WXYZ", date.today())
+
+    def test_lookup_many(self):
+        pairs = [
+            ("ABCD", date(2000, 1, 2)),
+            ("EMPTY", date(2000, 1, 2)),
+            ("ABCD", date(2012, 1, 1)),
+            ("ABCD", date(2000, 1, 2)),
+        ]
+        self.assertEqual(
+            self.index.lookup_many(pairs),
+            [("_A", "_B"), (), ("_A",), ("_A", "_B")],
+        )
+
+    def test_from_intervals(self):
+        index = GSPGroupIndex.from_intervals(
+            json.loads(json.dumps(self.index.intervals))
+        )
+        for as_of in (date(2000, 1, 2), date(2008, 6, 1), date(2012, 1, 1)):
+            with self.subTest(as_of=as_of):
+                self.assertEqual(
+                    index.lookup("ABCD", as_of),
+                    self.index.lookup("ABCD", as_of),
+                )
+        self.assertEqual(index.lookup("EMPTY", date(2000, 1, 2)), ())
+
+    def test_today(self):
+        with mock.patch.object(
+            self.index, "lookup", wraps=self.index.lookup
+        ) as lookup:
+            with freeze_time("2009-01-01 00:00"):
+                self.assertEqual(self.index.today("ABCD"), ("_A", "_B", "_D"))
+            with freeze_time("2009-01-01 23:59"):
+                self.assertEqual(self.index.today("ABCD"), ("_A", "_B", "_D"))
+            self.assertEqual(lookup.call_count, 1)
+
+            with freeze_time("2011-01-01"):
+                self.assertEqual(self.index.today("ABCD"), ("_A", "_D"))
+            self.assertEqual(lookup.call_count, 2)
+
+    def test_matches_data(self):
+        index = get_index()
+        for participant_id, periods in GSP_IDS.items():
+            for gsp_id, (started, stopped) in periods:
+                with self.subTest(participant_id=participant_id, gsp=gsp_id):
+                    self.assertNotIn(
+                        gsp_id, index.lookup(participant_id, started)
+                    )
+                    if stopped:
+                        self.assertNotIn(
+                            gsp_id, index.lookup(participant_id, stopped)
+                        )
+
+    def test_get_index(self):
+        self.assertIs(get_index(), get_index())
+
+    def test_get_participant_index(self):
+        index = get_participant_index()
+        self.assertIs(index, get_participant_index())
+
+        # Both indexes should agree on every day anything changes
+        for participant_id, periods in GSP_IDS.items():
+            for _, (started, stopped) in periods:
+                for day in filter(None, (started, stopped)):
+                    for gsp_id in get_index().lookup(participant_id, day):
+                        with self.subTest(participant_id=participant_id):
+                            self.assertIn(
+                                participant_id, index.lookup(gsp_id, day)
+                            )
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from mpan.helpers import is_valid
+from mpan.helpers import diagnose, is_valid
+from mpan.reason import Reason
 
 from .common import INVALID, UNPARSEABLE, VALID
 
@@ -18,3 +19,24 @@ class IsValidTestCase(TestCase):
         for string in UNPARSEABLE:
             with self.subTest(string=string):
                 self.assertFalse(is_valid(string))
+
+
+class DiagnoseTestCase(TestCase):
+    def test_diagnose(self):
+        for string in VALID:
+            with self.subTest(string=string):
+                self.assertIs(diagnose(string), Reason.VALID)
+
+    def test_diagnose_fail(self):
+        expected = (
+            Reason.CHECKSUM_MISMATCH,
+            Reason.UNKNOWN_DISTRIBUTOR,
+            Reason.INVALID_PROFILE_CLASS,
+            Reason.INVALID_MTC,
+        )
+        for string, reason in zip(INVALID, expected):
+            with self.subTest(string=string):
+                self.assertIs(diagnose(string), reason)
+        for string in UNPARSEABLE:
+            with self.subTest(string=string):
+                self.assertIs(diagnose(string), Reason.BAD_FORMAT)
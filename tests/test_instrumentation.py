@@ -0,0 +1,153 @@
+import asyncio
+import io
+
+from unittest import TestCase, mock
+
+from mpan import instrumentation
+from mpan.__main__ import main
+from mpan.aio import validate_stream
+from mpan.exceptions import InvalidMPANError
+from mpan.helpers import is_valid
+from mpan.instrumentation import BUCKETS, STAGES
+from mpan.mpan import MPAN
+from mpan.parallel import validate_many
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class InstrumentationTestCase(TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+        self.addCleanup(instrumentation.reset)
+
+    def test_disabled_by_default(self):
+        instrumentation.disable()
+        MPAN(VALID[0]).check()
+        for stage in STAGES:
+            with self.subTest(stage=stage):
+                self.assertEqual(instrumentation.get_stats()[stage].count, 0)
+
+    def test_parse(self):
+        for string in VALID + INVALID + UNPARSEABLE:
+            is_valid(string)
+
+        stats = instrumentation.get_stats()["parse"]
+        self.assertEqual(
+            stats.outcomes,
+            {"ok": len(VALID) + len(INVALID), "invalid": len(UNPARSEABLE)},
+        )
+        self.assertEqual(sum(stats.histogram), stats.count)
+        self.assertEqual(len(stats.histogram), len(BUCKETS) + 1)
+        self.assertGreater(stats.seconds, 0)
+
+    def test_validate(self):
+        for string in VALID + INVALID + UNPARSEABLE:
+            is_valid(string)
+
+        self.assertEqual(
+            instrumentation.get_stats()["validate"].outcomes,
+            {
+                "valid": len(VALID),
+                "checksum_mismatch": 1,
+                "unknown_distributor": 1,
+                "invalid_profile_class": 1,
+                "invalid_mtc": 1,
+            },
+        )
+
+    def test_validate_is_only_recorded_once(self):
+        mpan = MPAN(VALID[0])
+        mpan.is_valid
+        mpan.is_valid
+        self.assertEqual(instrumentation.get_stats()["validate"].count, 1)
+
+    def test_check(self):
+        MPAN(VALID[0]).check()
+        with self.assertRaises(InvalidMPANError):
+            MPAN(INVALID[0]).check()
+
+        self.assertEqual(
+            instrumentation.get_stats()["check"].outcomes,
+            {"ok": 1, "invalid": 1},
+        )
+
+    def test_batch_tools(self):
+        def run_command():
+            with mock.patch("sys.stdin", io.StringIO("\n".join(VALID))):
+                with mock.patch("sys.stdout", io.StringIO()):
+                    with mock.patch("sys.stderr", io.StringIO()):
+                        main(["validate", "--no-header"])
+
+        async def collect():
+            return [result async for result in validate_stream(VALID)]
+
+        tools = {
+            "validate_many": lambda: list(validate_many(VALID, workers=1)),
+            "validate_stream": lambda: asyncio.run(collect()),
+            "command": run_command,
+        }
+        for name, tool in tools.items():
+            with self.subTest(tool=name):
+                instrumentation.reset()
+                tool()
+                stats = instrumentation.get_stats()
+                self.assertEqual(stats["parse"].outcomes, {"ok": len(VALID)})
+                self.assertEqual(
+                    stats["validate"].outcomes, {"valid": len(VALID)}
+                )
+
+    def test_callbacks(self):
+        callback = mock.Mock()
+        instrumentation.add_callback(callback)
+        self.addCleanup(instrumentation.remove_callback, callback)
+
+        with self.assertRaises(InvalidMPANError):
+            MPAN(UNPARSEABLE[0])
+        MPAN(INVALID[0]).is_valid
+
+        self.assertEqual(
+            [c.args[:2] for c in callback.call_args_list],
+            [
+                ("parse", "invalid"),
+                ("parse", "ok"),
+                ("validate", "checksum_mismatch"),
+            ],
+        )
+        for c in callback.call_args_list:
+            self.assertIsInstance(c.args[2], float)
+
+    def test_histogram(self):
+        instrumentation.record("check", "ok", 0)
+        instrumentation.record("check", "ok", BUCKETS[0])
+        instrumentation.record("check", "ok", BUCKETS[1])
+        instrumentation.record("check", "ok", 60)
+
+        histogram = instrumentation.get_stats()["check"].histogram
+        self.assertEqual(histogram[:2], [2, 1])
+        self.assertEqual(histogram[-1], 1)
+        self.assertEqual(sum(histogram), 4)
+
+    def test_get_stats_is_a_copy(self):
+        MPAN(VALID[0])
+        stats = instrumentation.get_stats()
+        stats["parse"].outcomes["ok"] += 1
+        stats["parse"].histogram[0] += 1
+        self.assertEqual(instrumentation.get_stats()["parse"].count, 1)
+        self.assertEqual(
+            sum(instrumentation.get_stats()["parse"].histogram), 1
+        )
+
+    def test_stage_stats_repr(self):
+        instrumentation.record("check", "ok", 0)
+        self.assertEqual(
+            repr(instrumentation.get_stats()["check"]),
+            "StageStats(outcomes={'ok': 1}, "
+            f"histogram={[1] + [0] * len(BUCKETS)}, seconds=0.0)",
+        )
+
+    def test_reset(self):
+        MPAN(VALID[0])
+        instrumentation.reset()
+        self.assertEqual(instrumentation.get_stats()["parse"].count, 0)
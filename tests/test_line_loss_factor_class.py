@@ -0,0 +1,100 @@
+from datetime import date
+from unittest import TestCase
+
+from freezegun import freeze_time
+
+from mpan.distributor import Distributor
+from mpan.line_loss_factor_class import LineLossFactorClass, get_classes
+
+from .common import LLFCS, extracts
+
+
+class LineLossFactorClassTestCase(TestCase):
+    def test_is_valid(self):
+        self.assertTrue(LineLossFactorClass("A01"))
+        self.assertTrue(LineLossFactorClass("999"))
+        self.assertTrue(LineLossFactorClass("ZZZ"))
+        self.assertFalse(LineLossFactorClass("a01"))
+        self.assertFalse(LineLossFactorClass("A0"))
+        self.assertFalse(LineLossFactorClass("A001"))
+        self.assertFalse(LineLossFactorClass("A-1"))
+        self.assertFalse(LineLossFactorClass(""))
+
+    def test___repr__(self):
+        self.assertEqual(
+            repr(LineLossFactorClass("A01")), "LineLossFactorClass: A01"
+        )
+
+    def test_no_extract(self):
+        llfc = LineLossFactorClass("A01")
+        self.assertEqual(llfc.get_records("10"), [])
+        self.assertIsNone(llfc.get_record("10", date(2020, 1, 1)))
+        self.assertIsNone(llfc.get_description("10"))
+        self.assertTrue(llfc.is_valid_for("10"))
+        self.assertFalse(LineLossFactorClass("a01").is_valid_for("10"))
+        self.assertEqual(get_classes(), {})
+
+
+class ExtractTestCase(TestCase):
+    def test_get_records(self):
+        with extracts():
+            self.assertEqual(
+                LineLossFactorClass("A01").get_records(Distributor("10")),
+                [LineLossFactorClass.Record(*r) for r in LLFCS["10"]["A01"]],
+            )
+            self.assertEqual(LineLossFactorClass("A01").get_records("11"), [])
+
+    def test_get_record(self):
+        llfc = LineLossFactorClass("A02")
+        with extracts():
+            self.assertIsNone(llfc.get_record("10", date(2010, 3, 31)))
+            self.assertEqual(
+                llfc.get_record("10", date(2015, 3, 31)).description,
+                "Domestic, two rate",
+            )
+            self.assertIsNone(llfc.get_record("10", date(2015, 4, 1)))
+
+    def test_get_description(self):
+        with extracts(), freeze_time("2020-01-01"):
+            self.assertEqual(
+                LineLossFactorClass("A01").get_description("10"), "Domestic"
+            )
+            self.assertIsNone(LineLossFactorClass("A02").get_description("10"))
+            self.assertEqual(
+                LineLossFactorClass("A02").get_description(
+                    "10", date(2012, 1, 1)
+                ),
+                "Domestic, two rate",
+            )
+
+    def test_is_valid_for(self):
+        with extracts():
+            a01, a02 = LineLossFactorClass("A01"), LineLossFactorClass("A02")
+            self.assertTrue(a01.is_valid_for("10", date(2020, 1, 1)))
+            self.assertFalse(a02.is_valid_for("10", date(2020, 1, 1)))
+            self.assertTrue(
+                a02.is_valid_for(Distributor("10"), date(2012, 1, 1))
+            )
+            self.assertFalse(a01.is_valid_for("10", date(2000, 1, 1)))
+
+            # A01 means nothing to 24, which is in the extract...
+            self.assertFalse(a01.is_valid_for("24", date(2020, 1, 1)))
+
+            # ...but we know nothing about 11 at all
+            self.assertTrue(a01.is_valid_for("11", date(2020, 1, 1)))
+            self.assertFalse(
+                LineLossFactorClass("a01").is_valid_for("11", date(2020, 1, 1))
+            )
+
+    def test_get_classes(self):
+        with extracts():
+            self.assertEqual(
+                get_classes(date(2012, 1, 1)),
+                {"10": ["A01", "A02"], "24": ["001"]},
+            )
+            self.assertEqual(
+                get_classes(date(2020, 1, 1)), {"10": ["A01"], "24": ["001"]}
+            )
+            self.assertEqual(
+                get_classes(date(1990, 1, 1)), {"10": [], "24": []}
+            )
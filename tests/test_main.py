@@ -0,0 +1,128 @@
+import io
+import json
+import runpy
+import sys
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase, mock
+
+from mpan.__main__ import Command, main
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class CommandTestCase(TestCase):
+    def setUp(self):
+        self.stderr = io.StringIO()
+        patcher = mock.patch("sys.stderr", self.stderr)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_command(self, argv, stdin=""):
+        stdout = io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)):
+            with mock.patch("sys.stdout", stdout):
+                self.assertEqual(main(argv), 0)
+        return stdout.getvalue()
+
+    def test_csv(self):
+        stdin = "id,mpan\n" + "".join(
+            f"{i},{mpan}\n" for i, mpan in enumerate(VALID + INVALID)
+        )
+        output = self.run_command(["validate", "--column", "mpan"], stdin)
+
+        lines = output.splitlines()
+        self.assertEqual(
+            lines[0], "mpan,valid,reason,distributor,profile_class"
+        )
+        self.assertEqual(lines[1], f"{VALID[0]},True,,14,06")
+        self.assertEqual(
+            lines[-4:],
+            [
+                "2499999999990,False,bad checksum,24,",
+                "8699999999991,False,invalid distributor,86,",
+                "991112221312345678907,False,invalid profile class,13,99",
+                "000002221312345678907,False,invalid meter time switch code,"
+                "13,00",
+            ],
+        )
+        self.assertIn(f"Checked {len(VALID) + 4} rows", self.stderr.getvalue())
+        self.assertIn(f"{len(VALID)} valid, 4 invalid", self.stderr.getvalue())
+
+    def test_jsonl(self):
+        stdin = "\n".join(("mpan", "") + UNPARSEABLE)
+        output = self.run_command(["validate", "--format", "jsonl"], stdin)
+
+        self.assertEqual(
+            [json.loads(line) for line in output.splitlines()],
+            [
+                {
+                    "mpan": string,
+                    "valid": False,
+                    "reason": "unparseable",
+                    "distributor": None,
+                    "profile_class": None,
+                }
+                for string in ("",) + UNPARSEABLE
+            ],
+        )
+
+    def test_no_header(self):
+        stdin = "\n".join(VALID) + "\n"
+        output = self.run_command(
+            ["validate", "--no-header", "--chunk-size", "3"], stdin
+        )
+        self.assertEqual(len(output.splitlines()), len(VALID) + 1)
+
+    def test_short_rows(self):
+        output = self.run_command(["validate", "--column", "2"], "a,b,c\n1\n")
+        self.assertEqual(output.splitlines()[1], ",False,unparseable,,")
+
+    def test_files(self):
+        with TemporaryDirectory() as directory:
+            source = Path(directory) / "source.csv"
+            output = Path(directory) / "output.jsonl"
+            source.write_text("mpan\n2499999999991\n")
+
+            self.run_command(
+                [
+                    "validate",
+                    str(source),
+                    "--output",
+                    str(output),
+                    "--format",
+                    "jsonl",
+                ]
+            )
+
+            self.assertTrue(json.loads(output.read_text())["valid"])
+
+    def test_bad_column(self):
+        with mock.patch("sys.stdin", io.StringIO("mpan\n")):
+            with self.assertRaises(SystemExit):
+                Command(["validate", "--column", "nope"])()
+        self.assertIn("no column called 'nope'", self.stderr.getvalue())
+
+    def test_bad_chunk_size(self):
+        for chunk_size in ("0", "-1", "ten"):
+            with self.subTest(chunk_size=chunk_size):
+                with self.assertRaises(SystemExit):
+                    Command(["validate", "--chunk-size", chunk_size])
+                self.assertIn(
+                    f"{chunk_size} isn't a positive whole number",
+                    self.stderr.getvalue(),
+                )
+
+    def test_run_module(self):
+        argv = ["mpan", "validate", "--no-header"]
+
+        # Running a module that's already been imported makes runpy grumble
+        with mock.patch.dict(sys.modules), mock.patch("sys.argv", argv):
+            sys.modules.pop("mpan.__main__", None)
+            with mock.patch("sys.stdin", io.StringIO("2499999999991\n")):
+                with mock.patch("sys.stdout", io.StringIO()):
+                    with self.assertRaises(SystemExit) as context:
+                        runpy.run_module("mpan", run_name="__main__")
+
+        self.assertEqual(context.exception.code, 0)
@@ -1,7 +1,12 @@
+from datetime import date, datetime
 from unittest import TestCase
 
+from freezegun import freeze_time
+
 from mpan.meter_time_switch_code import MeterTimeSwitchCode
 
+from .common import MTCS, extracts
+
 
 class MeterTimeSwitchCodeTestCase(TestCase):
     def test_is_valid(self):
@@ -19,3 +24,75 @@ class MeterTimeSwitchCodeTestCase(TestCase):
         self.assertEqual(MeterTimeSwitchCode("").description, None)
         self.assertEqual(MeterTimeSwitchCode("1000").description, None)
         self.assertEqual(MeterTimeSwitchCode("test").description, None)
+        self.assertEqual(
+            MeterTimeSwitchCode("999").description,
+            "Codes common across the Industry",
+        )
+
+    def test_description_table(self):
+        # The table should agree with a search through the ranges
+        for value in range(-1, 1001):
+            expected = None
+            for range_ in MeterTimeSwitchCode.MTC_RANGES:
+                if range_.upper <= value <= range_.lower:
+                    expected = range_.description
+            with self.subTest(value=value):
+                self.assertEqual(
+                    MeterTimeSwitchCode(f"{value:03}").description, expected
+                )
+
+    def test_no_extract(self):
+        code = MeterTimeSwitchCode("001")
+        self.assertEqual(code.records, [])
+        self.assertIsNone(code.get_record(date(2020, 1, 1)))
+        self.assertIsNone(code.register_count)
+        self.assertIsNone(code.settlement_type)
+
+
+class ExtractTestCase(TestCase):
+    def test_records(self):
+        with extracts():
+            code = MeterTimeSwitchCode("001")
+            self.assertEqual(
+                code.records,
+                [MeterTimeSwitchCode.Record(*row) for row in MTCS["001"]],
+            )
+            self.assertEqual(MeterTimeSwitchCode("002").records, [])
+            self.assertEqual(MeterTimeSwitchCode("test").records, [])
+
+    def test_get_record(self):
+        with extracts():
+            code = MeterTimeSwitchCode("001")
+            self.assertIsNone(code.get_record(date(1990, 1, 1)))
+            self.assertEqual(
+                code.get_record(date(1996, 4, 1)).description,
+                "Old single rate",
+            )
+            self.assertEqual(
+                code.get_record(datetime(2010, 3, 31, 12)).description,
+                "Old single rate",
+            )
+            self.assertEqual(
+                code.get_record(date(2010, 4, 1)).description, "Single rate"
+            )
+
+    def test_expired(self):
+        mtcs = {"002": [(date(2000, 1, 1), date(2001, 1, 1), "Gone", 2, "X")]}
+        with extracts(mtcs):
+            code = MeterTimeSwitchCode("002")
+            self.assertIsNone(code.get_record(date(2001, 1, 2)))
+            self.assertEqual(code.get_description(date(2000, 6, 1)), "Gone")
+            self.assertEqual(
+                code.get_description(date(2001, 1, 2)), "DNO specific"
+            )
+
+    def test_today(self):
+        with extracts(), freeze_time("2020-01-01"):
+            code = MeterTimeSwitchCode("001")
+            self.assertEqual(code.description, "Single rate")
+            self.assertEqual(code.register_count, 1)
+            self.assertEqual(code.settlement_type, "NHH")
+            self.assertEqual(MeterTimeSwitchCode("845").settlement_type, "HH")
+            self.assertEqual(
+                MeterTimeSwitchCode("002").description, "DNO specific"
+            )
@@ -1,7 +1,9 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from mpan.exceptions import InvalidMPANError
+from mpan.line_loss_factor_class import LineLossFactorClass
 from mpan.mpan import MPAN
+from mpan.reason import Reason
 
 from .common import INVALID, UNPARSEABLE, VALID
 
@@ -41,6 +43,9 @@ class MPANTestCase(TestCase):
         self.assertEqual(mpan.profile_class.identifier, "01")
         self.assertEqual(mpan.meter_time_switch_code.identifier, "801")
         self.assertEqual(mpan.line_loss_factor_class, "100")
+        self.assertIs(
+            mpan.line_loss_factor_class_info, LineLossFactorClass("100")
+        )
         self.assertEqual(mpan.core, "2099999999386")
         self.assertEqual(mpan.distributor.identifier, "20")
         self.assertEqual(mpan.identifier, "99999999")
@@ -54,9 +59,11 @@ class MPANTestCase(TestCase):
     def test_parsing_short_pass(self):
         mpan = MPAN("1099999999997")
 
+        self.assertIsNone(mpan.top_line)
         self.assertIsNone(mpan.profile_class)
         self.assertIsNone(mpan.meter_time_switch_code)
         self.assertIsNone(mpan.line_loss_factor_class)
+        self.assertIsNone(mpan.line_loss_factor_class_info)
         self.assertEqual(mpan.core, "1099999999997")
         self.assertEqual(mpan.distributor.identifier, "10")
         self.assertEqual(mpan.identifier, "99999999")
@@ -105,3 +112,109 @@ class MPANTestCase(TestCase):
         for string in INVALID:
             with self.subTest(string=string):
                 self.assertRaises(InvalidMPANError, MPAN(string).check)
+
+    def test___hash__(self):
+        self.assertEqual(hash(MPAN(VALID[0])), hash(VALID[0]))
+        self.assertEqual(len({MPAN(VALID[0]), MPAN(VALID[0]), VALID[0]}), 1)
+        self.assertEqual({MPAN(VALID[0]): 1}[VALID[0]], 1)
+
+    def test___lt__(self):
+        mpans = [MPAN(VALID[0]), MPAN(VALID[0][8:]), MPAN("2499999999991")]
+        self.assertEqual(
+            sorted(mpans, reverse=True), [mpans[2], mpans[0], mpans[1]]
+        )
+        with self.assertRaises(TypeError):
+            MPAN(VALID[0]) < VALID[0]
+
+    def test_key(self):
+        self.assertEqual(
+            MPAN("2499999999991").key, 2499999999991 << MPAN.TOP_LINE_BITS
+        )
+        self.assertEqual(
+            MPAN("2499999999991\n").key, MPAN("2499999999991").key
+        )
+
+        # The smallest and largest possible top lines
+        low = MPAN("00000000" + "2499999999991").key
+        high = MPAN("99999ZZZ" + "2499999999991").key
+        self.assertEqual(low & (2**MPAN.TOP_LINE_BITS - 1), 1)
+        self.assertLess(high, (2499999999991 + 1) << MPAN.TOP_LINE_BITS)
+
+    def test_key_is_unique(self):
+        mpans = VALID + tuple(mpan[8:] for mpan in VALID) + INVALID
+        keys = {MPAN(mpan).key for mpan in mpans}
+        self.assertEqual(len(keys), len(set(mpans)))
+
+    def test_from_key(self):
+        mpans = VALID + INVALID + ("00000000" + "2499999999991",)
+        for mpan in mpans:
+            with self.subTest(mpan=mpan):
+                self.assertEqual(MPAN.from_key(MPAN(mpan).key), mpan)
+
+    def test_pack(self):
+        self.assertEqual(
+            MPAN("2499999999991").pack(),
+            (2499999999991).to_bytes(8, "big") + bytes(8),
+        )
+        self.assertEqual(len(MPAN(VALID[0]).pack()), MPAN.PACKED_SIZE)
+
+    def test_pack_non_canonical(self):
+        for mpan in ("2499999999991\n", "٢٤٩٩٩٩٩٩٩٩٩٩١"):
+            with self.subTest(mpan=mpan):
+                with self.assertRaises(ValueError):
+                    MPAN(mpan).pack()
+
+    def test_unpack(self):
+        mpans = (
+            VALID
+            + INVALID
+            + ("00000000" + "0000000000000", "99999ZZZ" + "9999999999999")
+        )
+        for mpan in mpans + tuple(m[8:] for m in mpans if len(m) == 21):
+            with self.subTest(mpan=mpan):
+                self.assertEqual(str(MPAN.unpack(MPAN(mpan).pack())), mpan)
+
+    def test_unpack_invalid(self):
+        top_line = (MPAN.MAX_TOP_LINE + 1).to_bytes(8, "big")
+        for packed in (
+            b"",
+            bytes(17),
+            (10**13).to_bytes(8, "big") + bytes(8),
+            bytes(8) + top_line,
+        ):
+            with self.subTest(packed=packed):
+                with self.assertRaises(ValueError):
+                    MPAN.unpack(packed)
+
+    def test_packed_order(self):
+        mpans = [MPAN(mpan) for mpan in VALID + INVALID]
+        mpans += [MPAN(mpan.core) for mpan in mpans]
+        self.assertEqual(
+            sorted(mpans, key=MPAN.pack), sorted(mpans, key=lambda m: m.key)
+        )
+
+    def test_reason(self):
+        self.assertIs(MPAN(VALID[0]).reason, Reason.VALID)
+        self.assertIs(MPAN(INVALID[0]).reason, Reason.CHECKSUM_MISMATCH)
+        self.assertEqual(MPAN(INVALID[0]).reason.description, "bad checksum")
+
+    def test_is_valid_is_cached(self):
+        mpan = MPAN(VALID[0])
+        with mock.patch.object(
+            MPAN, "_diagnose", return_value=Reason.VALID
+        ) as m:
+            self.assertTrue(mpan.is_valid)
+            self.assertTrue(mpan.is_valid)
+        m.assert_called_once_with()
+
+    def test_subsections_are_cached(self):
+        mpan = MPAN("018011002099999999386")
+        self.assertIs(mpan.profile_class, mpan.profile_class)
+        self.assertIs(mpan.meter_time_switch_code, mpan.mtc)
+        self.assertIs(mpan.distributor, mpan.distributor)
+
+    def test_slots(self):
+        mpan = MPAN("018011002099999999386")
+        for obj in (mpan, mpan.pc, mpan.mtc, mpan.distributor):
+            with self.subTest(obj=obj):
+                self.assertFalse(hasattr(obj, "__dict__"))
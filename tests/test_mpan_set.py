@@ -0,0 +1,123 @@
+from unittest import TestCase
+
+import numpy as np
+
+from mpan.exceptions import InvalidMPANError
+from mpan.mpan import MPAN
+from mpan.mpan_set import MPANSet
+
+from .common import UNPARSEABLE, VALID
+
+
+class MPANSetTestCase(TestCase):
+    def setUp(self):
+        self.a = MPANSet(VALID[:6])
+        self.b = MPANSet([mpan[8:] for mpan in VALID[3:]])
+
+    def test_init(self):
+        self.assertEqual(len(self.a), 6)
+        self.assertEqual(self.a.cores.dtype, np.int64)
+        self.assertEqual(self.a.cores.tolist(), sorted(self.a.cores.tolist()))
+        self.assertEqual(set(self.a), {mpan[8:] for mpan in VALID[:6]})
+
+    def test_init_duplicate_cores(self):
+        self.assertEqual(len(MPANSet([VALID[0], VALID[0][8:]])), 1)
+
+    def test_init_empty(self):
+        self.assertEqual(len(MPANSet()), 0)
+        self.assertEqual(list(MPANSet()), [])
+
+    def test_init_unparseable(self):
+        with self.assertRaises(InvalidMPANError) as context:
+            MPANSet([VALID[0], UNPARSEABLE[0]])
+        self.assertIn(UNPARSEABLE[0], str(context.exception))
+
+    def test_init_unicode_digits(self):
+        self.assertEqual(
+            MPANSet(["24٩٩٩٩٩٩٩٩٩٩1"]), MPANSet(["2499999999991"])
+        )
+
+    def test_from_cores(self):
+        self.assertEqual(
+            MPANSet.from_cores([2499999999991, 2499999999991, 100000000001]),
+            MPANSet(["2499999999991", "0100000000001"]),
+        )
+
+    def test_iter_keeps_leading_zeros(self):
+        self.assertEqual(
+            list(MPANSet.from_cores([100000000001])), ["0100000000001"]
+        )
+
+    def test_contains(self):
+        for mpan in VALID[:6]:
+            with self.subTest(mpan=mpan):
+                self.assertIn(mpan, self.a)
+                self.assertIn(mpan[8:], self.a)
+                self.assertIn(MPAN(mpan), self.a)
+        self.assertNotIn(VALID[6], self.a)
+        self.assertNotIn("9999999999999", self.a)
+        self.assertNotIn(UNPARSEABLE[0], self.a)
+        self.assertNotIn(VALID[0], MPANSet())
+
+    def test_eq(self):
+        self.assertEqual(self.a, MPANSet(reversed(VALID[:6])))
+        self.assertNotEqual(self.a, self.b)
+        self.assertNotEqual(self.a, set(self.a))
+
+    def test_repr(self):
+        self.assertEqual(repr(self.a), "MPANSet(6 MPANs)")
+
+    def test_union(self):
+        expected = MPANSet(VALID)
+        self.assertEqual(self.a.union(self.b), expected)
+        self.assertEqual(self.a | self.b, expected)
+
+    def test_intersection(self):
+        expected = MPANSet(VALID[3:6])
+        self.assertEqual(self.a.intersection(self.b), expected)
+        self.assertEqual(self.a & self.b, expected)
+
+    def test_difference(self):
+        self.assertEqual(self.a.difference(self.b), MPANSet(VALID[:3]))
+        self.assertEqual(self.a - self.b, MPANSet(VALID[:3]))
+        self.assertEqual(self.b - self.a, MPANSet(VALID[6:]))
+
+    def test_symmetric_difference(self):
+        expected = MPANSet(VALID[:3] + VALID[6:])
+        self.assertEqual(self.a.symmetric_difference(self.b), expected)
+        self.assertEqual(self.a ^ self.b, expected)
+
+    def test_matches_python_sets(self):
+        generator = np.random.default_rng(0)
+        left = generator.integers(0, 10**13, 5000)
+        right = np.concatenate(
+            (left[:2500], generator.integers(0, 10**13, 5000))
+        )
+
+        a, b = MPANSet.from_cores(left), MPANSet.from_cores(right)
+        x, y = set(left.tolist()), set(right.tolist())
+
+        self.assertEqual(sorted(x | y), (a | b).cores.tolist())
+        self.assertEqual(sorted(x & y), (a & b).cores.tolist())
+        self.assertEqual(sorted(x - y), (a - b).cores.tolist())
+        self.assertEqual(sorted(x ^ y), (a ^ b).cores.tolist())
+
+    def test_isin(self):
+        values = [VALID[0], VALID[6][8:], UNPARSEABLE[0], "٠" * 13, VALID[5]]
+        self.assertEqual(
+            self.a.isin(values).tolist(), [True, False, False, False, True]
+        )
+        self.assertEqual(MPANSet().isin(values).tolist(), [False] * 5)
+
+    def test_isin_past_the_end(self):
+        self.assertEqual(
+            MPANSet.from_cores([1]).isin(["9999999999999"]).tolist(), [False]
+        )
+
+    def test_to_numpy(self):
+        self.assertEqual(
+            MPANSet.from_cores([100000000001, 2499999999991])
+            .to_numpy()
+            .tolist(),
+            ["0100000000001", "2499999999991"],
+        )
@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+import numpy as np
+
+from mpan import MPAN, is_valid
+from mpan.generation.helpers import (
+    DISTRIBUTORS,
+    INDEX_SIZE,
+    PROFILE_CLASSES,
+    from_index,
+)
+from mpan.generation.numpy import (
+    from_index_many,
+    generate_many,
+    iter_generate_many,
+    to_index_many,
+)
+
+from .common import INVALID, UNPARSEABLE
+
+
+class GenerateManyTestCase(TestCase):
+    def test_generate_many(self):
+        mpans = generate_many(1000, seed=1)
+
+        self.assertEqual(mpans.shape, (1000,))
+        self.assertEqual(mpans.dtype, np.dtype("U21"))
+        for mpan in mpans:
+            with self.subTest(mpan=mpan):
+                self.assertTrue(is_valid(mpan))
+                parsed = MPAN(mpan)
+                self.assertIn(parsed.profile_class.identifier, PROFILE_CLASSES)
+                self.assertIn(parsed.distributor.identifier, DISTRIBUTORS)
+                self.assertGreaterEqual(int(parsed.mtc.identifier), 100)
+
+    def test_short(self):
+        mpans = generate_many(100, seed=1, short=True)
+        self.assertEqual(mpans.dtype, np.dtype("U13"))
+        self.assertTrue(all(MPAN(mpan).is_short for mpan in mpans))
+        self.assertEqual(
+            mpans.tolist(), [m[8:] for m in generate_many(100, seed=1)]
+        )
+
+    def test_reproducible(self):
+        self.assertEqual(
+            generate_many(100, seed=42).tolist(),
+            generate_many(100, seed=42).tolist(),
+        )
+        self.assertNotEqual(
+            generate_many(100, seed=42).tolist(),
+            generate_many(100, seed=43).tolist(),
+        )
+
+    def test_empty(self):
+        self.assertEqual(generate_many(0).tolist(), [])
+        self.assertEqual(list(iter_generate_many(0)), [])
+
+
+class IterGenerateManyTestCase(TestCase):
+    def test_chunks(self):
+        chunks = list(iter_generate_many(25, seed=1, chunksize=10))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [10, 10, 5])
+        self.assertEqual(
+            chunks[0].tolist(), generate_many(10, seed=1).tolist()
+        )
+        self.assertTrue(all(is_valid(m) for m in np.concatenate(chunks)))
+
+    def test_reproducible(self):
+        self.assertEqual(
+            np.concatenate(list(iter_generate_many(25, 7, True, 10))).tolist(),
+            np.concatenate(list(iter_generate_many(25, 7, True, 10))).tolist(),
+        )
+
+
+class FromIndexManyTestCase(TestCase):
+    INDEXES = np.concatenate(
+        [np.arange(1000), np.arange(INDEX_SIZE - 1000, INDEX_SIZE)]
+    )
+
+    def test_from_index_many(self):
+        for seed in (0, 1, 12345):
+            with self.subTest(seed=seed):
+                mpans = from_index_many(self.INDEXES, seed)
+                self.assertEqual(mpans.dtype, np.dtype("U21"))
+                self.assertEqual(
+                    mpans.tolist(),
+                    [from_index(int(i), seed) for i in self.INDEXES],
+                )
+
+    def test_short(self):
+        mpans = from_index_many(self.INDEXES, seed=1, short=True)
+        self.assertEqual(mpans.dtype, np.dtype("U13"))
+        self.assertEqual(
+            mpans.tolist(),
+            [m[8:] for m in from_index_many(self.INDEXES, seed=1)],
+        )
+
+    def test_unique(self):
+        mpans = from_index_many(np.arange(1_000_000), seed=7, short=True)
+        self.assertEqual(len(np.unique(mpans)), 1_000_000)
+
+    def test_out_of_range(self):
+        for index in (-1, INDEX_SIZE):
+            with self.subTest(index=index):
+                with self.assertRaises(ValueError):
+                    from_index_many([0, index])
+
+    def test_empty(self):
+        self.assertEqual(from_index_many([]).tolist(), [])
+        self.assertEqual(to_index_many([]).tolist(), [])
+
+
+class ToIndexManyTestCase(TestCase):
+    def test_round_trip(self):
+        indexes = FromIndexManyTestCase.INDEXES
+        for seed in (0, 1, 12345):
+            with self.subTest(seed=seed):
+                mpans = from_index_many(indexes, seed)
+                self.assertEqual(
+                    to_index_many(mpans, seed).tolist(), indexes.tolist()
+                )
+                short = from_index_many(indexes, seed, short=True)
+                self.assertEqual(
+                    to_index_many(short, seed).tolist(), indexes.tolist()
+                )
+
+    def test_invalid(self):
+        mpan = from_index(0)
+        for value in INVALID[:2] + UNPARSEABLE + ("٢٤٩٩٩٩٩٩٩٩٩٩١",):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    to_index_many([mpan, value])
@@ -0,0 +1,106 @@
+from datetime import date
+from unittest import TestCase
+
+import pandas as pd
+
+from mpan import MPAN, is_valid
+from mpan.exceptions import InvalidMPANError
+from mpan.pandas import MPANAccessor
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class MPANAccessorTestCase(TestCase):
+    VALUES = VALID + INVALID + UNPARSEABLE + ("24٩٩٩٩٩٩٩٩٩٩1", None)
+
+    def setUp(self):
+        self.series = pd.Series(
+            self.VALUES,
+            index=range(100, 100 + len(self.VALUES)),
+            name="mpans",
+        )
+
+    def assertMatchesMPAN(self, column, function):
+        """
+        Check `column` against `function(MPAN(value))` for each value, where
+        missing values and `None` are interchangeable.
+        """
+
+        expected = []
+        for value in self.VALUES:
+            try:
+                expected.append(function(MPAN(value)))
+            except (InvalidMPANError, KeyError):
+                expected.append(None)
+
+        self.assertIsInstance(column, pd.Series)
+        self.assertEqual(column.name, "mpans")
+        self.assertTrue(column.index.equals(self.series.index))
+        self.assertEqual(
+            [None if pd.isna(value) else value for value in column],
+            expected,
+        )
+
+    def test_registered(self):
+        self.assertIsInstance(self.series.mpan, MPANAccessor)
+
+    def test_batch_is_reused(self):
+        accessor = self.series.mpan
+        self.assertIs(accessor._get_batch(), accessor._get_batch())
+
+    def test_is_valid(self):
+        self.assertEqual(
+            self.series.mpan.is_valid.tolist(),
+            [is_valid(value) for value in self.VALUES],
+        )
+
+    def test_fields(self):
+        for name in (
+            "top_line",
+            "profile_class",
+            "mtc",
+            "llfc",
+            "core",
+            "distributor",
+            "identifier",
+            "checksum",
+        ):
+
+            def function(mpan):
+                value = getattr(mpan, name)
+                return None if value is None else str(value)
+
+            with self.subTest(name=name):
+                self.assertMatchesMPAN(
+                    getattr(self.series.mpan, name), function
+                )
+
+    def test_distributor_properties(self):
+        for accessor, name in (
+            ("distributor_name", "name"),
+            ("participant_id", "participant_id"),
+            ("type", "type"),
+        ):
+            with self.subTest(name=name):
+                self.assertMatchesMPAN(
+                    getattr(self.series.mpan, accessor),
+                    lambda m: getattr(m.distributor, name),
+                )
+
+    def test_gsp_group_ids(self):
+        self.assertMatchesMPAN(
+            self.series.mpan.gsp_group_ids,
+            lambda m: tuple(m.distributor.gsp_group_ids),
+        )
+
+        as_of = date(2010, 1, 1)
+        self.assertMatchesMPAN(
+            self.series.mpan.get_gsp_group_ids(as_of=as_of),
+            lambda m: tuple(m.distributor.get_gsp_group_ids(as_of)),
+        )
+
+    def test_empty(self):
+        series = pd.Series([], dtype=object)
+        self.assertEqual(series.mpan.is_valid.tolist(), [])
+        self.assertEqual(series.mpan.core.tolist(), [])
+        self.assertEqual(series.mpan.type.tolist(), [])
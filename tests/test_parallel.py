@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from mpan.parallel import validate_chunk, validate_many
+
+from .common import MIXED, MIXED_VALIDITY, VALID
+
+
+class ValidateManyTestCase(TestCase):
+    def test_in_process(self):
+        self.assertEqual(
+            tuple(validate_many(MIXED, workers=1, chunksize=3)),
+            MIXED_VALIDITY,
+        )
+
+    def test_pool(self):
+        values = MIXED * 5
+        self.assertEqual(
+            tuple(validate_many(iter(values), workers=2, chunksize=4)),
+            MIXED_VALIDITY * 5,
+        )
+
+    def test_abandoned(self):
+        results = validate_many(VALID * 100, workers=2, chunksize=1)
+        self.assertTrue(next(results))
+        results.close()
+
+    def test_default_workers(self):
+        self.assertEqual(list(validate_many(VALID)), [True] * len(VALID))
+
+    def test_empty(self):
+        self.assertEqual(list(validate_many([], workers=2)), [])
+
+    def test_bad_arguments(self):
+        for kwargs in (
+            {"workers": 0},
+            {"workers": -1},
+            {"chunksize": 0},
+            {"chunksize": -1},
+        ):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValueError):
+                    validate_many(VALID, **kwargs)
+
+
+class ValidateChunkTestCase(TestCase):
+    def test_validate_chunk(self):
+        chunk = [str(value) for value in MIXED]
+        self.assertEqual(validate_chunk(chunk), bytes(MIXED_VALIDITY))
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from mpan.exceptions import InvalidMPANError
+from mpan.mpan import MPAN
+from mpan.parser import LONG_OFFSET, SHORT_OFFSET, parse
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class ParseTestCase(TestCase):
+    def assertFailsAt(self, raw, position):
+        with self.assertRaises(InvalidMPANError) as context:
+            parse(raw)
+        self.assertEqual(context.exception.position, position)
+        self.assertIn(f"at position {position}", str(context.exception))
+
+    def test_long(self):
+        for string in VALID + INVALID[2:]:
+            with self.subTest(string=string):
+                self.assertEqual(parse(string), LONG_OFFSET)
+
+    def test_short(self):
+        for string in INVALID[:2]:
+            with self.subTest(string=string):
+                self.assertEqual(parse(string), SHORT_OFFSET)
+
+    def test_trailing_newline(self):
+        self.assertEqual(parse("2499999999991\n"), SHORT_OFFSET)
+        self.assertEqual(parse(f"{VALID[0]}\n"), LONG_OFFSET)
+        self.assertFailsAt("249999999999\n\n", 12)
+
+    def test_unicode_digits(self):
+        self.assertEqual(parse("24٩٩٩٩٩٩٩٩٩٩1"), SHORT_OFFSET)
+        self.assertFailsAt("24²9999999991", 2)
+
+    def test_bad_length(self):
+        for string in UNPARSEABLE + ("", "\n", f"{VALID[0]}0"):
+            with self.subTest(string=string):
+                with self.assertRaises(InvalidMPANError) as context:
+                    parse(string)
+                self.assertIsNone(context.exception.position)
+                self.assertIn("13 or 21 characters", str(context.exception))
+
+    def test_bad_character(self):
+        self.assertFailsAt("24999999999x1", 11)
+        self.assertFailsAt("x499999999991", 0)
+        self.assertFailsAt("0692A8I51470116845051", 4)
+        self.assertFailsAt("069238i51470116845051", 6)
+        self.assertFailsAt("069238I5147011684505x", 20)
+
+    def test_matches_regular_expressions(self):
+        mpan = VALID[0]
+        for i, _ in enumerate(mpan):
+            for c in "09AZaz -\n٩":
+                string = mpan[:i] + c + mpan[i:][1:]
+                with self.subTest(string=string):
+                    if MPAN.RE_SHORT.match(string):
+                        self.assertEqual(parse(string), SHORT_OFFSET)
+                    elif MPAN.RE_LONG.match(string):
+                        self.assertEqual(parse(string), LONG_OFFSET)
+                    else:
+                        self.assertRaises(InvalidMPANError, parse, string)
@@ -0,0 +1,93 @@
+import json
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from mpan.data import GSP_IDS, ID_LOOKUP, LLFCS, MTCS
+from mpan.distributor import Distributor
+from mpan.gsp_group import GSPGroupIndex
+from mpan.reference import VERSION, build, get_llfcs, get_mtcs, load, save
+
+from .common import LLFCS as LLFC_EXTRACT, MTCS as EXTRACT
+
+
+class ReferenceTestCase(TestCase):
+    def test_matches_data(self):
+        # If this fails, mpan/reference.json needs regenerating with
+        # scripts/generate-databases.py
+        expected = json.loads(
+            json.dumps(build(ID_LOOKUP, GSP_IDS, MTCS, LLFCS))
+        )
+        self.assertEqual(load(), expected)
+
+    def test_load_is_cached(self):
+        self.assertIs(load(), load())
+
+    def test_version(self):
+        self.assertEqual(load()["version"], VERSION)
+
+    def test_distributors(self):
+        distributors = load()["distributors"]
+        self.assertEqual(list(distributors), list(ID_LOOKUP))
+        for identifier, record in distributors.items():
+            with self.subTest(identifier=identifier):
+                distributor = Distributor(identifier)
+                self.assertEqual(record["name"], distributor.name)
+                self.assertEqual(
+                    record["participant_id"], distributor.participant_id
+                )
+                self.assertEqual(record["type"], distributor.type)
+
+    def test_participant_ids(self):
+        participant_ids = load()["participant_ids"]
+        for identifier, record in ID_LOOKUP.items():
+            with self.subTest(identifier=identifier):
+                self.assertIn(identifier, participant_ids[record["id"]])
+
+    def test_gsp_group_intervals(self):
+        # Everyone in a GSP group has to be a distributor we know about
+        data = load()
+        for gsp_id, (_, groups) in data["gsp_group_intervals"].items():
+            for participant_id in set().union(*groups):
+                with self.subTest(gsp=gsp_id, participant_id=participant_id):
+                    self.assertIn(participant_id, data["participant_ids"])
+                    self.assertIn(
+                        gsp_id,
+                        {gsp for gsp, _ in GSP_IDS[participant_id]},
+                    )
+
+    def test_intervals(self):
+        index = GSPGroupIndex.from_intervals(load()["intervals"])
+        self.assertEqual(
+            json.loads(json.dumps(index.intervals)),
+            json.loads(json.dumps(GSPGroupIndex(GSP_IDS).intervals)),
+        )
+
+    def test_mtcs(self):
+        data = json.loads(json.dumps(build({}, {}, EXTRACT)))
+        self.assertEqual(get_mtcs(data), EXTRACT)
+        self.assertEqual(
+            data["mtcs"]["845"], [["2000-04-01", None, "Half hourly", 0, "HH"]]
+        )
+
+    def test_llfcs(self):
+        data = json.loads(json.dumps(build({}, {}, llfcs=LLFC_EXTRACT)))
+        self.assertEqual(get_llfcs(data), LLFC_EXTRACT)
+        self.assertEqual(
+            data["llfcs"]["24"], {"001": [["2000-01-01", None, "Unmetered"]]}
+        )
+
+    def test_save(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "reference.json"
+            save(load(), path)
+            self.assertEqual(load(path), load())
+            self.assertEqual(len(path.read_text().splitlines()), 1)
+
+    def test_bad_version(self):
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "reference.json"
+            path.write_text(json.dumps({"version": VERSION + 1}))
+            with self.assertRaises(ValueError):
+                load(path)
@@ -0,0 +1,102 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from mpan.exceptions import InvalidMPANError
+from mpan.mpan import MPAN
+from mpan.scan import ScanResult, scan
+
+from .common import INVALID, UNPARSEABLE, VALID
+
+
+class ScanTestCase(TestCase):
+    LINES = (
+        VALID
+        + INVALID
+        + UNPARSEABLE
+        + (
+            "",
+            "2499999999991\r",
+            "24٩٩٩٩٩٩٩٩٩٩1",
+            "24999999999é1",
+            VALID[0] * 2,
+            "2499999999991",
+        )
+    )
+
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "mpans.txt"
+
+    def write(self, content: str) -> Path:
+        self.path.write_bytes(content.encode("utf-8"))
+        return self.path
+
+    def naive(self, lines):
+        """
+        What you'd get by looping over the lines yourself.
+        """
+
+        invalid, offsets, unparseable, distributors = [], [], [], {}
+
+        offset = 0
+        for number, line in enumerate(lines, 1):
+            try:
+                mpan = MPAN(line.rstrip("\r"))
+                valid = mpan.is_valid
+            except InvalidMPANError:
+                unparseable.append(number)
+                valid = False
+
+            if valid:
+                identifier = mpan.distributor.identifier
+                distributors[identifier] = distributors.get(identifier, 0) + 1
+            else:
+                invalid.append(number)
+                offsets.append(offset)
+
+            offset += len(line.encode("utf-8")) + 1
+
+        return (
+            invalid,
+            offsets,
+            unparseable,
+            dict(sorted(distributors.items())),
+        )
+
+    def assertMatchesNaive(self, result: ScanResult, lines):
+        invalid, offsets, unparseable, distributors = self.naive(lines)
+        self.assertEqual(result.lines, len(lines))
+        self.assertEqual(result.invalid_lines.tolist(), invalid)
+        self.assertEqual(result.invalid_offsets.tolist(), offsets)
+        self.assertEqual(result.unparseable_lines.tolist(), unparseable)
+        self.assertEqual(result.distributors, distributors)
+        self.assertEqual(result.valid, len(lines) - len(invalid))
+
+    def test_scan(self):
+        path = self.write("\n".join(self.LINES) + "\n")
+        self.assertMatchesNaive(scan(path), self.LINES)
+
+    def test_no_trailing_newline(self):
+        path = self.write("\n".join(self.LINES))
+        self.assertMatchesNaive(scan(str(path)), self.LINES)
+
+    def test_crlf(self):
+        path = self.write("\r\n".join(VALID) + "\r\n")
+        self.assertMatchesNaive(scan(path), VALID)
+
+    def test_small_windows(self):
+        path = self.write("\n".join(self.LINES) + "\n")
+        for window in (1, 5, 22, 100):
+            with self.subTest(window=window):
+                self.assertMatchesNaive(scan(path, window=window), self.LINES)
+
+    def test_empty(self):
+        result = scan(self.write(""))
+        self.assertEqual(result.lines, 0)
+        self.assertEqual(result.invalid_lines.tolist(), [])
+        self.assertEqual(result.distributors, {})
+
+    def test_blank_line(self):
+        self.assertMatchesNaive(scan(self.write("\n")), [""])